@@ -5,12 +5,20 @@
 from __future__ import annotations
 
 import logging
-from contextlib import closing
+import time
+from collections import Counter
+from contextlib import suppress
 from datetime import timedelta
 from email.message import MIMEPart
-from smtplib import SMTP, SMTPConnectError
+from smtplib import (
+    SMTP,
+    SMTPConnectError,
+    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPServerDisconnected,
+)
 from types import MethodType
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, TypedDict, cast
 
 from celery.schedules import crontab
 from django.conf import settings
@@ -38,6 +46,8 @@ LOGGER = logging.getLogger("weblate.smtp")
 
 # The batch size needs to be below exim's default connection_max_messages = 500.
 EMAIL_BATCH_SIZE = 200
+# Persistent SMTP connections are recycled before reaching that limit as well.
+EMAIL_CONNECTION_MAX_MESSAGES = 400
 
 
 class OutgoingEmail(TypedDict):
@@ -239,6 +249,103 @@ def queue_mails(mails: list[OutgoingEmail]) -> None:
         send_mails.delay(mails[offset : offset + EMAIL_BATCH_SIZE])
 
 
+class PersistentConnection:
+    """
+    SMTP connection kept open across send_mails batches.
+
+    The connection is shared by all batches processed by a worker process and
+    is recycled when the SMTP configuration changes, when the server drops it,
+    or before it reaches EMAIL_CONNECTION_MAX_MESSAGES.
+    """
+
+    def __init__(self) -> None:
+        self.connection: DjangoSMTPEmailBackend | None = None
+        self.key: tuple[str | int | bool | None, ...] | None = None
+        self.sent = 0
+
+    @staticmethod
+    def get_key() -> tuple[str | int | bool | None, ...]:
+        """Return SMTP settings, the connection is recycled when these change."""
+        return (
+            settings.EMAIL_HOST,
+            settings.EMAIL_PORT,
+            settings.EMAIL_HOST_USER,
+            settings.EMAIL_HOST_PASSWORD,
+            settings.EMAIL_USE_TLS,
+            settings.EMAIL_USE_SSL,
+            settings.EMAIL_SSL_CERTFILE,
+            settings.EMAIL_SSL_KEYFILE,
+        )
+
+    def is_alive(self, count: int) -> bool:
+        if self.connection is None or self.connection.connection is None:
+            return False
+        if self.key != self.get_key():
+            return False
+        if self.sent + count > EMAIL_CONNECTION_MAX_MESSAGES:
+            return False
+        try:
+            return self.connection.connection.noop()[0] == 250
+        except (SMTPException, OSError):
+            return False
+
+    def get(self, count: int) -> BaseEmailBackend:
+        """Return an open connection for delivering count messages."""
+        if self.is_alive(count):
+            LOGGER.debug("reusing SMTP connection (%d messages sent)", self.sent)
+            return cast("DjangoSMTPEmailBackend", self.connection)
+        self.close()
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception:
+            # Do not leak the socket when login or TLS negotiation fails
+            with suppress(SMTPException, OSError):
+                connection.close()
+            raise
+        connection = monkey_patch_smtp_logging(connection)
+        if isinstance(connection, DjangoSMTPEmailBackend):
+            self.connection = connection
+            self.key = self.get_key()
+        return connection
+
+    def release(self, connection: BaseEmailBackend, sent: int) -> None:
+        """Account sent messages, non-persistent backends are closed."""
+        if connection is self.connection:
+            self.sent += sent
+        else:
+            connection.close()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except (SMTPException, OSError):
+                LOGGER.debug("could not close SMTP connection", exc_info=True)
+        self.connection = None
+        self.key = None
+        self.sent = 0
+
+
+PERSISTENT_CONNECTION = PersistentConnection()
+
+
+def get_mail_images() -> list[MIMEPart]:
+    images = []
+    for name in ("email-logo.png", "email-logo-footer.png"):
+        image = MIMEPart()
+        image.set_content(
+            load_icon(name, auto_prefix=False),
+            maintype="image",
+            subtype="png",
+            disposition="inline",
+            filename=name,
+            cid=f"<{name}@cid.weblate.org>",
+        )
+        images.append(image)
+    return images
+
+
 @app.task(
     trail=False,
     autoretry_for=(SMTPConnectError, OSError),
@@ -246,51 +353,78 @@ def queue_mails(mails: list[OutgoingEmail]) -> None:
     retry_backoff_max=3600,
 )
 def send_mails(mails: list[OutgoingEmail]) -> None:
-    """Send multiple mails in single connection."""
-    images = []
+    """
+    Send multiple mails in single connection.
+
+    The SMTP connection is kept open for following batches and the plain text
+    alternative is rendered only once for identical bodies.
+    """
+    started = time.monotonic()
     with start_span(op="email.images"):
-        for name in ("email-logo.png", "email-logo-footer.png"):
-            image = MIMEPart()
-            image.set_content(
-                load_icon(name, auto_prefix=False),
-                maintype="image",
-                subtype="png",
-                disposition="inline",
-                filename=name,
-                cid=f"<{name}@cid.weblate.org>",
-            )
-            images.append(image)
+        images = get_mail_images()
 
     with start_span(op="email.connect"):
-        connection = get_connection()
         try:
-            connection.open()
+            connection = PERSISTENT_CONNECTION.get(len(mails))
         except Exception:
             LOGGER.exception("Could not initialize e-mail backend")
             report_error("Could not send notifications")
-            connection.close()
+            PERSISTENT_CONNECTION.close()
             return
-        connection = monkey_patch_smtp_logging(connection)
 
     html2text = HTML2Text()
+    texts: dict[str, str] = {}
+    stats: Counter[str] = Counter()
 
-    with closing(connection):
+    try:
         for mail in mails:
-            with start_span(op="email.text"):
-                text = html2text.handle(mail["body"])
-            email = EmailMultiAlternatives(
-                settings.EMAIL_SUBJECT_PREFIX + mail["subject"],
-                text,
-                to=[mail["address"]],
-                headers=mail["headers"],
-                connection=connection,
-            )
-            for image in images:
-                email.attach(image)
-            email.attach_alternative(mail["body"], "text/html")
-            with start_span(op="email.send"):
-                LOGGER.debug("sending e-mail to %s", mail["address"])
-                email.send()
+            send_mail(connection, mail, images, html2text, texts, stats)
+    except SMTPServerDisconnected:
+        PERSISTENT_CONNECTION.close()
+        raise
+    finally:
+        PERSISTENT_CONNECTION.release(connection, stats["sent"])
+        LOGGER.info(
+            "sent %d e-mails (%d unique bodies, %d failed) in %.2f seconds",
+            stats["sent"],
+            len(texts),
+            stats["failed"],
+            time.monotonic() - started,
+        )
+
+
+def send_mail(
+    connection: BaseEmailBackend,
+    mail: OutgoingEmail,
+    images: list[MIMEPart],
+    html2text: HTML2Text,
+    texts: dict[str, str],
+    stats: Counter[str],
+) -> None:
+    body = mail["body"]
+    if body not in texts:
+        with start_span(op="email.text"):
+            texts[body] = html2text.handle(body)
+    email = EmailMultiAlternatives(
+        settings.EMAIL_SUBJECT_PREFIX + mail["subject"],
+        texts[body],
+        to=[mail["address"]],
+        headers=mail["headers"],
+        connection=connection,
+    )
+    for image in images:
+        email.attach(image)
+    email.attach_alternative(body, "text/html")
+    with start_span(op="email.send"):
+        LOGGER.debug("sending e-mail to %s", mail["address"])
+        try:
+            email.send()
+        except SMTPRecipientsRefused:
+            # Retrying the batch would not help here
+            LOGGER.exception("recipient refused: %s", mail["address"])
+            stats["failed"] += 1
+        else:
+            stats["sent"] += 1
 
 
 @app.on_after_finalize.connect
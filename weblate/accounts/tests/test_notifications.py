@@ -8,8 +8,10 @@ from __future__ import annotations
 
 from copy import deepcopy
 from datetime import timedelta
+from smtplib import SMTPException
 from types import SimpleNamespace
 from typing import Protocol
+from unittest.mock import patch
 
 from django.conf import settings
 from django.core import mail
@@ -32,6 +34,8 @@ from weblate.accounts.notifications import (
     get_notification_emails,
 )
 from weblate.accounts.tasks import (
+    EMAIL_CONNECTION_MAX_MESSAGES,
+    PersistentConnection,
     notify_changes,
     notify_daily,
     notify_monthly,
@@ -1640,3 +1644,66 @@ class SendMailsTest(SimpleTestCase):
     def test_error_handling(self) -> None:
         send_mails([{}])
         self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    def test_shared_body(self) -> None:
+        send_mails(
+            [
+                {
+                    "address": f"user{i}@example.com",
+                    "subject": "Subject",
+                    "body": "<p>Shared body</p>",
+                    "headers": {},
+                }
+                for i in range(3)
+            ]
+        )
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [[f"user{i}@example.com"] for i in range(3)],
+        )
+        self.assertEqual({message.body for message in mail.outbox}, {"Shared body\n"})
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend")
+class PersistentConnectionTest(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = patch("django.core.mail.backends.smtp.smtplib.SMTP")
+        self.smtp = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.smtp.return_value.noop.return_value = (250, b"OK")
+        self.persistent = PersistentConnection()
+        self.addCleanup(self.persistent.close)
+
+    def test_reuse(self) -> None:
+        connection = self.persistent.get(10)
+        self.persistent.release(connection, 10)
+        self.assertIs(self.persistent.get(10), connection)
+        self.smtp.assert_called_once()
+
+        # Changed credentials need a new connection
+        with override_settings(EMAIL_HOST_PASSWORD="secret"):
+            self.assertIsNot(self.persistent.get(10), connection)
+        self.assertEqual(self.smtp.call_count, 2)
+
+    def test_recycle(self) -> None:
+        connection = self.persistent.get(10)
+        self.persistent.release(connection, EMAIL_CONNECTION_MAX_MESSAGES - 10)
+        self.assertIs(self.persistent.get(10), connection)
+        self.persistent.release(connection, 10)
+
+        # The connection is recycled before exceeding the limit
+        self.assertIsNot(self.persistent.get(1), connection)
+        self.assertEqual(self.smtp.call_count, 2)
+        self.smtp.return_value.quit.assert_called_once()
+        self.assertEqual(self.persistent.sent, 0)
+
+    @override_settings(EMAIL_USE_TLS=True)
+    def test_open_failure(self) -> None:
+        self.smtp.return_value.starttls.side_effect = SMTPException("TLS failed")
+        with self.assertRaises(SMTPException):
+            self.persistent.get(10)
+        self.smtp.return_value.quit.assert_called_once()
+        self.assertIsNone(self.persistent.connection)
@@ -169,6 +169,8 @@ class BaseAddon[StoredConfigurationT, ConfigurationT](DocVersionsMixin):
     alert: str = ""
     trigger_update = False
     stay_on_create = False
+    # Receive changes in batches using change_events instead of change_event
+    change_batches = False
     user_name = ""
     user_verbose = ""
 
@@ -808,6 +810,13 @@ class BaseAddon[StoredConfigurationT, ConfigurationT](DocVersionsMixin):
         # To be implemented in a subclass
         return None
 
+    def change_events(
+        self, changes: list[Change], activity_log_id: int | None = None
+    ) -> AddonEventResult:
+        """Event handler for a batch of change events."""
+        # To be implemented in a subclass
+        return None
+
     def execute_process(
         self, component: Component, cmd: list[str], env: dict[str, str] | None = None
     ) -> None:
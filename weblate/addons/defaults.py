@@ -48,3 +48,7 @@ DEFAULT_ADDON_ACTIVITY_LOG_EXPIRY = 180
 DEFAULT_FEDORA_MESSAGING_PUBLISH_TIMEOUT = 5
 DEFAULT_FEDORA_MESSAGING_CONNECTION_ATTEMPTS = 1
 DEFAULT_FEDORA_MESSAGING_RETRY_DELAY = 2
+
+DEFAULT_WEBHOOK_DELIVERY_CONCURRENCY = 4
+DEFAULT_WEBHOOK_DELIVERY_RETRIES = 2
+DEFAULT_WEBHOOK_BATCH_SIZE = 100
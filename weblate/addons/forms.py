@@ -1785,9 +1785,22 @@ class WebhooksAddonForm(BaseWebhooksAddonForm):
         ),
     )
 
+    batch = forms.BooleanField(
+        label=gettext_lazy("Send events in batches"),
+        required=False,
+        help_text=gettext_lazy(
+            "Sends an array of several events in a single request instead of a request for every event."
+        ),
+    )
+
+    public_configuration_fields = BaseWebhooksAddonForm.public_configuration_fields | {
+        "batch"
+    }
+
     field_order = [  # ruff: ignore[mutable-class-default]
         "webhook_url",
         "secret",
+        "batch",
         "event_filter",
         "events",
     ]
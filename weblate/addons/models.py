@@ -6,14 +6,16 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
 from appconf import AppConf
+from django.core.cache import cache
 from django.db import Error as DjangoDatabaseError
 from django.db import models, transaction
 from django.db.models import Q
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
@@ -50,6 +52,9 @@ from .defaults import (
     DEFAULT_ADDON_ACTIVITY_LOG_EXPIRY,
     DEFAULT_LOCALIZE_CDN_PATH,
     DEFAULT_LOCALIZE_CDN_URL,
+    DEFAULT_WEBHOOK_BATCH_SIZE,
+    DEFAULT_WEBHOOK_DELIVERY_CONCURRENCY,
+    DEFAULT_WEBHOOK_DELIVERY_RETRIES,
     DEFAULT_WEBLATE_ADDONS,
 )
 from .events import (
@@ -90,6 +95,61 @@ class AddonCache:
         return self.events.get(event, [])
 
 
+CHANGE_ADDON_INDEX_CACHE_KEY = "addons:change-index"
+CHANGE_ADDON_INDEX_VERSION_CACHE_KEY = "addons:change-index:version"
+CHANGE_ADDON_INDEX_TIMEOUT = 86400
+
+
+@dataclass
+class ChangeAddonIndex:
+    """IDs of add-ons subscribed to change events keyed by their scope."""
+
+    sitewide: list[int] = field(default_factory=list)
+    projects: dict[int, list[int]] = field(default_factory=dict)
+    categories: dict[int, list[int]] = field(default_factory=dict)
+    components: dict[int, list[int]] = field(default_factory=dict)
+
+    def add(self, addon: Addon) -> None:
+        if addon.component_id is not None:
+            self.components.setdefault(addon.component_id, []).append(addon.pk)
+        elif addon.category_id is not None:
+            self.categories.setdefault(addon.category_id, []).append(addon.pk)
+        elif addon.project_id is not None:
+            self.projects.setdefault(addon.project_id, []).append(addon.pk)
+        else:
+            self.sitewide.append(addon.pk)
+
+    def get_addon_ids(
+        self,
+        component_id: int | None,
+        project_id: int | None,
+        category_ids: Iterable[int],
+    ) -> set[int]:
+        result = set(self.sitewide)
+        if component_id is not None:
+            result.update(self.components.get(component_id, ()))
+        if project_id is not None:
+            result.update(self.projects.get(project_id, ()))
+        for category_id in category_ids:
+            result.update(self.categories.get(category_id, ()))
+        return result
+
+
+def bump_change_addon_index_version() -> None:
+    cache.set(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
+def invalidate_change_addon_index() -> None:
+    """
+    Invalidate the cached change add-on index.
+
+    The version is bumped once more after commit, so that an index built by a
+    concurrent task before the commit is not used.
+    """
+    bump_change_addon_index_version()
+    transaction.on_commit(bump_change_addon_index_version)
+
+
 class AddonQuerySet(models.QuerySet["Addon", "Addon"]):
     def filter_access(self, user: User):
         """Return add-ons the user is allowed to manage."""
@@ -308,6 +368,7 @@ class Addon(models.Model):
 
         # Clear add-on cache after save so the DB state is consistent
         if update_fields != ["state"]:
+            invalidate_change_addon_index()
             if original_component:
                 original_component.drop_addons_cache()
             self._drop_addons_cache()
@@ -509,6 +570,60 @@ class Event(models.Model):
         return f"{self.addon}: {self.get_event_display()}"
 
 
+class ChangeAddonDispatcher:
+    """
+    Looks up add-ons subscribed to change events.
+
+    The index of subscribed add-ons is kept in the cache, so only add-ons
+    matching the processed changes are loaded from the database.
+    """
+
+    def __init__(self) -> None:
+        self.addons: dict[int, Addon] = {}
+        self.index = self.load_index()
+
+    def load_index(self) -> ChangeAddonIndex:
+        cached = cache.get_many(
+            [CHANGE_ADDON_INDEX_VERSION_CACHE_KEY, CHANGE_ADDON_INDEX_CACHE_KEY]
+        )
+        version = cached.get(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY)
+        if version is None:
+            # The version was evicted, index stored before is not valid
+            cache.add(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY, time.time_ns(), None)
+            version = cache.get(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY)
+        elif (
+            CHANGE_ADDON_INDEX_CACHE_KEY in cached
+            and cached[CHANGE_ADDON_INDEX_CACHE_KEY][0] == version
+        ):
+            return cached[CHANGE_ADDON_INDEX_CACHE_KEY][1]
+        index = ChangeAddonIndex()
+        for addon in Addon.objects.filter(event__event=AddonEvent.EVENT_CHANGE):
+            self.addons[addon.pk] = addon
+            index.add(addon)
+        if version is not None:
+            cache.set(
+                CHANGE_ADDON_INDEX_CACHE_KEY,
+                (version, index),
+                CHANGE_ADDON_INDEX_TIMEOUT,
+            )
+        return index
+
+    def load_addons(self, addon_ids: set[int]) -> None:
+        missing = addon_ids - self.addons.keys()
+        if missing:
+            self.addons.update(
+                (addon.pk, addon) for addon in Addon.objects.filter(pk__in=missing)
+            )
+
+    def get_addons(self, addon_ids: set[int]) -> list[Addon]:
+        # Add-ons removed since the index was built are skipped
+        return [
+            self.addons[addon_id]
+            for addon_id in sorted(addon_ids)
+            if addon_id in self.addons
+        ]
+
+
 class AddonsConf(AppConf):
     WEBLATE_ADDONS = DEFAULT_WEBLATE_ADDONS
 
@@ -518,6 +633,15 @@ class AddonsConf(AppConf):
     # How long to keep add-on activity log entries
     ADDON_ACTIVITY_LOG_EXPIRY = DEFAULT_ADDON_ACTIVITY_LOG_EXPIRY
 
+    # Webhook requests sent in parallel by a single add-on
+    WEBHOOK_DELIVERY_CONCURRENCY = DEFAULT_WEBHOOK_DELIVERY_CONCURRENCY
+
+    # Number of retries of failed webhook requests
+    WEBHOOK_DELIVERY_RETRIES = DEFAULT_WEBHOOK_DELIVERY_RETRIES
+
+    # Maximal number of events in a batched webhook request
+    WEBHOOK_BATCH_SIZE = DEFAULT_WEBHOOK_BATCH_SIZE
+
     class Meta:
         prefix = ""
 
@@ -955,6 +1079,12 @@ def unit_post_save_handler(sender, instance: Unit, created, **kwargs) -> None:
     )
 
 
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def event_changed_handler(sender, instance: Event, **kwargs) -> None:
+    invalidate_change_addon_index()
+
+
 @receiver(post_save, sender=Change)
 @disable_for_loaddata
 def change_post_save_handler(sender, instance: Change, created, **kwargs) -> None:
@@ -28,6 +28,7 @@ from weblate.addons.events import (
 from weblate.addons.models import (
     Addon,
     AddonActivityLog,
+    ChangeAddonDispatcher,
     handle_addon_event,
     handle_daily_addon_event,
     handle_scoped_addon_event,
@@ -418,10 +419,11 @@ def addon_change(change_ids: list[int], **kwargs) -> None:
     """
     Process add-on change events for a list of changes.
 
-    This task retrieves add-ons that are subscribed to change events and
-    applies the change event to each relevant add-on.
+    Changes are grouped by their scope, the add-ons subscribed to change
+    events are looked up in the cached index once per group and only the
+    matching add-ons are loaded.
     """
-    addons = list(Addon.objects.filter(event__event=AddonEvent.EVENT_CHANGE))
+    dispatcher = ChangeAddonDispatcher()
     category_ids_cache: dict[int | None, set[int]] = {None: set()}
 
     def get_category_ids(change: Change) -> set[int]:
@@ -434,32 +436,58 @@ def addon_change(change_ids: list[int], **kwargs) -> None:
             category_ids_cache[change.category_id] = category_ids
         return category_ids_cache[change.category_id]
 
+    groups: dict[tuple[int | None, int | None, int | None], list[Change]] = {}
     for change in Change.objects.filter(pk__in=change_ids).prefetch_for_render():
-        change.fill_in_prefetched()
-        # Filter addons for this change
-        change_addons = [
-            addon
-            for addon in addons
-            if (addon.component_id is None or addon.component_id == change.component_id)
-            and (addon.project_id is None or addon.project_id == change.project_id)
-            and (
-                addon.category_id is None
-                or (
-                    # to ensure that addons configured on ancestor categories
-                    # are also considered
-                    change.component_id is not None
-                    and addon.category_id in get_category_ids(change)
+        groups.setdefault(
+            (change.component_id, change.project_id, change.category_id), []
+        ).append(change)
+
+    group_addon_ids: list[tuple[list[Change], set[int]]] = []
+    for (component_id, project_id, _category_id), changes in groups.items():
+        addon_ids = dispatcher.index.get_addon_ids(
+            component_id,
+            project_id,
+            # to ensure that addons configured on ancestor categories
+            # are also considered
+            get_category_ids(changes[0])
+            if component_id is not None and dispatcher.index.categories
+            else (),
+        )
+        if addon_ids:
+            group_addon_ids.append((changes, addon_ids))
+
+    dispatcher.load_addons(set().union(*(ids for _changes, ids in group_addon_ids)))
+
+    for changes, addon_ids in group_addon_ids:
+        addons = dispatcher.get_addons(addon_ids)
+        batched_changes: dict[Addon, list[Change]] = {}
+        for change in changes:
+            change.fill_in_prefetched()
+            change_addons = []
+            for addon in addons:
+                if not addon.addon.check_change_action(change):
+                    continue
+                if addon.addon.change_batches:
+                    batched_changes.setdefault(addon, []).append(change)
+                else:
+                    change_addons.append(addon)
+            if change_addons:
+                handle_addon_event(
+                    AddonEvent.EVENT_CHANGE,
+                    "change_event",
+                    (change,),
+                    addon_queryset=change_addons,
+                    project=change.project,
+                    component=change.component,
+                    translation=change.translation,
                 )
-            )
-            and addon.addon.check_change_action(change)
-        ]
-        if change_addons:
+        # Add-ons processing changes in batches receive all changes of the group
+        for addon, addon_changes in batched_changes.items():
             handle_addon_event(
                 AddonEvent.EVENT_CHANGE,
-                "change_event",
-                (change,),
-                addon_queryset=change_addons,
-                project=change.project,
-                component=change.component,
-                translation=change.translation,
+                "change_events",
+                (addon_changes,),
+                addon_queryset=[addon],
+                project=changes[0].project,
+                component=changes[0].component,
             )
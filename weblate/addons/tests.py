@@ -30,6 +30,7 @@ import httpx2
 import jsonschema.exceptions
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.management import call_command
 from django.core.management.base import CommandError
@@ -150,8 +151,11 @@ from .gettext import (
 )
 from .git import GitSquashAddon
 from .models import (
+    CHANGE_ADDON_INDEX_CACHE_KEY,
+    CHANGE_ADDON_INDEX_VERSION_CACHE_KEY,
     Addon,
     AddonActivityLog,
+    ChangeAddonIndex,
     Event,
     handle_addon_event,
     handle_daily_addon_event,
@@ -481,6 +485,44 @@ class AddonBaseTest(TestAddonMixin, ComponentTestCase):
         self.assertEqual([], activity_log_select_queries)
         self.assertTrue(AddonActivityLog.objects.filter(addon=addon).exists())
 
+    def test_addon_change_uses_cached_index(self) -> None:
+        addon = self.create_change_addon(component=self.component)
+        change = self.create_addon_change()
+        addon_change.run([change.pk])
+        AddonActivityLog.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            addon_change.run([change.pk])
+
+        event_queries = [
+            query["sql"] for query in queries if '"addons_event"' in query["sql"]
+        ]
+        self.assertEqual([], event_queries)
+        self.assertTrue(AddonActivityLog.objects.filter(addon=addon).exists())
+
+        # Removing the add-on invalidates the index
+        addon.delete()
+        project_addon = self.create_change_addon(project=self.project)
+        AddonActivityLog.objects.all().delete()
+        addon_change.run([change.pk])
+        self.assertEqual(
+            list(AddonActivityLog.objects.values_list("addon_id", flat=True)),
+            [project_addon.pk],
+        )
+
+    def test_addon_change_index_missing_version(self) -> None:
+        addon = self.create_change_addon(component=self.component)
+        change = self.create_addon_change()
+
+        # Index stored without the version is never used
+        cache.delete(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY)
+        cache.set(CHANGE_ADDON_INDEX_CACHE_KEY, (None, ChangeAddonIndex()))
+        addon_change.run([change.pk])
+        self.assertTrue(AddonActivityLog.objects.filter(addon=addon).exists())
+        version = cache.get(CHANGE_ADDON_INDEX_VERSION_CACHE_KEY)
+        self.assertIsNotNone(version)
+        self.assertEqual(cache.get(CHANGE_ADDON_INDEX_CACHE_KEY)[0], version)
+
     def test_manual_returns_component_result(self) -> None:
         addon = ManualResultAddon.create(component=self.component, run=False)
 
@@ -9810,6 +9852,7 @@ class BaseWebhookTests(_WebhookTestsTypingBase):
         "weblate.utils.outbound.socket.getaddrinfo",
         return_value=[(0, 0, 0, "", ("93.184.216.34", 443))],
     )
+    @override_settings(WEBHOOK_DELIVERY_RETRIES=0)
     def test_connection_error(self, _mocked_getaddrinfo) -> None:
         """Test connection error when during message delivery."""
         request = httpx2.Request("POST", self.WEBHOOK_URL)
@@ -9917,6 +9960,100 @@ class WebhooksAddonTest(BaseWebhookTests, ViewTestCase):
             )
             wh_utils.verify(body, new_headers)
 
+    def create_new_changes(self) -> list[int]:
+        with patch("weblate.addons.tasks.addon_change.delay_on_commit"):
+            self.edit_unit("Hello, world!\n", "Nazdar svete!\n")
+            self.edit_unit("Thank you for using Weblate.", "Diky za pouzivani Weblate.")
+        return list(
+            Change.objects.filter(action=ActionEvents.NEW)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    @http_mock.activate
+    def test_batch_payload(self) -> None:
+        self.addon_configuration["secret"] = "secret-string"
+        self.addon_configuration["batch"] = True
+        addon = self.WEBHOOK_CLS.create(configuration=self.addon_configuration)
+        http_mock.register("POST", self.WEBHOOK_URL, status_code=200)
+        change_ids = self.create_new_changes()
+
+        addon_change.run(change_ids)
+
+        self.assertEqual(self.count_requests(), 1)
+        body, headers = get_webhook_request_data(http_mock.calls[0].request)
+        Webhook("secret-string").verify(body, headers)
+        self.assertEqual([item["change_id"] for item in json.loads(body)], change_ids)
+        activity = AddonActivityLog.objects.get(addon=addon.instance)
+        self.assertEqual(activity.status, AddonActivityLog.Status.SUCCESS)
+        self.assertEqual(activity.details["result"]["metrics"]["events"], 2)
+        self.assertEqual(activity.details["result"]["metrics"]["requests"], 1)
+
+    @http_mock.activate
+    def test_parallel_delivery(self) -> None:
+        addon = self.WEBHOOK_CLS.create(configuration=self.addon_configuration)
+        http_mock.register("POST", self.WEBHOOK_URL, status_code=200)
+        change_ids = self.create_new_changes()
+
+        addon_change.run(change_ids)
+
+        self.assertEqual(self.count_requests(), 2)
+        self.assertEqual(
+            sorted(
+                json.loads(call.request.content)["change_id"]
+                for call in http_mock.calls
+            ),
+            change_ids,
+        )
+        activity = AddonActivityLog.objects.get(addon=addon.instance)
+        self.assertEqual(len(activity.details["result"]["deliveries"]), 2)
+
+    @http_mock.activate
+    @override_settings(WEBHOOK_DELIVERY_RETRIES=0)
+    def test_partial_delivery_failure(self) -> None:
+        addon = self.WEBHOOK_CLS.create(configuration=self.addon_configuration)
+        change_ids = self.create_new_changes()
+
+        def respond(request: httpx2.Request) -> httpx2.Response:
+            if json.loads(request.content)["change_id"] == change_ids[1]:
+                msg = "Connection refused"
+                raise httpx2.ConnectError(msg, request=request)
+            return httpx2.Response(200)
+
+        http_mock.register_callback("POST", self.WEBHOOK_URL, respond)
+
+        addon_change.run(change_ids)
+
+        activity = AddonActivityLog.objects.get(addon=addon.instance)
+        self.assertEqual(activity.status, AddonActivityLog.Status.ERROR)
+        result = activity.details["result"]
+        self.assertIn("Unable to deliver webhook", result["error"])
+        # Successful deliveries are logged as well
+        self.assertEqual(result["metrics"]["events"], 2)
+        self.assertEqual(
+            sorted("error" in delivery for delivery in result["deliveries"]),
+            [False, True],
+        )
+
+    @http_mock.activate
+    @override_settings(WEBHOOK_DELIVERY_RETRIES=2)
+    def test_retry_delivery(self) -> None:
+        responses = iter((503, 200))
+        http_mock.register_callback(
+            "POST",
+            self.WEBHOOK_URL,
+            lambda _request: httpx2.Response(next(responses)),
+        )
+
+        with patch("weblate.addons.webhooks.time.sleep") as mocked_sleep:
+            self.do_translation_added_test(expected_calls=2)
+
+        mocked_sleep.assert_called_once()
+        activity = AddonActivityLog.objects.get(addon__name=self.WEBHOOK_CLS.name)
+        delivery = activity.details["result"]["deliveries"][0]
+        self.assertEqual(delivery["attempts"], 2)
+        self.assertEqual(delivery["response"]["status_code"], 200)
+
     def test_form(self) -> None:
         """Test WebhooksAddonForm."""
         self.user.is_superuser = True
@@ -10173,9 +10310,10 @@ class WebhooksAddonTest(BaseWebhookTests, ViewTestCase):
         ).latest("created")
         self.assertEqual(activity_log.status, AddonActivityLog.Status.ERROR)
         self.assertIn("result", activity_log.details)
-        self.assertNotIsInstance(activity_log.details["result"], dict)
-        self.assertIsInstance(activity_log.details["result"], str)
-        self.assertTrue(activity_log.details["result"])
+        result = activity_log.details["result"]
+        self.assertIsInstance(result["error"], str)
+        self.assertTrue(result["error"])
+        self.assertEqual(result["deliveries"][0]["error"], result["error"])
 
 
 class SlackWebhooksAddonsTest(BaseWebhookTests, ViewTestCase):
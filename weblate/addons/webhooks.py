@@ -8,8 +8,14 @@ import base64
 import hashlib
 import hmac
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
 from math import floor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
 
 import httpx2
 import jsonschema.exceptions
@@ -22,10 +28,15 @@ from drf_spectacular.utils import OpenApiResponse, OpenApiWebhook, extend_schema
 from weblate_schemas import load_schema, validate_schema
 
 from weblate.addons.base import ChangeBaseAddon
+from weblate.addons.events import AddonEventOutcome
 from weblate.addons.forms import BaseWebhooksAddonForm, WebhooksAddonForm
 from weblate.trans.util import split_plural
 from weblate.utils.const import WEBHOOKS_SECRET_PREFIX
-from weblate.utils.requests import fetch_validated_url
+from weblate.utils.requests import (
+    create_validated_http_client,
+    fetch_client_url,
+    fetch_validated_url,
+)
 from weblate.utils.site import get_site_url
 from weblate.utils.views import key_name
 
@@ -33,11 +44,17 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
     from datetime import datetime
 
+    from weblate.addons.events import AddonEventResult
     from weblate.addons.models import AddonActivityLog
     from weblate.trans.models import Change
 
     PayloadType = Mapping[str, int | str | list["PayloadType"] | "PayloadType"]
 
+# Responses indicating a temporary failure
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 10
+
 
 def standard_webhooks_sign(
     secret: str, msg_id: str, timestamp: datetime, data: str
@@ -55,9 +72,129 @@ class MessageNotDeliveredError(Exception):
     """Exception raised when a message could not be delivered."""
 
 
+class MessageDeliveryFailedError(MessageNotDeliveredError):
+    """Exception raised when a message delivery failed and can be retried."""
+
+
+@dataclass
+class WebhookMessage:
+    headers: dict[str, str]
+    payload: PayloadType | list[PayloadType]
+    response: httpx2.Response | None = None
+    error: str = ""
+    attempts: int = 0
+    elapsed: float = 0.0
+
+    def get_log(self) -> dict:
+        result: dict = {
+            "request": {
+                "headers": self.headers,
+                "payload": self.payload,
+            },
+        }
+        if self.response is not None:
+            result["response"] = {
+                "status_code": self.response.status_code,
+                "content": self.response.text,
+                "headers": dict(self.response.headers),
+            }
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+@dataclass
+class WebhookDelivery:
+    """
+    Delivers webhook messages of a single add-on.
+
+    Every worker thread keeps its own HTTP client, so connections to the
+    target host are reused for all messages sent through the delivery.
+    Temporary failures are retried with a jittered exponential backoff.
+    """
+
+    addon: JSONWebhookBaseAddon
+    clients: list[httpx2.Client] = field(default_factory=list)
+    local: threading.local = field(default_factory=threading.local)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+        self.clients.clear()
+
+    def get_client(self) -> httpx2.Client:
+        client = getattr(self.local, "client", None)
+        if client is None:
+            client = self.local.client = create_validated_http_client(
+                allow_private_targets=not settings.WEBHOOK_RESTRICT_PRIVATE,
+                private_allowlist=settings.WEBHOOK_PRIVATE_ALLOWLIST,
+            )
+            self.clients.append(client)
+        return client
+
+    @staticmethod
+    def get_backoff(attempt: int) -> float:
+        delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt)
+        # ruff: ignore[suspicious-non-cryptographic-random-usage]
+        return random.uniform(delay / 2, delay)
+
+    def send(self, message: WebhookMessage) -> WebhookMessage:
+        """Send a message, raises MessageNotDeliveredError on failure."""
+        started = time.monotonic()
+        retries = settings.WEBHOOK_DELIVERY_RETRIES
+        try:
+            for attempt in range(retries + 1):
+                if attempt:
+                    time.sleep(self.get_backoff(attempt - 1))
+                message.attempts += 1
+                try:
+                    message.response = self.addon.send_message(
+                        None,
+                        message.headers,
+                        message.payload,
+                        client=self.get_client(),
+                    )
+                except MessageDeliveryFailedError:
+                    if attempt == retries:
+                        raise
+                else:
+                    if message.response.status_code not in RETRY_STATUS_CODES:
+                        break
+        finally:
+            message.elapsed = time.monotonic() - started
+        return message
+
+    def send_safe(self, message: WebhookMessage) -> WebhookMessage:
+        if message.error:
+            return message
+        try:
+            self.send(message)
+        except MessageNotDeliveredError as error:
+            message.error = str(error)
+        return message
+
+    def send_many(self, messages: list[WebhookMessage]) -> list[WebhookMessage]:
+        """Send messages in parallel, failures are stored in the messages."""
+        if len(messages) <= 1:
+            return [self.send_safe(message) for message in messages]
+        with ThreadPoolExecutor(
+            max_workers=min(len(messages), settings.WEBHOOK_DELIVERY_CONCURRENCY)
+        ) as executor:
+            return list(executor.map(self.send_safe, messages))
+
+
 class JSONWebhookBaseAddon(ChangeBaseAddon):
     icon = "webhook.svg"
     multiple = True
+    change_batches = True
+    # Whether several events can be sent in a single request
+    supports_batch_payload = False
 
     def build_webhook_payload(self, change: Change) -> PayloadType:
         raise NotImplementedError
@@ -65,6 +202,11 @@ class JSONWebhookBaseAddon(ChangeBaseAddon):
     def build_headers(self, change: Change, payload: PayloadType) -> dict[str, str]:
         return {}
 
+    def build_batch_headers(
+        self, changes: tuple[Change, ...], payload: list[PayloadType]
+    ) -> dict[str, str]:
+        return {}
+
     def render_activity_log(self, activity: AddonActivityLog) -> str:
         return render_to_string(
             "addons/webhook_log.html",
@@ -72,45 +214,115 @@ class JSONWebhookBaseAddon(ChangeBaseAddon):
         )
 
     def send_message(
-        self, change: Change, headers: dict, payload: PayloadType
+        self,
+        change: Change | None,
+        headers: dict,
+        payload: PayloadType | list[PayloadType],
+        *,
+        client: httpx2.Client | None = None,
     ) -> httpx2.Response:
+        kwargs = {
+            "json": payload,
+            "headers": headers,
+            "timeout": 15,
+            "raise_for_status": False,
+        }
         try:
+            if client is not None:
+                return fetch_client_url(
+                    client, "post", self.instance.configuration["webhook_url"], **kwargs
+                )
             return fetch_validated_url(
                 method="post",
                 url=self.instance.configuration["webhook_url"],
-                json=payload,
-                headers=headers,
-                timeout=15,
-                raise_for_status=False,
                 allow_private_targets=not settings.WEBHOOK_RESTRICT_PRIVATE,
                 private_allowlist=settings.WEBHOOK_PRIVATE_ALLOWLIST,
+                **kwargs,
             )
         except ValidationError as error:
             raise MessageNotDeliveredError("; ".join(error.messages)) from error
         except httpx2.TransportError as error:
             msg = "Unable to deliver webhook: could not connect to the remote server."
-            raise MessageNotDeliveredError(msg) from error
+            raise MessageDeliveryFailedError(msg) from error
+
+    def build_message(self, change: Change) -> WebhookMessage:
+        payload = self.build_webhook_payload(change)
+        return WebhookMessage(self.build_headers(change, payload), payload)
+
+    def build_messages(self, changes: list[Change]) -> list[WebhookMessage]:
+        """Build messages, invalid payloads are stored as failed messages."""
+        batch = self.supports_batch_payload and self.instance.configuration.get("batch")
+        result: list[WebhookMessage] = []
+        valid: list[tuple[Change, PayloadType]] = []
+        for change in changes:
+            try:
+                payload = self.build_webhook_payload(change)
+            except MessageNotDeliveredError as error:
+                result.append(
+                    WebhookMessage({}, {}, error=str(error.__cause__ or error))
+                )
+                continue
+            if batch:
+                valid.append((change, payload))
+            else:
+                result.append(
+                    WebhookMessage(self.build_headers(change, payload), payload)
+                )
+        for chunk in batched(valid, settings.WEBHOOK_BATCH_SIZE):
+            batch_changes = tuple(change for change, _payload in chunk)
+            batch_payload = [payload for _change, payload in chunk]
+            result.append(
+                WebhookMessage(
+                    self.build_batch_headers(batch_changes, batch_payload),
+                    batch_payload,
+                )
+            )
+        return result
 
     def change_event(
         self, change: Change, activity_log_id: int | None = None
     ) -> dict | None:
         """Deliver notification message."""
         with override("en"):
-            payload = self.build_webhook_payload(change)
-            headers = self.build_headers(change, payload)
-            response = self.send_message(change, headers, payload)
-
-            return {
-                "request": {
-                    "headers": headers,
-                    "payload": payload,
-                },
-                "response": {
-                    "status_code": response.status_code,
-                    "content": response.text,
-                    "headers": dict(response.headers),
-                },
-            }
+            message = self.build_message(change)
+        with WebhookDelivery(self) as delivery:
+            delivery.send(message)
+        return message.get_log()
+
+    def change_events(
+        self, changes: list[Change], activity_log_id: int | None = None
+    ) -> AddonEventResult:
+        """Deliver notification messages for a batch of changes."""
+        if not changes:
+            return None
+        with override("en"):
+            messages = self.build_messages(changes)
+        started = time.monotonic()
+        with WebhookDelivery(self) as delivery:
+            delivery.send_many(messages)
+        elapsed = time.monotonic() - started
+        result = {
+            "deliveries": [
+                message.get_log()
+                | {"attempts": message.attempts, "elapsed": round(message.elapsed, 3)}
+                for message in messages
+            ],
+            "metrics": {
+                "events": len(changes),
+                "requests": len(messages),
+                "elapsed": round(elapsed, 3),
+                "latency": round(
+                    sum(message.elapsed for message in messages) / len(messages), 3
+                ),
+                "throughput": round(len(changes) / elapsed, 1) if elapsed else None,
+            },
+        }
+        if errors := {message.error for message in messages if message.error}:
+            # Keep details of successful deliveries in the batch
+            return AddonEventOutcome.error(
+                result={"error": "\n".join(sorted(errors)), **result}
+            )
+        return result
 
 
 class WebhookAddon(JSONWebhookBaseAddon):
@@ -130,6 +342,7 @@ class WebhookAddon(JSONWebhookBaseAddon):
     )
 
     settings_form = WebhooksAddonForm
+    supports_batch_payload = True
 
     def build_webhook_payload(self, change: Change) -> PayloadType:
         """Build a Schema-valid payload from change event."""
@@ -169,7 +382,20 @@ class WebhookAddon(JSONWebhookBaseAddon):
 
     def build_headers(self, change: Change, payload: PayloadType) -> dict[str, str]:
         """Build headers following Standard Webhooks specifications."""
-        webhook_id = change.get_uuid().hex
+        return self.sign_headers(change.get_uuid().hex, payload)
+
+    def build_batch_headers(
+        self, changes: tuple[Change, ...], payload: list[PayloadType]
+    ) -> dict[str, str]:
+        # The message ID is stable for the same set of changes
+        webhook_id = hashlib.sha256(
+            ",".join(change.get_uuid().hex for change in changes).encode()
+        ).hexdigest()[:32]
+        return self.sign_headers(webhook_id, payload)
+
+    def sign_headers(
+        self, webhook_id: str, payload: PayloadType | list[PayloadType]
+    ) -> dict[str, str]:
         attempt_time = timezone.now()
         headers: dict[str, str] = {
             "webhook-timestamp": str(attempt_time.timestamp()),
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import time
 import uuid
 from collections import defaultdict
 from contextvars import ContextVar
@@ -19,10 +20,11 @@ from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group as DjangoGroup
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator as DjangoEmailValidator
 from django.core.validators import MinValueValidator
-from django.db import models, router
+from django.db import models, router, transaction
 from django.db.models import Q, UniqueConstraint
 from django.db.models.functions import Upper
 from django.db.models.signals import m2m_changed, post_delete, post_save
@@ -61,7 +63,7 @@ from weblate.auth.utils import (
 from weblate.logger import LOGGER
 from weblate.trans.defines import EMAIL_LENGTH, FULLNAME_LENGTH, USERNAME_LENGTH
 from weblate.trans.fields import RegexField
-from weblate.trans.models import ComponentList, Project
+from weblate.trans.models import Component, ComponentList, Project
 from weblate.utils.decorators import disable_for_loaddata
 from weblate.utils.fields import EmailField, UsernameField
 from weblate.utils.regex import regex_match
@@ -121,6 +123,26 @@ class CachedPermissionMembership:
     project_ids: set[int]
 
 
+PERMISSIONS_VERSION_CACHE_KEY = "permissions:version"
+PERMISSIONS_CACHE_TIMEOUT = 86400
+
+
+def bump_permissions_version() -> None:
+    cache.set(PERMISSIONS_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
+def invalidate_permissions_cache() -> None:
+    """
+    Invalidate memberships of all users in the shared cache.
+
+    The version is bumped immediately and once more after commit, so that
+    memberships fetched by a concurrent request before the commit are not
+    used.
+    """
+    bump_permissions_version()
+    transaction.on_commit(bump_permissions_version)
+
+
 class Permission(models.Model):
     codename = models.CharField(max_length=100, unique=True)
     name = models.CharField(max_length=200)
@@ -736,7 +758,7 @@ def get_anonymous() -> User:
         profile = copy(profile)
         profile.user = user
         fields_cache["profile"] = profile
-    user.clear_permissions_cache()
+    user.clear_local_permissions_cache()
     return user
 
 
@@ -944,6 +966,12 @@ class User(AbstractBaseUser):
         super().__init__(*args, **kwargs)
 
     def clear_permissions_cache(self) -> None:
+        """Clear cached permission and access-scope data of this user."""
+        if self.pk is not None:
+            cache.delete(self.permissions_cache_key)
+        self.clear_local_permissions_cache()
+
+    def clear_local_permissions_cache(self) -> None:
         """Clear cached permission and access-scope data on this user instance."""
         self.cla_cache = {}
         perm_caches = (
@@ -951,6 +979,7 @@ class User(AbstractBaseUser):
             "allowed_projects",
             "needs_component_restrictions_filter",
             "needs_project_filter",
+            "allowed_component_ids",
             "watched_projects",
             "owned_projects",
             "managed_projects",
@@ -1171,6 +1200,25 @@ class User(AbstractBaseUser):
             pk__in=self.allowed_projects.values("pk").order_by()
         ).exists()
 
+    @cached_property
+    def allowed_component_ids(
+        self,
+    ) -> models.QuerySet[Component, dict[str, Any]] | None:
+        """
+        IDs of accessible components, None when all components are accessible.
+
+        Querysets over large tables filter on this subquery instead of
+        combining the project and component access conditions in every query.
+        It is evaluated by the database as part of the filtered query, so the
+        list of components is never transferred.
+        """
+        if (
+            not self.needs_project_filter
+            and not self.needs_component_restrictions_filter
+        ):
+            return None
+        return Component.objects.filter_access(self).values("id").order_by()
+
     @cached_property
     def watched_projects(self):
         """
@@ -1193,8 +1241,35 @@ class User(AbstractBaseUser):
     def administered_group_ids(self):
         return set(self.administered_group_set.values_list("id", flat=True))
 
+    @property
+    def permissions_cache_key(self) -> str:
+        return f"permissions:user:{self.pk}"
+
     @cached_property
     def cached_memberships(self) -> list[CachedPermissionMembership]:
+        """
+        Memberships compiled for permission checks.
+
+        These are stored in the shared cache together with the permissions
+        version, which is bumped on any change of teams, roles or their scope.
+        """
+        if self.pk is None:
+            return self.fetch_memberships()
+        cache_key = self.permissions_cache_key
+        cached = cache.get_many([PERMISSIONS_VERSION_CACHE_KEY, cache_key])
+        version = cached.get(PERMISSIONS_VERSION_CACHE_KEY)
+        if version is None:
+            # The version was evicted, entries stored before are not valid
+            cache.add(PERMISSIONS_VERSION_CACHE_KEY, time.time_ns(), None)
+            version = cache.get(PERMISSIONS_VERSION_CACHE_KEY)
+        elif cache_key in cached and cached[cache_key][0] == version:
+            return cached[cache_key][1]
+        memberships = self.fetch_memberships()
+        if version is not None:
+            cache.set(cache_key, (version, memberships), PERMISSIONS_CACHE_TIMEOUT)
+        return memberships
+
+    def fetch_memberships(self) -> list[CachedPermissionMembership]:
         limit_languages = TeamMembership.limit_languages.through
         group_componentlists = Group.componentlists.through
         group_components = Group.components.through
@@ -1447,12 +1522,16 @@ class User(AbstractBaseUser):
 
     @cached_property
     def global_permissions(self) -> set[str]:
-        return set(
-            Permission.objects.filter(
-                role__group__in=self.unlimited_membership_group_ids,
-                codename__in=GLOBAL_PERM_NAMES,
-            ).values_list("codename", flat=True)
-        )
+        # Same as memberships from TeamMembership.objects.unlimited_for_user
+        skip_2fa = not self.is_bot and not self.profile.has_2fa
+        return {
+            permission
+            for membership in self.cached_memberships
+            if not membership.limit_language_ids
+            and not (skip_2fa and membership.enforced_2fa)
+            for permission in membership.permission_codenames
+            if permission in GLOBAL_PERM_NAMES
+        }
 
     @property
     def unlimited_membership_group_ids(self):
@@ -1818,6 +1897,40 @@ def change_componentlist(sender, instance, action, **kwargs) -> None:
         )
 
 
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=TeamMembership)
+@receiver(post_delete, sender=TeamMembership)
+@receiver(m2m_changed, sender=Group.roles.through)
+@receiver(m2m_changed, sender=Group.projects.through)
+@receiver(m2m_changed, sender=Group.components.through)
+@receiver(m2m_changed, sender=Group.componentlists.through)
+@receiver(m2m_changed, sender=Group.languages.through)
+@receiver(m2m_changed, sender=Role.permissions.through)
+@receiver(m2m_changed, sender=TeamMembership)
+@receiver(m2m_changed, sender=TeamMembership.limit_languages.through)
+@receiver(m2m_changed, sender=ComponentList.components.through)
+# Cascade deletion of the m2m rows does not send m2m_changed
+@receiver(post_delete, sender=Component)
+@receiver(post_delete, sender=ComponentList)
+def invalidate_permissions_on_change(sender, action: str = "post_", **kwargs) -> None:
+    if action.startswith("post_"):
+        invalidate_permissions_cache()
+
+
+@receiver(post_save, sender=Component)
+def invalidate_permissions_on_component_move(
+    sender, instance: Component, created: bool = False, **kwargs
+) -> None:
+    # Memberships include project of the components in the team scope
+    if not created and instance.old_component_settings["project_id"] != (
+        instance.project_id
+    ):
+        invalidate_permissions_cache()
+
+
 @receiver(post_delete, sender=TeamMembership)
 def remove_deleted_membership_admin(sender, instance, **kwargs) -> None:
     Group.admins.through.objects.filter(
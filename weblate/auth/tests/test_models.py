@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.auth.models import Group as DjangoGroup
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.test.utils import override_settings
@@ -14,6 +15,7 @@ from django.test.utils import override_settings
 from weblate.auth import permissions as auth_permissions
 from weblate.auth.data import SELECTION_ALL, SELECTION_MANUAL
 from weblate.auth.models import (
+    PERMISSIONS_VERSION_CACHE_KEY,
     Group,
     Permission,
     Role,
@@ -27,7 +29,13 @@ from weblate.auth.models import (
 )
 from weblate.auth.utils import format_membership_limit_language_codes
 from weblate.lang.models import Language
-from weblate.trans.models import Category, ComponentLink, ComponentList, Project
+from weblate.trans.models import (
+    Category,
+    ComponentLink,
+    ComponentList,
+    Project,
+    Unit,
+)
 from weblate.trans.tests.test_views import FixtureComponentTestCase
 from weblate.utils.stats import CategoryLanguage, ProjectLanguage
 
@@ -215,6 +223,79 @@ class ModelTest(FixtureComponentTestCase):
             self.assertFalse(self.user.group_enforces_2fa())
         self.assertIn("weblate_auth_userblock", context.captured_queries[0]["sql"])
 
+    def test_cached_memberships_are_shared(self) -> None:
+        self.user.groups.add(self.group)
+        self.assertIn(self.project.pk, self.user.project_permissions)
+
+        # Memberships are loaded from the shared cache
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            memberships = user.cached_memberships
+        self.assertEqual(memberships, self.user.cached_memberships)
+
+        # Changing the team invalidates them
+        self.group.roles.add(Role.objects.get(name="Power user"))
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(user.has_perm("unit.edit", self.translation))
+
+    def test_cached_memberships_missing_version(self) -> None:
+        self.user.groups.add(self.group)
+        self.assertIn(self.project.pk, self.user.project_permissions)
+
+        # Entries stored without the version are never used
+        cache.delete(PERMISSIONS_VERSION_CACHE_KEY)
+        cache.set(self.user.permissions_cache_key, (None, []))
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(user.cached_memberships)
+        version = cache.get(PERMISSIONS_VERSION_CACHE_KEY)
+        self.assertIsNotNone(version)
+        self.assertEqual(cache.get(user.permissions_cache_key)[0], version)
+
+    def test_allowed_component_ids(self) -> None:
+        # Private project without membership
+        self.assertFalse(self.user.allowed_component_ids.exists())
+        self.assertFalse(Unit.objects.filter_access(self.user).exists())
+
+        self.user.groups.add(self.group)
+        self.user.clear_permissions_cache()
+        self.assertIn({"id": self.component.pk}, list(self.user.allowed_component_ids))
+        # Components are filtered in a subquery
+        self.assertIn(
+            'FROM "trans_component"', str(Unit.objects.filter_access(self.user).query)
+        )
+        self.assertTrue(
+            Unit.objects.filter_access(self.user)
+            .filter(translation__component=self.component)
+            .exists()
+        )
+
+        # No filtering when everything is accessible
+        self.project.access_control = Project.ACCESS_PUBLIC
+        self.project.save()
+        self.user.clear_permissions_cache()
+        self.assertIsNone(self.user.allowed_component_ids)
+
+    def test_cached_memberships_follow_components(self) -> None:
+        self.group.projects.remove(self.project)
+        self.group.components.add(self.component)
+        self.user.groups.add(self.group)
+        self.assertIn(self.project.pk, self.user.project_permissions)
+
+        # Moving the component grants access to the new project only
+        other = Project.objects.create(
+            name="Other", slug="other", web="https://weblate.org/"
+        )
+        self.component.project = other
+        self.component.save()
+        user = User.objects.get(pk=self.user.pk)
+        self.assertNotIn(self.project.pk, user.project_permissions)
+        self.assertIn(other.pk, user.project_permissions)
+
+        # Deleting the component removes the access
+        self.component.delete()
+        user = User.objects.get(pk=self.user.pk)
+        self.assertNotIn(other.pk, user.project_permissions)
+
     def test_anonymous_project_permissions(self) -> None:
         anonymous = User.objects.get(username=settings.ANONYMOUS_USER_NAME)
         group = Group.objects.create(
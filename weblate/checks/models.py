@@ -66,17 +66,10 @@ class CheckQuerySet(models.QuerySet["Check", "Check"]):
         return self.order_by("name")
 
     def filter_access(self, user: User):
-        result = self
-        if user.needs_project_filter:
-            result = result.filter(
-                user.get_project_access_query("unit__translation__component__project")
-            )
-        if user.needs_component_restrictions_filter:
-            result = result.filter(
-                Q(unit__translation__component__restricted=False)
-                | Q(unit__translation__component_id__in=user.component_permissions)
-            )
-        return result
+        component_ids = user.allowed_component_ids
+        if component_ids is None:
+            return self
+        return self.filter(unit__translation__component_id__in=component_ids)
 
 
 class Check(models.Model):
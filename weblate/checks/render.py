@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
@@ -73,7 +73,7 @@ class MaxSizeCheck(TargetCheckParametrized):
     def get_render_cache_key(self, unit: Unit, pos: int, text: str) -> str:
         return f"{self.get_cache_key(unit, pos)}:{calculate_hash(text)}"
 
-    def check_text_params(self, texts: list[str], unit: Unit, value) -> bool:
+    def get_render_params(self, unit: Unit, value) -> dict[str, Any]:
         if len(value) == 2:
             width, lines = value
         else:
@@ -84,21 +84,23 @@ class MaxSizeCheck(TargetCheckParametrized):
             unit.translation.component.project, unit.translation.language, font_group
         )
         self.last_font = font
+        return {
+            "font": font,
+            "font_siblings": font_siblings,
+            "weight": weight,
+            "size": size,
+            "spacing": spacing,
+            "width": width,
+            "lines": lines,
+        }
+
+    def check_text_params(self, texts: list[str], unit: Unit, value) -> bool:
+        params = self.get_render_params(unit, value)
         replace = self.get_replacement_function(unit)
         failed = False
-        for i, text in enumerate(texts):
-            rendered_text = replace(text)
-            if not check_render_size(
-                text=rendered_text,
-                font=font,
-                font_siblings=font_siblings,
-                weight=weight,
-                size=size,
-                spacing=spacing,
-                width=width,
-                lines=lines,
-                cache_key=self.get_render_cache_key(unit, i, rendered_text),
-            ):
+        # The image is rendered only once displayed, see render()
+        for text in texts:
+            if not check_render_size(text=replace(text), **params):
                 failed = True
         return failed
 
@@ -155,17 +157,20 @@ class MaxSizeCheck(TargetCheckParametrized):
         except IndexError:
             msg = "Invalid check"
             raise Http404(msg) from None
-        key = self.get_render_cache_key(
-            unit, pos, self.get_replacement_function(unit)(text)
-        )
+        rendered_text = self.get_replacement_function(unit)(text)
+        key = self.get_render_cache_key(unit, pos, rendered_text)
         result = cache.get(key)
-        if result is None:
-            if unit.is_source:
-                self.check_source_unit(unit.get_source_plurals(), unit)
-            else:
-                self.check_target_unit(
-                    unit.get_source_plurals(), unit.get_target_plurals(), unit
-                )
+        if result is None and unit.all_flags.has_value(self.enable_string):
+            try:
+                value = self.get_value(unit)
+            except ValueError:
+                msg = "Invalid check"
+                raise Http404(msg) from None
+            check_render_size(
+                text=rendered_text,
+                cache_key=key,
+                **self.get_render_params(unit, value),
+            )
             result = cache.get(key)
         if result is None:
             msg = "Invalid check"
@@ -46,6 +46,11 @@ class MaxSizeCheckTest(FontTestCase):
         self.assertFalse(self.perform_check("long " * 50, "max-size:500:50"))
         self.assertEqual(self.check.last_font, "sans")
 
+    def test_check_does_not_render_image(self) -> None:
+        with patch("weblate.fonts.render.draw_text") as mocked_draw_text:
+            self.assertTrue(self.perform_check("long" * 50, "max-size:500"))
+        mocked_draw_text.assert_not_called()
+
     def test_source_good(self) -> None:
         self.assertFalse(self.perform_source_check("short", "max-size:500"))
         self.assertEqual(self.check.last_font, "sans")
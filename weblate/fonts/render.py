@@ -19,7 +19,7 @@ from importlib import import_module
 from io import BytesIO
 from math import ceil
 from pathlib import Path
-from threading import RLock
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Literal
 
 from unicode_segmentation_rs import graphemes, line_break_units
@@ -102,6 +102,7 @@ _SYNTHETIC_BOLD_ATTRIBUTE = "_weblate_synthetic_bold"
 _SOFT_HYPHEN = "\u00ad"
 _VISIBLE_HYPHEN = "\u2010"
 _UPLOADED_FONT_CACHE_SIZE = 32
+_MEASURE_CACHE_SIZE = 8192
 
 _RENDER_LOCK = RLock()
 
@@ -126,6 +127,38 @@ def rendering_lock() -> Iterator[None]:
         yield
 
 
+class MeasureCache:
+    """
+    Bounded cache of text measurements.
+
+    Lookups do not take any lock, so measurements computed once are available
+    to all threads without waiting for the rendering lock.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.data: dict[tuple, Any] = {}
+        self.lock = Lock()
+
+    def get(self, key: tuple) -> Any:  # ruff: ignore[any-type]
+        return self.data.get(key)
+
+    def set(self, key: tuple, value) -> None:
+        with self.lock:
+            if len(self.data) >= self.size:
+                # Drop the oldest entry
+                self.data.pop(next(iter(self.data)), None)
+            self.data[key] = value
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+
+
+_LINE_CACHE = MeasureCache(_MEASURE_CACHE_SIZE)
+_MULTILINE_CACHE = MeasureCache(_MEASURE_CACHE_SIZE)
+
+
 @cache
 def configure_matplotlib() -> None:
     """Register the bundled fonts with Matplotlib's process-local manager."""
@@ -453,6 +486,19 @@ def split_explicit_lines(text: str) -> list[str]:
     return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
 
 
+def _font_cache_key(font_properties: FontProperties) -> tuple:
+    """Return key identifying font properties in the measurement caches."""
+    return (
+        tuple(font_properties.get_family()),
+        font_properties.get_style(),
+        font_properties.get_variant(),
+        font_properties.get_weight(),
+        font_properties.get_stretch(),
+        font_properties.get_size_in_points(),
+        getattr(font_properties, _SYNTHETIC_BOLD_ATTRIBUTE, False),
+    )
+
+
 def measure_line(
     text: str,
     font_properties: FontProperties,
@@ -461,6 +507,24 @@ def measure_line(
     renderer: RendererBase | None = None,
 ) -> tuple[float, float]:
     """Measure an unwrapped line in pixels."""
+    key = (_font_cache_key(font_properties), text, spacing)
+    result = _LINE_CACHE.get(key)
+    if result is None:
+        with rendering_lock():
+            result = _measure_line(
+                text, font_properties, spacing=spacing, renderer=renderer
+            )
+        _LINE_CACHE.set(key, result)
+    return result
+
+
+def _measure_line(
+    text: str,
+    font_properties: FontProperties,
+    *,
+    spacing: float,
+    renderer: RendererBase | None,
+) -> tuple[float, float]:
     if renderer is None:
         renderer = get_renderer()
     # Matplotlib 3.11 routes this through FT2Font's libraqm-backed layout,
@@ -493,6 +557,10 @@ def measure_multiline(
     line_list = list(lines)
     if not line_list:
         line_list = [""]
+    key = (_font_cache_key(font_properties), tuple(line_list), spacing)
+    result = _MULTILINE_CACHE.get(key)
+    if result is not None:
+        return result
     renderer = get_renderer()
     widths = [
         measure_line(line, font_properties, spacing=spacing, renderer=renderer)[0]
@@ -502,20 +570,23 @@ def measure_multiline(
     # Text's multiline layout uses a stable line box which includes ascender and
     # descender room. Measure it through the artist instead of approximating it
     # from a particular glyph run.
-    figure = Figure(dpi=RENDER_DPI)
-    artist = figure.text(
-        0,
-        0,
-        "\n".join(line_list),
-        fontproperties=font_properties,
-        linespacing=1,
-        parse_math=False,
-    )
-    bbox = artist.get_window_extent(renderer)
-    return (
+    with rendering_lock():
+        figure = Figure(dpi=RENDER_DPI)
+        artist = figure.text(
+            0,
+            0,
+            "\n".join(line_list),
+            fontproperties=font_properties,
+            linespacing=1,
+            parse_math=False,
+        )
+        bbox = artist.get_window_extent(renderer)
+    result = (
         ceil(max(widths, default=0)),
         ceil(bbox.height + _synthetic_bold_linewidth(font_properties)),
     )
+    _MULTILINE_CACHE.set(key, result)
+    return result
 
 
 def wrap_text(
@@ -29,6 +29,7 @@ from weblate.fonts.render import (
     figure_to_png,
     get_font_properties,
     measure_line,
+    measure_multiline,
     split_explicit_lines,
     wrap_text,
 )
@@ -492,6 +493,28 @@ class RenderTest(SimpleTestCase):
         self.assertTrue(all(width > 0 for width, _format in results))
         self.assertTrue(all(image_format == "PNG" for _width, image_format in results))
 
+    def test_measure_cache(self) -> None:
+        font_properties = get_font_properties("sans", size=14)
+        width = measure_line("Cached text", font_properties)
+        lines = measure_multiline(["Cached", "text"], font_properties)
+
+        with (
+            patch("weblate.fonts.render._measure_line") as mocked_measure,
+            patch("weblate.fonts.render.rendering_lock") as mocked_lock,
+        ):
+            self.assertEqual(measure_line("Cached text", font_properties), width)
+            self.assertEqual(
+                measure_multiline(["Cached", "text"], font_properties), lines
+            )
+        mocked_measure.assert_not_called()
+        mocked_lock.assert_not_called()
+
+        # Different font properties are measured separately
+        self.assertNotEqual(
+            measure_line("Cached text", get_font_properties("sans", size=28)),
+            width,
+        )
+
     def test_render_cache(self) -> None:
         cache_key = "test:render:cache"
 
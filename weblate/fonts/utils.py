@@ -74,21 +74,22 @@ def _render_size(
         weight=weight,
         font_siblings=font_siblings,
     )
-    with render.rendering_lock():
-        rendered_lines = (
-            render.split_explicit_lines(text)
-            if lines == 1
-            else render.wrap_text(text, width, font_properties, spacing=spacing)
-        )
-        measured_width, measured_height = render.measure_multiline(
-            rendered_lines, font_properties, spacing=spacing
-        )
-        pixel_size = Dimensions(measured_width, measured_height)
-        line_count = len(rendered_lines)
+    # Measurements are cached and take the rendering lock only when needed
+    rendered_lines = (
+        render.split_explicit_lines(text)
+        if lines == 1
+        else render.wrap_text(text, width, font_properties, spacing=spacing)
+    )
+    measured_width, measured_height = render.measure_multiline(
+        rendered_lines, font_properties, spacing=spacing
+    )
+    pixel_size = Dimensions(measured_width, measured_height)
+    line_count = len(rendered_lines)
 
-        if not needs_output:
-            return pixel_size, line_count, b""
+    if not needs_output:
+        return pixel_size, line_count, b""
 
+    with render.rendering_lock():
         surface_height = max(surface_height, pixel_size.height)
         surface_width = max(
             width,
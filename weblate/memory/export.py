@@ -0,0 +1,132 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Streaming export of translation memory.
+
+The entries are fetched in chunks using a server-side cursor and serialized
+one by one, so the export does not need to fit in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from django.utils.html import escape
+
+if sys.version_info >= (3, 14):
+    from compression import zstd
+else:
+    from backports import zstd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from weblate.memory.models import Memory, MemoryDict, MemoryQuerySet
+
+MEMORY_EXPORT_CHUNK_SIZE = 1000
+MEMORY_EXPORT_BUFFER_SIZE = 65536
+
+
+def iterate_memory(queryset: MemoryQuerySet) -> Iterator[Memory]:
+    # Prefetching is done per chunk when iterating
+    return queryset.iterator(chunk_size=MEMORY_EXPORT_CHUNK_SIZE)
+
+
+def iterate_memory_dicts(
+    queryset: MemoryQuerySet, *, category: int | None = None
+) -> Iterator[MemoryDict]:
+    for memory in iterate_memory(queryset):
+        if category is None:
+            yield from memory.as_dicts()
+        else:
+            yield memory.as_dict(category=category)
+
+
+def iterate_memory_json(
+    entries: Iterable[MemoryDict], *, indent: int | None = None
+) -> Iterator[str]:
+    """Serialize entries as a JSON array, matches output of json.dump."""
+    if indent is None:
+        start = ""
+        item_separator = ", "
+    else:
+        start = "\n" + " " * indent
+        item_separator = ","
+    separator = ""
+    yield "["
+    for entry in entries:
+        yield separator + start + json.dumps(entry, indent=indent).replace("\n", start)
+        separator = item_separator
+    if separator and indent is not None:
+        yield "\n"
+    yield "]"
+
+
+def iterate_memory_tmx(queryset: MemoryQuerySet) -> Iterator[str]:
+    memories = iterate_memory(queryset)
+    first = next(memories, None)
+    srclang = "en" if first is None else escape(first.source_language.code)
+    yield (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<tmx version="1.4">\n'
+        f'  <header adminlang="{srclang}" srclang="{srclang}">\n'
+        "  </header>\n"
+        "  <body>\n"
+    )
+    if first is not None:
+        for memory in chain((first,), memories):
+            yield (
+                "    <tu>\n"
+                f'      <tuv xml:lang="{escape(memory.source_language.code)}">\n'
+                f"        <seg>{escape(memory.source)}</seg>\n"
+                "      </tuv>\n"
+                f'      <tuv xml:lang="{escape(memory.target_language.code)}">\n'
+                f"        <seg>{escape(memory.target)}</seg>\n"
+                "      </tuv>\n"
+                "    </tu>\n"
+            )
+    yield "  </body>\n</tmx>\n"
+
+
+def iterate_memory_export(
+    queryset: MemoryQuerySet,
+    *,
+    fmt: str,
+    category: int | None = None,
+    indent: int | None = None,
+) -> Iterator[str]:
+    """Serialize memory entries to JSON or TMX."""
+    if fmt == "tmx":
+        return iterate_memory_tmx(queryset)
+    return iterate_memory_json(
+        iterate_memory_dicts(queryset, category=category), indent=indent
+    )
+
+
+def encode_memory_export(
+    chunks: Iterable[str], *, compress: bool = False
+) -> Iterator[bytes]:
+    """Encode serialized chunks, optionally compressing them using zstd."""
+    compressor = zstd.ZstdCompressor() if compress else None
+    buffer: list[str] = []
+    size = 0
+    for chunk in chain(chunks, ("",)):
+        buffer.append(chunk)
+        size += len(chunk)
+        # Flush on reaching the buffer size and at the end
+        if size < MEMORY_EXPORT_BUFFER_SIZE and chunk:
+            continue
+        data = "".join(buffer).encode()
+        buffer = []
+        size = 0
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
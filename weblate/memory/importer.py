@@ -0,0 +1,351 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Bulk import of translation memory entries.
+
+Imported entries are copied to a temporary staging table using PostgreSQL
+``COPY`` and merged into the memory with a few set-based queries once the
+whole file has been processed. Entries already present in the memory are not
+created again, they only get the import scope attached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, BinaryIO, TypedDict
+
+from django.db import connections, transaction
+from lxml import etree
+from translate.storage.tmx import tmxunit
+
+from weblate.memory.models import Memory, MemoryScope
+from weblate.memory.utils import is_valid_memory_entry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from django.db.backends.utils import CursorWrapper
+
+    from weblate.auth.models import User
+    from weblate.lang.models import Language
+    from weblate.trans.models import Project
+
+MEMORY_IMPORT_BATCH_SIZE = 10000
+MEMORY_IMPORT_TABLE = "memory_import"
+MEMORY_TABLE = "memory_memory"
+MEMORY_SCOPE_TABLE = "memory_memoryscope"
+
+# Scope fields identifying the scope, see MemoryScopeManager.get_scope_query
+MEMORY_SCOPE_FIELDS = {
+    MemoryScope.SCOPE_PROJECT: ("project_id",),
+    MemoryScope.SCOPE_PROJECT_FILE: ("project_id",),
+    MemoryScope.SCOPE_WORKSPACE: ("workspace_id", "source_project_id"),
+    MemoryScope.SCOPE_USER: ("user_id",),
+    MemoryScope.SCOPE_USER_FILE: ("user_id",),
+    MemoryScope.SCOPE_SHARED: ("source_project_id",),
+}
+
+
+class MemoryImportEntry(TypedDict):
+    source: str
+    target: str
+    source_language: Language
+    target_language: Language
+    context: str
+
+
+def get_text_hash(text: str) -> str:
+    """Return hash matching the PostgreSQL MD5 function used in the indexes."""
+    return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()
+
+
+class MemoryTMXReader:
+    """
+    Incremental TMX parser.
+
+    Translation units are returned as they are parsed and removed from the
+    tree afterwards, so the memory usage does not grow with the file size.
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        self.fileobj = fileobj
+        self.header: etree._Element | None = None
+
+    def iterate_units(self) -> Iterator[tmxunit]:
+        for event, element in etree.iterparse(
+            self.fileobj,
+            events=("start", "end"),
+            strip_cdata=False,
+            resolve_entities=False,
+            no_network=True,
+        ):
+            name = etree.QName(element)
+            if event == "start":
+                if element.getparent() is None and name.localname != "tmx":
+                    msg = f"Unexpected root element: {name.localname}"
+                    raise SyntaxError(msg)
+                continue
+            if name.localname == "header":
+                self.header = element
+            elif name.localname == "tu":
+                unit = tmxunit.createfromxmlElement(element)
+                unit.namespace = name.namespace
+                yield unit
+                # Discard processed units including the references kept
+                # by the parent element
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+
+class MemoryImporter:
+    """
+    Collects translation memory entries and imports them at once.
+
+    The entries are copied to the staging table in batches, the merge happens
+    after all entries were added.
+    """
+
+    def __init__(
+        self,
+        *,
+        origin: str,
+        status: int,
+        user: User | None,
+        project: Project | None,
+        from_file: bool,
+    ) -> None:
+        self.origin = origin
+        self.status = status
+        self.scope = MemoryScope.objects.get_for_update_entry(
+            user=user,
+            project=project,
+            from_file=from_file,
+            shared=False,
+        )
+        self.using = Memory.objects.get_queryset().using_write_db().db
+        self.connection = connections[self.using]
+        self.pending: list[tuple[str, str, str, str, int, int, str]] = []
+
+    def quote(self, name: str) -> str:
+        return self.connection.ops.quote_name(name)
+
+    def create_staging(self) -> None:
+        # Temporary tables are not WAL-logged and are dropped with the
+        # transaction
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TEMPORARY TABLE {self.quote(MEMORY_IMPORT_TABLE)} (
+                    source text NOT NULL,
+                    target text NOT NULL,
+                    source_md5 text NOT NULL,
+                    target_md5 text NOT NULL,
+                    source_language_id bigint NOT NULL,
+                    target_language_id bigint NOT NULL,
+                    context text NOT NULL,
+                    memory_id bigint
+                ) ON COMMIT DROP
+                """
+            )
+
+    def add(
+        self,
+        *,
+        source: str,
+        target: str,
+        source_language: Language,
+        target_language: Language,
+        context: str,
+    ) -> None:
+        if not is_valid_memory_entry(source=source, target=target):
+            return
+        self.pending.append(
+            (
+                source,
+                target,
+                get_text_hash(source),
+                get_text_hash(target),
+                source_language.pk,
+                target_language.pk,
+                context,
+            )
+        )
+        if len(self.pending) >= MEMORY_IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        with (
+            self.connection.cursor() as cursor,
+            cursor.copy(
+                f"""
+                COPY {self.quote(MEMORY_IMPORT_TABLE)} (
+                    source, target, source_md5, target_md5,
+                    source_language_id, target_language_id, context
+                ) FROM STDIN
+                """
+            ) as copy,
+        ):
+            for row in pending:
+                copy.write_row(row)
+
+    @staticmethod
+    def get_scope_condition(scope: MemoryScope) -> tuple[str, list[int | None]]:
+        conditions = ["scope.scope = %s"]
+        params: list[int | None] = [scope.scope]
+        for field in MEMORY_SCOPE_FIELDS.get(scope.scope, ()):
+            conditions.append(f"scope.{field} IS NOT DISTINCT FROM %s")
+            params.append(getattr(scope, field))
+        return " AND ".join(conditions), params
+
+    def match_existing(self, cursor: CursorWrapper, scope: MemoryScope) -> None:
+        """
+        Find existing entries for the staged rows.
+
+        Mirrors MemoryManager.update_entry, entries already visible in the
+        import scope are preferred, otherwise the oldest scoped entry is used.
+        """
+        scope_condition, scope_params = self.get_scope_condition(scope)
+        cursor.execute(
+            # ruff: ignore[hardcoded-sql-expression]
+            f"""
+            UPDATE {self.quote(MEMORY_IMPORT_TABLE)} AS staging
+               SET memory_id = (
+                   SELECT memory.id
+                     FROM {self.quote(MEMORY_TABLE)} AS memory
+                    WHERE md5(memory.origin) = md5(%s)
+                      AND md5(memory.source) = staging.source_md5
+                      AND md5(memory.target) = staging.target_md5
+                      AND memory.source_language_id = staging.source_language_id
+                      AND memory.target_language_id = staging.target_language_id
+                      AND memory.status = %s
+                      AND memory.context = staging.context
+                      AND EXISTS (
+                          SELECT 1
+                            FROM {self.quote(MEMORY_SCOPE_TABLE)} AS scope
+                           WHERE scope.memory_id = memory.id
+                      )
+                    ORDER BY EXISTS (
+                          SELECT 1
+                            FROM {self.quote(MEMORY_SCOPE_TABLE)} AS scope
+                           WHERE scope.memory_id = memory.id AND {scope_condition}
+                      ) DESC,
+                      memory.id
+                    LIMIT 1
+               )
+            """,
+            [self.origin, self.status, *scope_params],
+        )
+        # Existing entries are now owned by the scope rows only
+        cursor.execute(
+            # ruff: ignore[hardcoded-sql-expression]
+            f"""
+            UPDATE {self.quote(MEMORY_TABLE)}
+               SET legacy_project_id = NULL,
+                   legacy_user_id = NULL,
+                   legacy_shared = FALSE,
+                   legacy_from_file = FALSE
+             WHERE id IN (
+                   SELECT memory_id
+                     FROM {self.quote(MEMORY_IMPORT_TABLE)}
+                    WHERE memory_id IS NOT NULL
+                )
+               AND (
+                   legacy_project_id IS NOT NULL
+                   OR legacy_user_id IS NOT NULL
+                   OR legacy_shared
+                   OR legacy_from_file
+               )
+            """
+        )
+
+    def create_missing(self, cursor: CursorWrapper) -> None:
+        """Create entries for staged rows not present in the memory."""
+        cursor.execute(
+            # ruff: ignore[hardcoded-sql-expression]
+            f"""
+            WITH created AS (
+                INSERT INTO {self.quote(MEMORY_TABLE)} (
+                    source, target, origin, context, status,
+                    source_language_id, target_language_id,
+                    legacy_shared, legacy_from_file
+                )
+                SELECT DISTINCT ON (
+                           source_md5, target_md5,
+                           source_language_id, target_language_id, context
+                       )
+                       source, target, %s, context, %s,
+                       source_language_id, target_language_id,
+                       FALSE, FALSE
+                  FROM {self.quote(MEMORY_IMPORT_TABLE)}
+                 WHERE memory_id IS NULL
+                RETURNING id, md5(source) AS source_md5, md5(target) AS target_md5,
+                          source_language_id, target_language_id, context
+            )
+            UPDATE {self.quote(MEMORY_IMPORT_TABLE)} AS staging
+               SET memory_id = created.id
+              FROM created
+             WHERE staging.memory_id IS NULL
+               AND staging.source_md5 = created.source_md5
+               AND staging.target_md5 = created.target_md5
+               AND staging.source_language_id = created.source_language_id
+               AND staging.target_language_id = created.target_language_id
+               AND staging.context = created.context
+            """,
+            [self.origin, self.status],
+        )
+
+    def create_scopes(self, cursor: CursorWrapper, scope: MemoryScope) -> None:
+        """Attach import scope, existing scope rows are skipped by the constraints."""
+        cursor.execute(
+            # ruff: ignore[hardcoded-sql-expression]
+            f"""
+            INSERT INTO {self.quote(MEMORY_SCOPE_TABLE)} (
+                memory_id, scope, project_id, workspace_id,
+                source_project_id, source_component_id, user_id
+            )
+            SELECT DISTINCT memory_id, %s, %s, %s, %s, %s, %s
+              FROM {self.quote(MEMORY_IMPORT_TABLE)}
+            ON CONFLICT DO NOTHING
+            """,
+            [
+                scope.scope,
+                scope.project_id,
+                scope.workspace_id,
+                scope.source_project_id,
+                scope.source_component_id,
+                scope.user_id,
+            ],
+        )
+
+    def merge(self) -> None:
+        self.flush()
+        with self.connection.cursor() as cursor:
+            # Temporary tables are not processed by autovacuum
+            cursor.execute(f"ANALYZE {self.quote(MEMORY_IMPORT_TABLE)}")
+            if self.scope is not None:
+                self.match_existing(cursor, self.scope)
+            self.create_missing(cursor)
+            if self.scope is not None:
+                self.create_scopes(cursor, self.scope)
+
+    def import_entries(self, entries: Iterable[MemoryImportEntry]) -> int:
+        """
+        Import entries in a single transaction.
+
+        Returns number of processed entries, nothing is imported when
+        processing them raises an exception.
+        """
+        count = 0
+        with transaction.atomic(using=self.using):
+            self.create_staging()
+            for entry in entries:
+                self.add(**entry)
+                count += 1
+            self.merge()
+        return count
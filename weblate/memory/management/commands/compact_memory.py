@@ -0,0 +1,61 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from weblate.memory.models import MemoryScopeMigrationState
+from weblate.memory.tasks import (
+    MEMORY_SCOPE_BACKFILL_STATE,
+    MEMORY_SCOPE_COMPACTION_BATCH_SIZE,
+    compact_memory_scopes_bulk,
+    set_memory_scope_compaction_completed,
+)
+from weblate.utils.management.base import BaseCommand
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    """Command for compacting duplicate translation memory entries."""
+
+    help = "compacts duplicate translation memory entries"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--batch-size",
+            default=MEMORY_SCOPE_COMPACTION_BATCH_SIZE,
+            type=int,
+            help="Number of entries processed in a single transaction",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Start from the beginning instead of the stored checkpoint",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["batch_size"] < 1:
+            msg = "The batch size has to be positive"
+            raise CommandError(msg)
+        backfill = (
+            MemoryScopeMigrationState.objects.using("default")
+            .filter(name=MEMORY_SCOPE_BACKFILL_STATE)
+            .first()
+        )
+        if backfill is not None and not backfill.completed:
+            msg = "Translation memory scope backfill has not finished yet"
+            raise CommandError(msg)
+        if options["restart"]:
+            set_memory_scope_compaction_completed(False, last_memory_id=0)
+        while True:
+            state = compact_memory_scopes_bulk(options["batch_size"])
+            if state.completed:
+                break
+            self.stdout.write(f"Processed entries up to {state.last_memory_id}")
+        self.stdout.write("Translation memory compaction completed")
@@ -3,12 +3,15 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
-import json
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from django.core.management.base import CommandError
 from django.db.models import Q
 
-from weblate.memory.models import Memory
+from weblate.lang.models import Language
+from weblate.memory.export import encode_memory_export, iterate_memory_export
+from weblate.memory.models import Memory, MemoryScopeChoices
 from weblate.utils.management.base import BaseCommand
 
 if TYPE_CHECKING:
@@ -34,13 +37,78 @@ class Command(BaseCommand):
             action="store_true",
             help="Store backup to the backups directory in the DATA_DIR",
         )
+        parser.add_argument(
+            "--format",
+            default="json",
+            choices=("json", "tmx"),
+            help="Output format",
+        )
+        parser.add_argument(
+            "--source-language",
+            help="Export only entries with given source language",
+        )
+        parser.add_argument(
+            "--target-language",
+            help="Export only entries with given target language",
+        )
+        parser.add_argument(
+            "--scope",
+            action="append",
+            choices=[choice.name.lower() for choice in MemoryScopeChoices],
+            help="Export only entries in given scope, can be repeated",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Write output to a file instead of the standard output",
+        )
+        parser.add_argument(
+            "--compress",
+            action="store_true",
+            help="Compress output using zstd, requires --output",
+        )
+
+    def get_language(self, code: str) -> Language:
+        try:
+            return Language.objects.get_by_code(code, {})
+        except Language.DoesNotExist as error:
+            msg = f"Could not find language {code}"
+            raise CommandError(msg) from error
 
     def handle(self, *args, **options) -> None:
-        memory = Memory.objects.filter_scope(Q()).prefetch_scopes().prefetch_lang()
-        self.stdout.ending = None  # type: ignore[assignment]
-        json.dump(
-            [entry for item in memory for entry in item.as_dicts()],
-            self.stdout,
-            indent=options["indent"],
+        if options["compress"] and not options["output"]:
+            msg = "Compressed output can only be written to a file"
+            raise CommandError(msg)
+        scope_query = Q()
+        if options["scope"]:
+            scope_query = Q(
+                scope__in=[
+                    MemoryScopeChoices[name.upper()] for name in options["scope"]
+                ]
+            )
+        memory = (
+            Memory.objects.filter_scope(scope_query)
+            .prefetch_scopes(scope_query)
+            .prefetch_lang()
         )
-        self.stdout.write("\n")
+        if options["source_language"]:
+            memory = memory.filter(
+                source_language=self.get_language(options["source_language"])
+            )
+        if options["target_language"]:
+            memory = memory.filter(
+                target_language=self.get_language(options["target_language"])
+            )
+        chunks = iterate_memory_export(
+            memory, fmt=options["format"], indent=options["indent"]
+        )
+        if options["output"]:
+            with options["output"].open("wb") as handle:
+                for data in encode_memory_export(chunks, compress=options["compress"]):
+                    handle.write(data)
+            return
+        self.stdout.ending = None  # type: ignore[assignment]
+        for chunk in chunks:
+            self.stdout.write(chunk)
+        if options["format"] == "json":
+            self.stdout.write("\n")
@@ -20,7 +20,6 @@ from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.translation import gettext, gettext_lazy, pgettext, pgettext_lazy
 from translate.misc.xml_helpers import getXMLlang, getXMLspace
-from translate.storage.tmx import tmxfile
 from weblate_schemas import load_schema
 
 from weblate.lang.models import Language
@@ -39,6 +38,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator
 
     from weblate.auth.models import AuthenticatedHttpRequest, User
+    from weblate.memory.importer import MemoryImportEntry
     from weblate.trans.models import Component, Project
     from weblate.workspaces.models import Workspace
 
@@ -98,11 +98,6 @@ def load_memory_json_data(content: bytes) -> list[MemoryDict]:
     return cast("list[MemoryDict]", data)
 
 
-def load_memory_tmx_store(fileobj: BinaryIO):
-    """Parse a TMX file into a translate-toolkit store."""
-    return tmxfile.parsefile(fileobj)
-
-
 class MemoryQuerySet(models.QuerySet["Memory", "Memory"]):
     def using_write_db(self) -> Self:
         if self.db != "memory_db":
@@ -600,18 +595,16 @@ class MemoryQuerySet(models.QuerySet["Memory", "Memory"]):
     def prefetch_lang(self) -> Self:
         return self.prefetch_related("source_language", "target_language")
 
-    def prefetch_scopes(self) -> Self:
-        return self.prefetch_related(
-            Prefetch(
-                "scopes",
-                queryset=MemoryScope.objects.using(self.db).select_related(
-                    "project",
-                    "workspace",
-                    "source_project",
-                    "source_component",
-                ),
-            )
+    def prefetch_scopes(self, scope_query: Q | None = None) -> Self:
+        queryset = MemoryScope.objects.using(self.db).select_related(
+            "project",
+            "workspace",
+            "source_project",
+            "source_component",
         )
+        if scope_query is not None:
+            queryset = queryset.filter(scope_query)
+        return self.prefetch_related(Prefetch("scopes", queryset=queryset))
 
 
 class MemoryManager(models.Manager["Memory"]):
@@ -698,6 +691,9 @@ class MemoryManager(models.Manager["Memory"]):
         # ruff: ignore[import-outside-top-level]
         from jsonschema.exceptions import ValidationError
 
+        # ruff: ignore[import-outside-top-level]
+        from weblate.memory.importer import MemoryImporter
+
         try:
             data = load_memory_json_data(fileobj.read())
         except json.JSONDecodeError as error:
@@ -710,31 +706,35 @@ class MemoryManager(models.Manager["Memory"]):
             raise MemoryImportError(
                 gettext("Could not parse JSON file: %s") % error
             ) from error
-        found = 0
         lang_cache: dict[str, Language] = {}
-        for entry in data:
-            try:
-                self.update_entry(
-                    source_language=Language.objects.get_by_code(
+
+        def get_entries() -> Iterator[MemoryImportEntry]:
+            for entry in data:
+                try:
+                    source_language = Language.objects.get_by_code(
                         entry["source_language"], lang_cache
-                    ),
-                    target_language=Language.objects.get_by_code(
+                    )
+                    target_language = Language.objects.get_by_code(
                         entry["target_language"], lang_cache
-                    ),
-                    source=entry["source"],
-                    target=entry["target"],
-                    origin=origin,
-                    context=entry.get("context", ""),
-                    user=user,
-                    project=project,
-                    from_file=from_file,
-                    status=status,
-                    shared=False,
-                )
-                found += 1
-            except Language.DoesNotExist:
-                continue
-        return found
+                    )
+                except Language.DoesNotExist:
+                    continue
+                yield {
+                    "source_language": source_language,
+                    "target_language": target_language,
+                    "source": entry["source"],
+                    "target": entry["target"],
+                    "context": entry.get("context", ""),
+                }
+
+        importer = MemoryImporter(
+            origin=origin,
+            status=status,
+            user=user,
+            project=project,
+            from_file=from_file,
+        )
+        return importer.import_entries(get_entries())
 
     def import_tmx(
         self,
@@ -748,74 +748,87 @@ class MemoryManager(models.Manager["Memory"]):
         from_file: bool = False,
         status: int = 0,
     ) -> int:
+        # ruff: ignore[import-outside-top-level]
+        from weblate.memory.importer import MemoryImporter, MemoryTMXReader
+
+        reader = MemoryTMXReader(fileobj)
+        lang_cache: dict[str, Language] = {}
+
+        def get_source_language() -> Language:
+            if reader.header is None:
+                raise MemoryImportError(gettext("Header missing in the TMX file!"))
+            srclang = reader.header.get("srclang")
+            if not srclang:
+                raise MemoryImportError(
+                    gettext("Source language not defined in the TMX file!")
+                )
+            try:
+                return Language.objects.get_by_code(srclang, lang_cache, langmap)
+            except Language.DoesNotExist as error:
+                raise MemoryImportError(
+                    gettext("Could not find language %s!") % srclang
+                ) from error
+
+        def get_entries() -> Iterator[MemoryImportEntry]:
+            source_language: Language | None = None
+            for unit in reader.iterate_units():
+                if source_language is None:
+                    source_language = get_source_language()
+                # Parse translations (translate-toolkit does not care about
+                # languages here, it just picks first and second XML elements)
+                translations = {}
+                for node in unit.getlanguageNodes():
+                    lang_code, text = get_node_data(unit, node)
+                    if not lang_code or not text:
+                        continue
+                    try:
+                        language = Language.objects.get_by_code(
+                            lang_code, lang_cache, langmap
+                        )
+                    except Language.DoesNotExist as error:
+                        raise MemoryImportError(
+                            gettext("Could not find language %s!") % lang_code
+                        ) from error
+                    translations[language.code] = text
+
+                try:
+                    source = translations.pop(source_language.code)
+                except KeyError:
+                    # Skip if source language is not present
+                    continue
+
+                context = unit.getcontext()
+                for lang, text in translations.items():
+                    yield {
+                        "source_language": source_language,
+                        "target_language": Language.objects.get_by_code(
+                            lang, lang_cache, langmap
+                        ),
+                        "source": source,
+                        "target": text,
+                        "context": context,
+                    }
+
+        importer = MemoryImporter(
+            origin=origin,
+            status=status,
+            user=user,
+            project=project,
+            from_file=from_file,
+        )
         try:
-            storage = load_memory_tmx_store(fileobj)
-        except (SyntaxError, AssertionError) as error:
+            found = importer.import_entries(get_entries())
+        except SyntaxError as error:
+            # This covers invalid XML as well as an unexpected root element.
+            # The root element used to be asserted by translate-toolkit when
+            # parsing the whole file, the units themselves are not asserted.
             report_error("Could not parse")
             raise MemoryImportError(
                 gettext("Could not parse TMX file: %s") % error
             ) from error
-        header = next(
-            storage.document.getroot().iterchildren(storage.namespaced("header")),
-            None,
-        )
-        if header is None:
-            raise MemoryImportError(gettext("Header missing in the TMX file!"))
-        lang_cache: dict[str, Language] = {}
-        srclang = header.get("srclang")
-        if not srclang:
-            raise MemoryImportError(
-                gettext("Source language not defined in the TMX file!")
-            )
-        try:
-            source_language = Language.objects.get_by_code(srclang, lang_cache, langmap)
-        except Language.DoesNotExist as error:
-            raise MemoryImportError(
-                gettext("Could not find language %s!") % srclang
-            ) from error
-
-        found = 0
-        for unit in storage.units:
-            # Parse translations (translate-toolkit does not care about
-            # languages here, it just picks first and second XML elements)
-            translations = {}
-            for node in unit.getlanguageNodes():
-                lang_code, text = get_node_data(unit, node)
-                if not lang_code or not text:
-                    continue
-                try:
-                    language = Language.objects.get_by_code(
-                        lang_code, lang_cache, langmap
-                    )
-                except Language.DoesNotExist as error:
-                    raise MemoryImportError(
-                        gettext("Could not find language %s!") % lang_code
-                    ) from error
-                translations[language.code] = text
-
-            try:
-                source = translations.pop(source_language.code)
-            except KeyError:
-                # Skip if source language is not present
-                continue
-
-            for lang, text in translations.items():
-                self.update_entry(
-                    source_language=source_language,
-                    target_language=Language.objects.get_by_code(
-                        lang, lang_cache, langmap
-                    ),
-                    source=source,
-                    target=text,
-                    origin=origin,
-                    context=unit.getcontext(),
-                    user=user,
-                    project=project,
-                    from_file=from_file,
-                    status=status,
-                    shared=False,
-                )
-                found += 1
+        if not found:
+            # Validate header also for files without units
+            get_source_language()
         return found
 
     def import_other_format(
@@ -842,6 +855,9 @@ class MemoryManager(models.Manager["Memory"]):
         # ruff: ignore[import-outside-top-level]
         from weblate.formats.auto import try_load
 
+        # ruff: ignore[import-outside-top-level]
+        from weblate.memory.importer import MemoryImporter
+
         lang_cache: dict[str, Language] = {}
         try:
             storage = try_load(origin, fileobj.read(), None, None)
@@ -873,23 +889,24 @@ class MemoryManager(models.Manager["Memory"]):
         source_language = get_language(storage.source_language or source_language)
         target_language = get_language(storage.language_code or target_language)
 
-        count = 0
-        for _unused, unit in storage.iterate_merge("", only_translated=True):
-            self.update_entry(
-                source_language=source_language,
-                target_language=target_language,
-                source=unit.source,
-                target=unit.target,
-                origin=origin,
-                context=unit.context,
-                user=user,
-                project=project,
-                from_file=from_file,
-                status=status,
-                shared=False,
-            )
-            count += 1
-        return count
+        def get_entries() -> Iterator[MemoryImportEntry]:
+            for _unused, unit in storage.iterate_merge("", only_translated=True):
+                yield {
+                    "source_language": source_language,
+                    "target_language": target_language,
+                    "source": unit.source,
+                    "target": unit.target,
+                    "context": unit.context,
+                }
+
+        importer = MemoryImporter(
+            origin=origin,
+            status=status,
+            user=user,
+            project=project,
+            from_file=from_file,
+        )
+        return importer.import_entries(get_entries())
 
     def update_entry(
         self,
@@ -9,18 +9,20 @@ from operator import itemgetter
 from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 from uuid import UUID
 
-from django.db import transaction
+from django.db import connections, transaction
 from django.db.models import Count, Min, Q, Value
 from django.db.models.functions import MD5
 from django.utils import timezone
 
 from weblate.machinery.base import get_machinery_language
+from weblate.memory.importer import MEMORY_SCOPE_TABLE, MEMORY_TABLE
 from weblate.memory.models import Memory, MemoryScope, MemoryScopeMigrationState
 from weblate.memory.utils import is_valid_memory_entry
 from weblate.utils.celery import app
 from weblate.utils.state import STATE_APPROVED, STATE_TRANSLATED
 
 if TYPE_CHECKING:
+    from django.db.backends.utils import CursorWrapper
     from django.db.models import QuerySet
 
     from weblate.auth.models import User
@@ -35,6 +37,17 @@ MEMORY_SCOPE_COMPACTION_BATCH_SIZE = 50000
 MEMORY_SCOPE_BACKFILL_STATE = "memory-scope-backfill"
 MEMORY_SCOPE_COMPACTION_STATE = "memory-scope-compaction"
 MEMORY_COMPONENT_BACKFILL_STATE = "memory-component-backfill"
+MEMORY_COMPACTION_TABLE = "memory_compaction"
+# Columns of the exact duplicate identity, see get_memory_duplicate_identity
+MEMORY_DUPLICATE_IDENTITY_COLUMNS = (
+    "source_language_id, target_language_id, source, target, origin, context, "
+    "status, legacy_from_file"
+)
+# Columns of the scope key, see get_memory_scope_key
+MEMORY_SCOPE_KEY_COLUMNS = (
+    "scope.scope, scope.project_id, scope.workspace_id, scope.source_project_id, "
+    "scope.user_id"
+)
 
 
 class MemoryUpdatePayload(TypedDict):
@@ -973,6 +986,235 @@ def compact_exact_memory_group(
     memory_objects.filter(id__in=duplicate_ids).delete()
 
 
+def collect_duplicate_memory_range(
+    cursor: CursorWrapper, last_memory_id: int, end_memory_id: int | None
+) -> None:
+    """
+    Collect exact duplicate groups with a member in the given id range.
+
+    The members are looked up through memory_md5_index and split into exact
+    identities using window functions, the oldest member of each group is
+    kept as the survivor.
+    """
+    range_condition = "id > %s"
+    params = [last_memory_id]
+    if end_memory_id is not None:
+        range_condition += " AND id <= %s"
+        params.append(end_memory_id)
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        CREATE TEMPORARY TABLE {MEMORY_COMPACTION_TABLE} ON COMMIT DROP AS
+        WITH candidate AS (
+            SELECT source_language_id, target_language_id,
+                   md5(origin) AS origin_md5,
+                   md5(source) AS source_md5,
+                   md5(target) AS target_md5
+              FROM {MEMORY_TABLE}
+             WHERE {range_condition}
+        ),
+        member AS (
+            SELECT id, {MEMORY_DUPLICATE_IDENTITY_COLUMNS}
+              FROM {MEMORY_TABLE}
+             WHERE id IN (
+                   SELECT memory.id
+                     FROM candidate
+                     JOIN {MEMORY_TABLE} AS memory
+                       ON md5(memory.origin) = candidate.origin_md5
+                      AND md5(memory.source) = candidate.source_md5
+                      AND md5(memory.target) = candidate.target_md5
+                      AND memory.source_language_id = candidate.source_language_id
+                      AND memory.target_language_id = candidate.target_language_id
+             )
+        ),
+        ranked AS (
+            SELECT id,
+                   min(id) OVER duplicate AS survivor_id,
+                   count(*) OVER duplicate AS group_size
+              FROM member
+            WINDOW duplicate AS (PARTITION BY {MEMORY_DUPLICATE_IDENTITY_COLUMNS})
+        )
+        SELECT id, survivor_id FROM ranked WHERE group_size > 1
+        """,
+        params,
+    )
+    # Temporary tables are not processed by autovacuum
+    cursor.execute(f"ANALYZE {MEMORY_COMPACTION_TABLE}")
+
+
+def materialize_duplicate_memory_scopes(cursor: CursorWrapper) -> None:
+    """Create scope rows for collected members still relying on legacy owners."""
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        SELECT id
+          FROM {MEMORY_COMPACTION_TABLE} AS compaction
+         WHERE NOT EXISTS (
+               SELECT 1
+                 FROM {MEMORY_SCOPE_TABLE} AS scope
+                WHERE scope.memory_id = compaction.id
+         )
+        """
+    )
+    memory_ids = [row[0] for row in cursor.fetchall()]
+    if not memory_ids:
+        return
+    memories = list(
+        Memory.objects.using("default")
+        .filter(id__in=memory_ids)
+        .select_related("legacy_project", "legacy_user")
+    )
+    set_scope_source_project_ids(memories)
+    MemoryScope.objects.db_manager("default").bulk_create_for_memories(memories)
+
+
+def merge_duplicate_memory_scopes(cursor: CursorWrapper) -> None:
+    """
+    Move scopes of the collected duplicates to their survivors.
+
+    Mirrors compact_exact_memory_group, scopes with a source component are
+    preferred and the oldest entry wins otherwise.
+    """
+    # Survivors gaining a second scope are owned by the scope rows only
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        UPDATE {MEMORY_TABLE}
+           SET legacy_project_id = NULL,
+               legacy_user_id = NULL,
+               legacy_shared = FALSE,
+               legacy_from_file = FALSE
+         WHERE id IN (
+               SELECT compaction.survivor_id
+                 FROM {MEMORY_COMPACTION_TABLE} AS compaction
+                 JOIN {MEMORY_SCOPE_TABLE} AS scope
+                   ON scope.memory_id = compaction.id
+                GROUP BY compaction.survivor_id
+               HAVING count(DISTINCT ROW({MEMORY_SCOPE_KEY_COLUMNS})) >= 2
+         )
+        """
+    )
+    # ruff: ignore[hardcoded-sql-expression]
+    preferred = f"""
+        SELECT DISTINCT ON (compaction.survivor_id, {MEMORY_SCOPE_KEY_COLUMNS})
+               compaction.survivor_id, {MEMORY_SCOPE_KEY_COLUMNS},
+               scope.source_component_id
+          FROM {MEMORY_COMPACTION_TABLE} AS compaction
+          JOIN {MEMORY_SCOPE_TABLE} AS scope ON scope.memory_id = compaction.id
+         WHERE compaction.id <> compaction.survivor_id
+         ORDER BY compaction.survivor_id, {MEMORY_SCOPE_KEY_COLUMNS},
+                  scope.source_component_id IS NULL, compaction.id, scope.id
+    """
+    same_scope = """
+        existing.scope = preferred.scope
+        AND existing.project_id IS NOT DISTINCT FROM preferred.project_id
+        AND existing.workspace_id IS NOT DISTINCT FROM preferred.workspace_id
+        AND existing.source_project_id IS NOT DISTINCT FROM preferred.source_project_id
+        AND existing.user_id IS NOT DISTINCT FROM preferred.user_id
+    """
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        UPDATE {MEMORY_SCOPE_TABLE} AS existing
+           SET source_component_id = preferred.source_component_id
+          FROM ({preferred}) AS preferred
+         WHERE existing.memory_id = preferred.survivor_id
+           AND existing.source_component_id IS NULL
+           AND preferred.source_component_id IS NOT NULL
+           AND {same_scope}
+        """
+    )
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        INSERT INTO {MEMORY_SCOPE_TABLE} (
+            memory_id, scope, project_id, workspace_id,
+            source_project_id, user_id, source_component_id
+        )
+        SELECT preferred.*
+          FROM ({preferred}) AS preferred
+         WHERE NOT EXISTS (
+               SELECT 1
+                 FROM {MEMORY_SCOPE_TABLE} AS existing
+                WHERE existing.memory_id = preferred.survivor_id AND {same_scope}
+         )
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def delete_duplicate_memories(cursor: CursorWrapper) -> None:
+    # Scope rows are removed first, the cascade is emulated by Django
+    for table, column in ((MEMORY_SCOPE_TABLE, "memory_id"), (MEMORY_TABLE, "id")):
+        cursor.execute(
+            # ruff: ignore[hardcoded-sql-expression]
+            f"""
+            DELETE FROM {table}
+             WHERE {column} IN (
+                   SELECT id
+                     FROM {MEMORY_COMPACTION_TABLE}
+                    WHERE id <> survivor_id
+             )
+            """
+        )
+
+
+def compact_duplicate_memory_range(last_memory_id: int, batch_size: int) -> int | None:
+    """
+    Compact exact duplicates of entries following the checkpoint.
+
+    Processes up to batch_size entries and returns the checkpoint for the next
+    batch, None is returned once all entries were processed. This has to be
+    called inside a transaction on the default database.
+    """
+    memory_ids = list(
+        Memory.objects.using("default")
+        .filter(id__gt=last_memory_id)
+        .order_by("id")
+        .values_list("id", flat=True)[batch_size - 1 : batch_size]
+    )
+    end_memory_id = memory_ids[0] if memory_ids else None
+    with connections["default"].cursor() as cursor:
+        collect_duplicate_memory_range(cursor, last_memory_id, end_memory_id)
+        materialize_duplicate_memory_scopes(cursor)
+        merge_duplicate_memory_scopes(cursor)
+        delete_duplicate_memories(cursor)
+        cursor.execute(f"DROP TABLE {MEMORY_COMPACTION_TABLE}")
+    return end_memory_id
+
+
+def compact_memory_scopes_bulk(batch_size: int) -> MemoryScopeMigrationState:
+    """
+    Run a single batch of set-based compaction.
+
+    The checkpoint is shared with compact_memory_scopes: groups whose oldest
+    member precedes it are already compacted in both modes.
+    """
+    with transaction.atomic(using="default"):
+        state, _created = (
+            MemoryScopeMigrationState.objects.using("default")
+            .select_for_update()
+            .get_or_create(
+                name=MEMORY_SCOPE_COMPACTION_STATE,
+                defaults={"completed": False, "updated": timezone.now()},
+            )
+        )
+        if state.completed:
+            return state
+        last_memory_id = compact_duplicate_memory_range(
+            state.last_memory_id, batch_size
+        )
+        if last_memory_id is None:
+            state.completed = True
+        else:
+            state.last_memory_id = last_memory_id
+        state.updated = timezone.now()
+        state.save(
+            using="default", update_fields=["completed", "last_memory_id", "updated"]
+        )
+    return state
+
+
 @app.task(trail=False)
 def cleanup_orphaned_memory(
     origin_prefix: str | None = None, batch_size: int = 1000
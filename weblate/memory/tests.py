@@ -30,6 +30,8 @@ from weblate.auth.data import SELECTION_ALL, SELECTION_MANUAL
 from weblate.auth.models import Group, Permission, Role
 from weblate.lang.data import FORMULA_WITH_ZERO
 from weblate.lang.models import Language, Plural
+from weblate.memory.export import zstd
+from weblate.memory.importer import MemoryTMXReader
 from weblate.memory.machine import WeblateMemory
 from weblate.memory.models import (
     MEMORY_LOOKUP_LIMIT,
@@ -40,7 +42,6 @@ from weblate.memory.models import (
     MemoryScope,
     MemoryScopeMigrationState,
     load_memory_json_data,
-    load_memory_tmx_store,
 )
 from weblate.memory.tasks import (
     MEMORY_COMPONENT_BACKFILL_STATE,
@@ -54,6 +55,7 @@ from weblate.memory.tasks import (
     backfill_memory_scopes,
     cleanup_orphaned_memory,
     compact_memory_scopes,
+    compact_memory_scopes_bulk,
     get_duplicate_memory_candidate_groups,
     get_group_matching_memory,
     handle_unit_translation_change,
@@ -138,12 +140,24 @@ class MemoryParserTest(SimpleTestCase):
                 Path(get_test_file("memory-invalid.json")).read_bytes()
             )
 
-    def test_load_memory_tmx_store(self) -> None:
-        store = load_memory_tmx_store(
+    def test_memory_tmx_reader_invalid_root(self) -> None:
+        reader = MemoryTMXReader(
+            BytesIO(b'<?xml version="1.0" encoding="UTF-8"?>\n<xliff></xliff>')
+        )
+
+        with self.assertRaises(SyntaxError):
+            list(reader.iterate_units())
+
+    def test_memory_tmx_reader(self) -> None:
+        reader = MemoryTMXReader(
             BytesIO(Path(get_test_file("memory.tmx")).read_bytes())
         )
 
-        self.assertEqual(len(list(store.units)), 1)
+        contexts = [unit.getcontext() for unit in reader.iterate_units()]
+
+        self.assertEqual(contexts, ["Context"])
+        assert reader.header is not None
+        self.assertEqual(reader.header.get("srclang"), "DE-DE")
 
     def test_import_tmx_missing_header(self) -> None:
         with self.assertRaisesMessage(
@@ -1368,6 +1382,24 @@ class MemoryModelTest(FixtureTestCase):
         assert scope is not None
         self.assertEqual(scope.memory.context, "Context")
 
+    def test_import_tmx_existing(self) -> None:
+        self.do_import_file_command_test(get_test_file("memory.tmx"), 2)
+        self.do_import_file_command_test(get_test_file("memory.tmx"), 2)
+        self.assertEqual(Memory.objects.count(), 2)
+
+        # Importing to a project only attaches the project scope
+        with Path(get_test_file("memory.tmx")).open("rb") as handle:
+            Memory.objects.import_file(
+                request=None, fileobj=handle, project=self.project
+            )
+        self.assertEqual(Memory.objects.count(), 2)
+        self.assertEqual(
+            MemoryScope.objects.filter(
+                scope=MemoryScope.SCOPE_PROJECT_FILE, project=self.project
+            ).count(),
+            2,
+        )
+
     def test_import_tmx2_command(self) -> None:
         self.do_import_file_command_test(get_test_file("memory2.tmx"), 1)
 
@@ -1439,6 +1471,37 @@ class MemoryModelTest(FixtureTestCase):
             ],
         )
 
+    def test_dump_command_filters(self) -> None:
+        add_document()
+        output = StringIO()
+        call_command("dump_memory", "--source-language", "cs", stdout=output)
+        self.assertEqual(json.loads(output.getvalue()), [])
+
+        output = StringIO()
+        call_command("dump_memory", "--scope", "shared", stdout=output)
+        self.assertEqual(json.loads(output.getvalue()), [])
+
+        output = StringIO()
+        call_command(
+            "dump_memory",
+            "--scope",
+            "global_file",
+            "--target-language",
+            "cs",
+            "--format",
+            "tmx",
+            stdout=output,
+        )
+        self.assertIn("<seg>Ahoj</seg>", output.getvalue())
+
+    def test_dump_command_compressed(self) -> None:
+        add_document()
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = Path(tempdir) / "memory.json.zst"
+            call_command("dump_memory", "--compress", "--output", filename)
+            data = json.loads(zstd.decompress(filename.read_bytes()))
+        self.assertEqual([entry["source"] for entry in data], ["Hello"])
+
     def test_dump_command_expands_compacted_project_scopes(self) -> None:
         other_project = Project.objects.create(
             name="Other dump project", slug="other-dump-project"
@@ -3381,6 +3444,109 @@ msgstr "Nazdar svete!\n"
             memory.scopes.filter(scope=MemoryScope.SCOPE_GLOBAL_FILE).exists()
         )
 
+    def test_compact_memory_command(self) -> None:
+        MemoryScopeMigrationState.objects.all().delete()
+        source_language = Language.objects.get(code="en")
+        target_language = Language.objects.get(code="cs")
+        values = {
+            "source_language": source_language,
+            "target_language": target_language,
+            "source": "Bulk compacted source",
+            "target": "Hromadne kompaktni cil",
+            "origin": self.component.full_slug,
+            "status": Memory.STATUS_ACTIVE,
+        }
+        project_entry = Memory.objects.create(legacy_project=self.project, **values)
+        user_entry = Memory.objects.create(legacy_user=self.user, **values)
+        shared_entry = Memory.objects.create(legacy_shared=True, **values)
+        MemoryScope.objects.filter(memory=shared_entry).delete()
+        context_entry = Memory.objects.create(
+            legacy_project=self.project, context="menu", **values
+        )
+        component_values = {
+            **values,
+            "source": "Bulk compacted component source",
+        }
+        first_entry = Memory.objects.create(**component_values)
+        second_entry = Memory.objects.create(**component_values)
+        MemoryScope.objects.create(
+            memory=first_entry,
+            scope=MemoryScope.SCOPE_PROJECT,
+            project=self.project,
+        )
+        MemoryScope.objects.create(
+            memory=second_entry,
+            scope=MemoryScope.SCOPE_PROJECT,
+            project=self.project,
+            source_component=self.component,
+        )
+
+        output = StringIO()
+        call_command("compact_memory", batch_size=2, stdout=output)
+
+        self.assertIn("Translation memory compaction completed", output.getvalue())
+        memory = Memory.objects.get(source=values["source"], context="")
+        self.assertEqual(memory.pk, project_entry.pk)
+        self.assertFalse(
+            Memory.objects.filter(pk__in=(user_entry.pk, shared_entry.pk)).exists()
+        )
+        self.assertTrue(Memory.objects.filter(pk=context_entry.pk).exists())
+        self.assertIsNone(memory.legacy_project_id)
+        self.assertEqual(
+            set(memory.scopes.values_list("scope", flat=True)),
+            {
+                MemoryScope.SCOPE_PROJECT,
+                MemoryScope.SCOPE_USER,
+                MemoryScope.SCOPE_SHARED,
+            },
+        )
+        memory = Memory.objects.get(source=component_values["source"])
+        self.assertEqual(memory.pk, first_entry.pk)
+        self.assertEqual(memory.scopes.get().source_component_id, self.component.id)
+        state = MemoryScopeMigrationState.objects.get(
+            name=MEMORY_SCOPE_COMPACTION_STATE
+        )
+        self.assertTrue(state.completed)
+
+    def test_compact_memory_scopes_bulk_saves_checkpoint(self) -> None:
+        source_language = Language.objects.get(code="en")
+        target_language = Language.objects.get(code="cs")
+        first_values = {
+            "source_language": source_language,
+            "target_language": target_language,
+            "source": "Checkpoint compacted source 1",
+            "target": "Kompaktni kontrolni cil 1",
+            "origin": self.component.full_slug,
+            "status": Memory.STATUS_ACTIVE,
+        }
+        second_values = {**first_values, "source": "Checkpoint compacted source 2"}
+        first = Memory.objects.create(legacy_project=self.project, **first_values)
+        duplicate = Memory.objects.create(legacy_shared=True, **first_values)
+        Memory.objects.create(legacy_project=self.project, **second_values)
+        Memory.objects.create(legacy_shared=True, **second_values)
+        MemoryScopeMigrationState.objects.update_or_create(
+            name=MEMORY_SCOPE_COMPACTION_STATE,
+            defaults={"completed": False, "last_memory_id": first.id - 1},
+        )
+
+        state = compact_memory_scopes_bulk(2)
+
+        self.assertFalse(state.completed)
+        self.assertEqual(state.last_memory_id, duplicate.id)
+        self.assertEqual(
+            Memory.objects.filter(source=first_values["source"]).count(), 1
+        )
+        self.assertEqual(
+            Memory.objects.filter(source=second_values["source"]).count(), 2
+        )
+
+        state = compact_memory_scopes_bulk(10)
+
+        self.assertTrue(state.completed)
+        self.assertEqual(
+            Memory.objects.filter(source=second_values["source"]).count(), 1
+        )
+
     def test_delete_scope_keeps_memory_ids_database_side(self) -> None:
         source_language = Language.objects.get(code="en")
         target_language = Language.objects.get(code="cs")
@@ -3932,10 +4098,10 @@ class MemoryViewTest(FixtureTestCase):
         )
 
         self.assertEqual(
-            [entry["source"] for entry in response.json()],
+            [entry["source"] for entry in json.loads(response.getvalue())],
             [memory.source],
         )
-        self.assertEqual(response.json()[0]["category"], 0)
+        self.assertEqual(json.loads(response.getvalue())[0]["category"], 0)
 
     def test_workspace_memory_delete_removes_only_workspace_scope(self) -> None:
         workspace, memory = self.create_workspace_memory()
@@ -4400,7 +4566,9 @@ class MemoryViewTest(FixtureTestCase):
 
         # Test download
         response = self.client.get(reverse(f"{prefix}memory-download", **kwargs))
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(
+            json.loads(response.getvalue()), load_schema("weblate-memory.schema.json")
+        )
 
         # Test download
         response = self.client.get(
@@ -4415,7 +4583,17 @@ class MemoryViewTest(FixtureTestCase):
         response = self.client.get(
             reverse(f"{prefix}memory-download", **kwargs), {"format": "json"}
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(
+            json.loads(response.getvalue()), load_schema("weblate-memory.schema.json")
+        )
+        response = self.client.get(
+            reverse(f"{prefix}memory-download", **kwargs),
+            {"format": "json", "compression": "zstd"},
+        )
+        validate(
+            json.loads(zstd.decompress(response.getvalue())),
+            load_schema("weblate-memory.schema.json"),
+        )
 
         # Test wipe
         count = Memory.objects.count()
@@ -4851,13 +5029,17 @@ class MemoryViewTest(FixtureTestCase):
             reverse("manage-memory-download"),
             {"format": "json", "kind": "all"},
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(
+            json.loads(response.getvalue()), load_schema("weblate-memory.schema.json")
+        )
         # Download shared entries
         response = self.client.get(
             reverse("manage-memory-download"),
             {"format": "json", "kind": "shared"},
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(
+            json.loads(response.getvalue()), load_schema("weblate-memory.schema.json")
+        )
 
     def test_shared_memory_download_uses_shared_category(self) -> None:
         self.user.is_superuser = True
@@ -4884,7 +5066,9 @@ class MemoryViewTest(FixtureTestCase):
             {"format": "json", "kind": "shared"},
         )
 
-        self.assertEqual(response.json()[0]["category"], CATEGORY_SHARED)
+        self.assertEqual(
+            json.loads(response.getvalue())[0]["category"], CATEGORY_SHARED
+        )
 
     def test_shared_memory_download_excludes_restricted_components(self) -> None:
         self.user.is_superuser = True
@@ -4913,7 +5097,10 @@ class MemoryViewTest(FixtureTestCase):
             {"format": "json", "kind": "shared"},
         )
 
-        self.assertNotIn(memory.source, {entry["source"] for entry in response.json()})
+        self.assertNotIn(
+            memory.source,
+            {entry["source"] for entry in json.loads(response.getvalue())},
+        )
 
     def test_global_memory_download_all_expands_compacted_scopes(self) -> None:
         self.user.is_superuser = True
@@ -4945,7 +5132,9 @@ class MemoryViewTest(FixtureTestCase):
             {"format": "json", "kind": "all"},
         )
         entries = [
-            entry for entry in response.json() if entry["source"] == memory.source
+            entry
+            for entry in json.loads(response.getvalue())
+            if entry["source"] == memory.source
         ]
 
         self.assertEqual(len(entries), 2)
@@ -4988,7 +5177,9 @@ class MemoryViewTest(FixtureTestCase):
             {"format": "json"},
         )
         entries = [
-            entry for entry in response.json() if entry["source"] == memory.source
+            entry
+            for entry in json.loads(response.getvalue())
+            if entry["source"] == memory.source
         ]
 
         self.assertEqual(len(entries), 1)
@@ -8,8 +8,8 @@ from typing import TYPE_CHECKING, NotRequired, TypedDict, cast
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.db.models import Count, Exists, OuterRef, Q
-from django.http import Http404, JsonResponse
-from django.shortcuts import get_object_or_404, render
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
@@ -18,6 +18,7 @@ from django.utils.translation import gettext, ngettext
 from django.views.generic.base import TemplateView
 
 from weblate.lang.models import Language
+from weblate.memory.export import encode_memory_export, iterate_memory_export
 from weblate.memory.forms import DeleteForm, UploadForm
 from weblate.memory.models import Memory, MemoryImportError, MemoryQuerySet, MemoryScope
 from weblate.memory.tasks import import_memory
@@ -558,20 +559,23 @@ class DownloadView(MemoryView):
                 )
                 category = None
         if fmt == "tmx":
-            response = render(
-                request,
-                "memory/dump.tmx",
-                {"data": data},
-                content_type="application/x-tmx",
-            )
+            content_type = "application/x-tmx"
         else:
             fmt = "json"
-            if category is None:
-                payload = [entry for item in data for entry in item.as_dicts()]
-            else:
-                payload = [item.as_dict(category=category) for item in data]
-            response = JsonResponse(payload, safe=False)
+            content_type = "application/json"
+        filename = f"weblate-memory.{fmt}"
+        compress = request.GET.get("compression") == "zstd"
+        if compress:
+            content_type = "application/zstd"
+            filename = f"{filename}.zst"
+        response = StreamingHttpResponse(
+            encode_memory_export(
+                iterate_memory_export(data, fmt=fmt, category=category),
+                compress=compress,
+            ),
+            content_type=content_type,
+        )
         response["Content-Disposition"] = content_disposition_header(
-            as_attachment=True, filename=f"weblate-memory.{fmt}"
+            as_attachment=True, filename=filename
         )
         return response
@@ -0,0 +1,35 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+from weblate.metrics.models import ContributionRollup
+from weblate.utils.management.base import BaseCommand
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    help = "aggregates daily contributions used by contributor reports"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Number of past days to aggregate",
+        )
+
+    def handle(self, *args, **options) -> None:
+        today = timezone.localdate()
+        for offset in range(options["days"], 0, -1):
+            date = today - timedelta(days=offset)
+            count = ContributionRollup.objects.rollup_day(date)
+            self.stdout.write(f"{date}: aggregated {count} contributions")
@@ -0,0 +1,114 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Generated by Django 6.0 on 2026-10-18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lang", "0007_alter_language_code"),
+        ("metrics", "0003_cleanup_category_language_metric_keys"),
+        ("trans", "0101_component_vcs_params"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContributionRollupDay",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True)),
+            ],
+            options={
+                "verbose_name": "Contribution rollup day",
+                "verbose_name_plural": "Contribution rollup days",
+            },
+        ),
+        migrations.CreateModel(
+            name="ContributionRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("bucket", models.CharField(max_length=10)),
+                ("count", models.IntegerField(default=0)),
+                ("chars", models.BigIntegerField(default=0)),
+                ("words", models.BigIntegerField(default=0)),
+                ("t_chars", models.BigIntegerField(default=0)),
+                ("t_words", models.BigIntegerField(default=0)),
+                ("edits", models.BigIntegerField(default=0)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "component",
+                    models.ForeignKey(
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="trans.component",
+                    ),
+                ),
+                (
+                    "language",
+                    models.ForeignKey(
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="lang.language",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="trans.project",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Contribution rollup",
+                "verbose_name_plural": "Contribution rollups",
+                "indexes": [
+                    models.Index(fields=["date"], name="metrics_rollup_date_idx"),
+                    models.Index(
+                        fields=["project", "date"], name="metrics_rollup_project_idx"
+                    ),
+                    models.Index(
+                        fields=["component", "date"],
+                        name="metrics_rollup_component_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
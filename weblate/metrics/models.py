@@ -5,12 +5,13 @@
 from __future__ import annotations
 
 import datetime
-from itertools import zip_longest
+from itertools import batched, zip_longest
 from typing import TYPE_CHECKING, TypedDict, cast
 
+from django.conf import settings
 from django.core.cache import cache
 from django.db import models, transaction
-from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models import Count, Exists, OuterRef, Q, Sum
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -30,6 +31,7 @@ from weblate.trans.models import (
     Translation,
 )
 from weblate.trans.models.change import Change, dt_as_day_range
+from weblate.trans.util import count_words
 from weblate.utils.decorators import disable_for_loaddata
 from weblate.utils.stats import (
     CategoryLanguage,
@@ -40,6 +42,8 @@ from weblate.utils.stats import (
 from weblate.workspaces.models import Workspace
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from weblate.trans.models.change import ChangeQuerySet
     from weblate.utils.stats import (
         BaseStats,
@@ -100,6 +104,24 @@ METRIC_ORDER = [
 ]
 
 
+USER_METRIC_AGGREGATES = {
+    "changes": Count("id"),
+    "comments": Count("id", filter=Q(action=ActionEvents.COMMENT)),
+    "suggestions": Count("id", filter=Q(action=ActionEvents.SUGGESTION)),
+    "translations": Count("id", filter=Q(action__in=Change.ACTIONS_CONTENT)),
+    "screenshots": Count(
+        "id",
+        filter=Q(
+            action__in=(
+                ActionEvents.SCREENSHOT_ADDED,
+                ActionEvents.SCREENSHOT_UPLOADED,
+            )
+        ),
+    ),
+}
+METRIC_BATCH_SIZE = 1000
+
+
 class ChangeMetricData(TypedDict):
     changes: int
     contributors: int
@@ -130,16 +152,15 @@ def get_change_metric_data(
     }
 
 
-def get_language_change_metric_data(
-    changes: ChangeQuerySet, date: datetime.date
+def get_grouped_change_metric_data(
+    changes: ChangeQuerySet, date: datetime.date, key: str
 ) -> dict[int, ChangeMetricData]:
-    """Calculate change metrics grouped by translation language."""
+    """Calculate change metrics grouped by given key using two queries."""
     active_user = Q(user__is_active=True, user__is_bot=False)
-    language_key = "translation__language_id"
     result: dict[int, ChangeMetricData] = {}
     for row in (
         changes.since_day(date - datetime.timedelta(days=30))
-        .values(language_key)
+        .values(key)
         .annotate(
             changes=Count(
                 "id",
@@ -149,28 +170,59 @@ def get_language_change_metric_data(
             ),
             contributors=Count("user", filter=active_user, distinct=True),
         )
+        .order_by()
     ):
-        language_id = row[language_key]
-        if language_id is not None:
-            result[language_id] = {
+        group_id = row[key]
+        if group_id is not None:
+            result[group_id] = {
                 "changes": row["changes"],
                 "contributors": row["contributors"],
                 "contributors_total": 0,
             }
     for row in (
         changes.filter(active_user)
-        .values(language_key)
+        .values(key)
         .annotate(contributors_total=Count("user", distinct=True))
+        .order_by()
     ):
-        language_id = row[language_key]
-        if language_id is not None:
-            result.setdefault(
-                language_id,
-                {"changes": 0, "contributors": 0, "contributors_total": 0},
-            )["contributors_total"] = row["contributors_total"]
+        group_id = row[key]
+        if group_id is not None:
+            result.setdefault(group_id, empty_change_metric_data())[
+                "contributors_total"
+            ] = row["contributors_total"]
     return result
 
 
+def get_language_change_metric_data(
+    changes: ChangeQuerySet, date: datetime.date
+) -> dict[int, ChangeMetricData]:
+    """Calculate change metrics grouped by translation language."""
+    return get_grouped_change_metric_data(changes, date, "translation__language_id")
+
+
+def empty_change_metric_data() -> ChangeMetricData:
+    return {"changes": 0, "contributors": 0, "contributors_total": 0}
+
+
+def get_user_metric_data(date: datetime.date) -> dict[int, dict[str, int]]:
+    """Calculate per-user change metrics for a day in a single query."""
+    return {
+        row.pop("user_id"): row
+        for row in Change.objects.filter_by_day(date - datetime.timedelta(days=1))
+        .filter(user__isnull=False)
+        .values("user_id")
+        .annotate(**USER_METRIC_AGGREGATES)
+        .order_by()
+    }
+
+
+def get_grouped_count(queryset: models.QuerySet, key: str) -> dict[int, int]:
+    """Count objects grouped by given key."""
+    return dict(
+        queryset.values(key).annotate(count=Count("id")).values_list(key, "count")
+    )
+
+
 class MetricQuerySet(models.QuerySet["Metric", "Metric"]):
     def filter_metric(
         self, scope: int, relation: int, secondary: int = 0
@@ -206,7 +258,7 @@ class MetricQuerySet(models.QuerySet["Metric", "Metric"]):
 
 
 class MetricManager(models.Manager["Metric"]):
-    def create_metrics(
+    def build_metric(
         self,
         data: dict,
         stats: BaseStats | None,
@@ -215,7 +267,7 @@ class MetricManager(models.Manager["Metric"]):
         relation: int,
         secondary: int = 0,
         date: datetime.date | None = None,
-    ):
+    ) -> Metric:
         if stats is not None:
             for key in keys:
                 data[key] = getattr(stats, key)
@@ -231,21 +283,75 @@ class MetricManager(models.Manager["Metric"]):
                 msg = f"Unsupported data: {data}"
                 raise ValueError(msg)
 
-        metric, created = self.get_or_create(
+        return Metric(
             scope=scope,
             relation=relation,
             secondary=secondary,
             date=date,
+            changes=changes,
+            data=db_data,
+        )
+
+    def create_metrics(
+        self,
+        data: dict,
+        stats: BaseStats | None,
+        keys: set,
+        scope: int,
+        relation: int,
+        secondary: int = 0,
+        date: datetime.date | None = None,
+    ):
+        new = self.build_metric(data, stats, keys, scope, relation, secondary, date)
+        metric, created = self.get_or_create(
+            scope=scope,
+            relation=relation,
+            secondary=secondary,
+            date=new.date,
             defaults={
-                "changes": changes,
-                "data": db_data,
+                "changes": new.changes,
+                "data": new.data,
             },
         )
-        if not created and not metric.data and db_data:
-            metric.data = db_data
+        if not created and not metric.data and new.data:
+            metric.data = new.data
             metric.save(update_fields=["data"])
         return metric
 
+    def bulk_create_metrics(self, metrics: Iterable[Metric]) -> int:
+        """
+        Store metrics in batches.
+
+        Follows semantics of :meth:`create_metrics`, existing metrics are kept
+        and only missing data is filled in.
+        """
+        count = 0
+        for batch in batched(metrics, METRIC_BATCH_SIZE):
+            existing = {
+                (scope, relation, secondary, date): (pk, data)
+                for pk, scope, relation, secondary, date, data in self.filter(
+                    scope__in={metric.scope for metric in batch},
+                    relation__in={metric.relation for metric in batch},
+                    date__in={metric.date for metric in batch},
+                ).values_list("pk", "scope", "relation", "secondary", "date", "data")
+            }
+            create: list[Metric] = []
+            update: list[Metric] = []
+            for metric in batch:
+                current = existing.get(
+                    (metric.scope, metric.relation, metric.secondary, metric.date)
+                )
+                if current is None:
+                    create.append(metric)
+                elif not current[1] and metric.data:
+                    metric.pk = current[0]
+                    update.append(metric)
+            with transaction.atomic():
+                self.bulk_create(create, ignore_conflicts=True)
+                self.bulk_update(update, ["data"])
+            count += len(batch)
+        return count
+
     def initialize_metrics(self, scope: int, relation: int, secondary: int = 0) -> None:
         today = timezone.now().date()
         self.bulk_create(
@@ -441,9 +547,16 @@ class MetricManager(models.Manager["Metric"]):
         )
 
     @transaction.atomic
-    def collect_project(self, project: Project, date: datetime.date | None = None):
+    def collect_project(
+        self,
+        project: Project,
+        date: datetime.date | None = None,
+        change_data: ChangeMetricData | None = None,
+    ):
         date = date or timezone.now().date()
         changes = project.change_set.all()
+        if change_data is None:
+            change_data = get_change_metric_data(changes, date)
         language_change_data = get_language_change_metric_data(changes, date)
         languages = prefetch_stats(
             [ProjectLanguage(project, language) for language in project.languages]
@@ -473,7 +586,7 @@ class MetricManager(models.Manager["Metric"]):
             "screenshots": Screenshot.objects.filter(
                 translation__component__project=project
             ).count(),
-            **get_change_metric_data(changes, date),
+            **change_data,
         }
         keys = [
             f"machinery-accounting:internal:{project.id}",
@@ -593,21 +706,7 @@ class MetricManager(models.Manager["Metric"]):
         date = date or timezone.now().date()
         data = user.change_set.filter_by_day(
             date - datetime.timedelta(days=1)
-        ).aggregate(
-            changes=Count("id"),
-            comments=Count("id", filter=Q(action=ActionEvents.COMMENT)),
-            suggestions=Count("id", filter=Q(action=ActionEvents.SUGGESTION)),
-            translations=Count("id", filter=Q(action__in=Change.ACTIONS_CONTENT)),
-            screenshots=Count(
-                "id",
-                filter=Q(
-                    action__in=(
-                        ActionEvents.SCREENSHOT_ADDED,
-                        ActionEvents.SCREENSHOT_UPLOADED,
-                    )
-                ),
-            ),
-        )
+        ).aggregate(**USER_METRIC_AGGREGATES)
         return self.create_metrics(
             data, None, set(), Metric.SCOPE_USER, user.pk, date=date
         )
@@ -629,6 +728,112 @@ class MetricManager(models.Manager["Metric"]):
             date=date,
         )
 
+    def collect_projects(self, projects: Iterable[Project], date: datetime.date) -> int:
+        """Collect metrics for projects with change metrics grouped upfront."""
+        change_data = get_grouped_change_metric_data(
+            Change.objects.all(), date, "project_id"
+        )
+        count = 0
+        for project in projects:
+            self.collect_project(
+                project,
+                date,
+                change_data.get(project.pk, empty_change_metric_data()),
+            )
+            count += 1
+        return count
+
+    def collect_components(
+        self, components: Iterable[Component], date: datetime.date
+    ) -> int:
+        """Collect metrics for components using grouped queries."""
+        change_data = get_grouped_change_metric_data(
+            Change.objects.all(), date, "component_id"
+        )
+        translations = get_grouped_count(Translation.objects.all(), "component_id")
+        screenshots = get_grouped_count(
+            Screenshot.objects.all(), "translation__component_id"
+        )
+        return self.bulk_create_metrics(
+            self.build_metric(
+                {
+                    "translations": translations.get(component.pk, 0),
+                    "screenshots": screenshots.get(component.pk, 0),
+                    **change_data.get(component.pk, empty_change_metric_data()),
+                },
+                component.stats,
+                SOURCE_KEYS,
+                Metric.SCOPE_COMPONENT,
+                component.pk,
+                date=date,
+            )
+            for component in components
+        )
+
+    def collect_translations(
+        self, translations: Iterable[Translation], date: datetime.date
+    ) -> int:
+        """Collect metrics for translations using grouped queries."""
+        change_data = get_grouped_change_metric_data(
+            Change.objects.all(), date, "translation_id"
+        )
+        screenshots = get_grouped_count(Screenshot.objects.all(), "translation_id")
+        return self.bulk_create_metrics(
+            self.build_metric(
+                {
+                    "screenshots": screenshots.get(translation.pk, 0),
+                    **change_data.get(translation.pk, empty_change_metric_data()),
+                },
+                translation.stats,
+                BASIC_KEYS,
+                Metric.SCOPE_TRANSLATION,
+                translation.pk,
+                date=date,
+            )
+            for translation in translations
+        )
+
+    def collect_users(self, user_ids: Iterable[int], date: datetime.date) -> int:
+        """Collect metrics for users from a single grouped query."""
+        user_data = get_user_metric_data(date)
+        empty = dict.fromkeys(USER_METRIC_AGGREGATES, 0)
+        return self.bulk_create_metrics(
+            self.build_metric(
+                dict(user_data.get(user_id, empty)),
+                None,
+                set(),
+                Metric.SCOPE_USER,
+                user_id,
+                date=date,
+            )
+            for user_id in user_ids
+        )
+
+    def collect_languages(
+        self, languages: Iterable[Language], date: datetime.date
+    ) -> int:
+        """Collect metrics for languages using grouped queries."""
+        change_data = get_grouped_change_metric_data(
+            Change.objects.all(), date, "language_id"
+        )
+        users = get_grouped_count(
+            Language.profile_set.through.objects.all(), "language_id"
+        )
+        return self.bulk_create_metrics(
+            self.build_metric(
+                {
+                    "users": users.get(language.pk, 0),
+                    **change_data.get(language.pk, empty_change_metric_data()),
+                },
+                language.stats,
+                SOURCE_KEYS,
+                Metric.SCOPE_LANGUAGE,
+                language.pk,
+                date=date,
+            )
+            for language in languages
+        )
+
 
 class Metric(models.Model):
     SCOPE_GLOBAL = 0
@@ -673,6 +878,186 @@ class Metric(models.Model):
         return self.dict_data.get(item, default)
 
 
+CONTRIBUTION_BUCKETS = {
+    ActionEvents.NEW: "new",
+    ActionEvents.APPROVE: "approve",
+}
+CONTRIBUTION_FIELDS = ("count", "chars", "words", "t_chars", "t_words", "edits")
+
+
+def get_contribution_bucket(action: int) -> str:
+    return CONTRIBUTION_BUCKETS.get(action, "edit")
+
+
+def get_change_contribution(change: Change) -> dict[str, int]:
+    """Calculate the amount of work done in a content change."""
+    unit = change.unit
+    if change.author is None or unit is None:
+        msg = "Content changes require both an author and a unit"
+        raise RuntimeError(msg)
+    return {
+        "count": 1,
+        "chars": len(unit.source),
+        "words": unit.num_words,
+        "t_chars": len(change.target),
+        "t_words": count_words(change.target, change.language),
+        "edits": change.get_distance(),
+    }
+
+
+class ContributionRollupManager(models.Manager["ContributionRollup"]):
+    @transaction.atomic
+    def rollup_day(self, date: datetime.date) -> int:
+        """
+        Aggregate content changes of a day.
+
+        The rollup is replaced if it already exists, so this can be used to
+        recalculate a day.
+        """
+        totals: dict[
+            tuple[int, int | None, int | None, int | None, str], list[int]
+        ] = {}
+        changes = (
+            Change.objects.content()
+            .filter(unit__isnull=False, author__isnull=False)
+            .filter_by_day(date)
+            .select_related("author", "language", "unit")
+        )
+        for change in changes.iterator(chunk_size=1000):
+            key = (
+                cast("int", change.author_id),
+                change.project_id,
+                change.component_id,
+                change.language_id,
+                get_contribution_bucket(change.action),
+            )
+            contribution = get_change_contribution(change)
+            current = totals.setdefault(key, [0] * len(CONTRIBUTION_FIELDS))
+            for index, field in enumerate(CONTRIBUTION_FIELDS):
+                current[index] += contribution[field]
+
+        self.filter(date=date).delete()
+        self.bulk_create(
+            [
+                ContributionRollup(
+                    date=date,
+                    author_id=author_id,
+                    project_id=project_id,
+                    component_id=component_id,
+                    language_id=language_id,
+                    bucket=bucket,
+                    **dict(zip(CONTRIBUTION_FIELDS, values, strict=True)),
+                )
+                for (
+                    author_id,
+                    project_id,
+                    component_id,
+                    language_id,
+                    bucket,
+                ), values in totals.items()
+            ],
+            batch_size=1000,
+        )
+        ContributionRollupDay.objects.get_or_create(date=date)
+        return len(totals)
+
+    def get_covered_days(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> list[datetime.date]:
+        """Return rolled up days which are completely within the range."""
+        return [
+            day
+            for day in ContributionRollupDay.objects.filter(
+                date__range=(
+                    timezone.localtime(start).date(),
+                    timezone.localtime(end).date(),
+                )
+            ).values_list("date", flat=True)
+            if start <= dt_as_day_range(day)[0] and dt_as_day_range(day)[1] <= end
+        ]
+
+    def get_totals(self, days: list[datetime.date], **filters):
+        """Sum the rollups per author and bucket."""
+        return (
+            self.filter(date__in=days, **filters)
+            .values(
+                "author__full_name",
+                "author__email",
+                "author__date_joined",
+                "bucket",
+            )
+            .annotate(**{field: Sum(field) for field in CONTRIBUTION_FIELDS})
+            .order_by()
+        )
+
+
+class ContributionRollup(models.Model):
+    """Daily sums of content changes used by contributor reports."""
+
+    date = models.DateField()
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.deletion.CASCADE, related_name="+"
+    )
+    project = models.ForeignKey(
+        "trans.Project",
+        null=True,
+        on_delete=models.deletion.CASCADE,
+        db_index=False,
+        related_name="+",
+    )
+    component = models.ForeignKey(
+        "trans.Component",
+        null=True,
+        on_delete=models.deletion.CASCADE,
+        db_index=False,
+        related_name="+",
+    )
+    language = models.ForeignKey(
+        "lang.Language",
+        null=True,
+        on_delete=models.deletion.CASCADE,
+        db_index=False,
+        related_name="+",
+    )
+    bucket = models.CharField(max_length=10)
+    count = models.IntegerField(default=0)
+    chars = models.BigIntegerField(default=0)
+    words = models.BigIntegerField(default=0)
+    t_chars = models.BigIntegerField(default=0)
+    t_words = models.BigIntegerField(default=0)
+    edits = models.BigIntegerField(default=0)
+
+    objects = ContributionRollupManager()
+
+    class Meta:
+        verbose_name = "Contribution rollup"
+        verbose_name_plural = "Contribution rollups"
+        # ruff: ignore[mutable-class-default]
+        indexes = [
+            models.Index(fields=["date"], name="metrics_rollup_date_idx"),
+            models.Index(fields=["project", "date"], name="metrics_rollup_project_idx"),
+            models.Index(
+                fields=["component", "date"], name="metrics_rollup_component_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date}:{self.author_id}:{self.component_id}:{self.bucket}"
+
+
+class ContributionRollupDay(models.Model):
+    """Days which have content changes aggregated in ContributionRollup."""
+
+    date = models.DateField(unique=True)
+
+    class Meta:
+        verbose_name = "Contribution rollup day"
+        verbose_name_plural = "Contribution rollup days"
+
+    def __str__(self) -> str:
+        return str(self.date)
+
+
 @receiver(post_save, sender=Project)
 @disable_for_loaddata
 def create_metrics_project(sender, instance, created=False, **kwargs) -> None:
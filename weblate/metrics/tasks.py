@@ -13,7 +13,7 @@ from django.utils import timezone
 
 from weblate.auth.models import User
 from weblate.lang.models import Language
-from weblate.metrics.models import Metric
+from weblate.metrics.models import ContributionRollup, Metric
 from weblate.trans.models import (
     Category,
     Component,
@@ -58,10 +58,9 @@ def collect_project_metrics(date_value: str) -> None:
     collection_date = _parse_date(date_value)
     started = time.monotonic()
     LOGGER.info("Collecting project metrics for %s", collection_date)
-    count = 0
-    for project in iter_prefetch_stats(Project.objects.all()):
-        Metric.objects.collect_project(project, collection_date)
-        count += 1
+    count = Metric.objects.collect_projects(
+        iter_prefetch_stats(Project.objects.all()), collection_date
+    )
     _log_finished("project", collection_date, count, started)
 
 
@@ -94,10 +93,9 @@ def collect_component_metrics(date_value: str) -> None:
     collection_date = _parse_date(date_value)
     started = time.monotonic()
     LOGGER.info("Collecting component metrics for %s", collection_date)
-    count = 0
-    for component in iter_prefetch_stats(Component.objects.all()):
-        Metric.objects.collect_component(component, collection_date)
-        count += 1
+    count = Metric.objects.collect_components(
+        iter_prefetch_stats(Component.objects.all()), collection_date
+    )
     _log_finished("component", collection_date, count, started)
 
 
@@ -118,10 +116,9 @@ def collect_translation_metrics(date_value: str) -> None:
     collection_date = _parse_date(date_value)
     started = time.monotonic()
     LOGGER.info("Collecting translation metrics for %s", collection_date)
-    count = 0
-    for translation in iter_prefetch_stats(Translation.objects.all()):
-        Metric.objects.collect_translation(translation, collection_date)
-        count += 1
+    count = Metric.objects.collect_translations(
+        iter_prefetch_stats(Translation.objects.all()), collection_date
+    )
     _log_finished("translation", collection_date, count, started)
 
 
@@ -130,10 +127,10 @@ def collect_user_metrics(date_value: str) -> None:
     collection_date = _parse_date(date_value)
     started = time.monotonic()
     LOGGER.info("Collecting user metrics for %s", collection_date)
-    count = 0
-    for user in User.objects.all().iterator(chunk_size=500):
-        Metric.objects.collect_user(user, collection_date)
-        count += 1
+    count = Metric.objects.collect_users(
+        User.objects.values_list("pk", flat=True).iterator(chunk_size=1000),
+        collection_date,
+    )
     _log_finished("user", collection_date, count, started)
 
 
@@ -142,10 +139,9 @@ def collect_language_metrics(date_value: str) -> None:
     collection_date = _parse_date(date_value)
     started = time.monotonic()
     LOGGER.info("Collecting language metrics for %s", collection_date)
-    count = 0
-    for language in iter_prefetch_stats(Language.objects.all()):
-        Metric.objects.collect_language(language, collection_date)
-        count += 1
+    count = Metric.objects.collect_languages(
+        iter_prefetch_stats(Language.objects.all()), collection_date
+    )
     _log_finished("language", collection_date, count, started)
 
 
@@ -185,6 +181,23 @@ def cleanup_metrics() -> None:
     ).update(data=None)
 
 
+@app.task(trail=False)
+def rollup_contributions(date_value: str | None = None) -> None:
+    """Aggregate content changes of a day, yesterday by default."""
+    if date_value is None:
+        rollup_date = timezone.localdate() - timedelta(days=1)
+    else:
+        rollup_date = _parse_date(date_value)
+    started = time.monotonic()
+    count = ContributionRollup.objects.rollup_day(rollup_date)
+    LOGGER.info(
+        "Rolled up %d contributions for %s in %.2f seconds",
+        count,
+        rollup_date,
+        time.monotonic() - started,
+    )
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
@@ -193,3 +206,8 @@ def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
         crontab(hour=23, minute=1), cleanup_metrics.s(), name="cleanup-metrics"
     )
+    sender.add_periodic_task(
+        crontab(hour=0, minute=5),
+        rollup_contributions.s(),
+        name="rollup-contributions",
+    )
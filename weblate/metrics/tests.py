@@ -169,6 +169,76 @@ class MetricTestCase(FixtureComponentTestCase):
         self.assertEqual(data, expected)
         self.assertEqual(language_data, expected)
 
+    def test_collect_bulk_matches_single(self) -> None:
+        Metric.objects.all().delete()
+        collection_date = timezone.now().date()
+        change = self.translation.change_set.create(
+            action=ActionEvents.COMMENT, user=self.user
+        )
+        Change.objects.filter(pk=change.pk).update(
+            timestamp=timezone.now() - timedelta(days=1)
+        )
+        scopes = (
+            (
+                Metric.SCOPE_TRANSLATION,
+                self.translation.pk,
+                Metric.objects.collect_translation,
+                Metric.objects.collect_translations,
+                self.translation,
+            ),
+            (
+                Metric.SCOPE_COMPONENT,
+                self.component.pk,
+                Metric.objects.collect_component,
+                Metric.objects.collect_components,
+                self.component,
+            ),
+            (
+                Metric.SCOPE_LANGUAGE,
+                self.translation.language_id,
+                Metric.objects.collect_language,
+                Metric.objects.collect_languages,
+                self.translation.language,
+            ),
+        )
+        for scope, relation, collect_single, collect_bulk, obj in scopes:
+            with self.subTest(scope=scope):
+                expected = collect_single(obj, collection_date)
+                expected.delete()
+                self.assertEqual(collect_bulk([obj], collection_date), 1)
+                metric = Metric.objects.get(
+                    scope=scope, relation=relation, date=collection_date
+                )
+                self.assertEqual(metric.changes, expected.changes)
+                self.assertEqual(metric.data, expected.data)
+
+        expected = Metric.objects.collect_user(self.user, collection_date)
+        self.assertEqual(expected.changes, 1)
+        expected.delete()
+        Metric.objects.collect_users([self.user.pk], collection_date)
+        metric = Metric.objects.get(
+            scope=Metric.SCOPE_USER, relation=self.user.pk, date=collection_date
+        )
+        self.assertEqual(metric.changes, expected.changes)
+        self.assertEqual(metric.data, expected.data)
+
+    def test_bulk_create_metrics_fills_data(self) -> None:
+        collection_date = timezone.now().date()
+        Metric.objects.filter(scope=Metric.SCOPE_TRANSLATION).delete()
+        Metric.objects.initialize_metrics(
+            scope=Metric.SCOPE_TRANSLATION, relation=self.translation.pk
+        )
+
+        Metric.objects.collect_translations([self.translation], collection_date)
+
+        metric = Metric.objects.get(
+            scope=Metric.SCOPE_TRANSLATION,
+            relation=self.translation.pk,
+            date=collection_date,
+        )
+        self.assertIsNotNone(metric.data)
+        self.assertEqual(metric["all"], self.translation.stats.all)
+
     def test_collect_workspace(self) -> None:
         workspace = Workspace.objects.create(name="Metrics workspace")
         self.project.workspace = workspace
@@ -0,0 +1,41 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from weblate.screenshots.models import Screenshot
+from weblate.screenshots.tasks import ocr_screenshot
+from weblate.utils.management.base import WeblateComponentCommand
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(WeblateComponentCommand):
+    help = "recognizes text in screenshots"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Recognize also screenshots with up-to-date text",
+        )
+
+    def handle(self, *args, **options) -> None:
+        screenshots = Screenshot.objects.filter(
+            translation__component__in=self.get_components(**options)
+        ).exclude(image="")
+        count = 0
+        # The tasks are processed in parallel by the Celery workers
+        for pk, image, ocr_image in screenshots.values_list(
+            "pk", "image", "ocr_image"
+        ).iterator():
+            if options["force"] or image != ocr_image:
+                ocr_screenshot.delay(pk, force=options["force"])
+                count += 1
+        self.stdout.write(f"Scheduled text recognition for {count} screenshots")
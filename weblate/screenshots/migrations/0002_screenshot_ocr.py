@@ -0,0 +1,28 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Generated by Django 6.0 on 2026-10-18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("screenshots", "0001_squashed_weblate_5"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="screenshot",
+            name="ocr_image",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=100
+            ),
+        ),
+        migrations.AddField(
+            model_name="screenshot",
+            name="ocr_lines",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
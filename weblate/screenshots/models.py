@@ -13,7 +13,6 @@ from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.db import models
-from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.urls import reverse
@@ -22,6 +21,7 @@ from django.utils.translation import gettext_lazy
 from weblate.auth.models import User
 from weblate.checks.flags import Flags
 from weblate.screenshots.fields import ScreenshotField
+from weblate.screenshots.ocr import recognize_image
 from weblate.trans.actions import ActionEvents
 from weblate.trans.alerts.registry import update_alerts
 from weblate.trans.mixins import UserDisplayMixin
@@ -43,17 +43,10 @@ class ScreenshotQuerySet(models.QuerySet["Screenshot", "Screenshot"]):
         return self.order_by("name")
 
     def filter_access(self, user: User):
-        result = self
-        if user.needs_project_filter:
-            result = result.filter(
-                user.get_project_access_query("translation__component__project")
-            )
-        if user.needs_component_restrictions_filter:
-            result = result.filter(
-                Q(translation__component__restricted=False)
-                | Q(translation__component_id__in=user.component_permissions)
-            )
-        return result
+        component_ids = user.allowed_component_ids
+        if component_ids is None:
+            return self
+        return self.filter(translation__component_id__in=component_ids)
 
 
 class Screenshot(models.Model, UserDisplayMixin):
@@ -81,6 +74,10 @@ class Screenshot(models.Model, UserDisplayMixin):
         on_delete=models.deletion.SET_NULL,
     )
 
+    # Image the recognized text lines belong to
+    ocr_image = models.CharField(max_length=100, blank=True, default="", editable=False)
+    ocr_lines = models.JSONField(default=list, blank=True, editable=False)
+
     objects = ScreenshotQuerySet.as_manager()
 
     class Meta:
@@ -118,6 +115,20 @@ class Screenshot(models.Model, UserDisplayMixin):
             raise TypeError(msg)
         field.run_validators(image)
 
+    @property
+    def needs_ocr(self) -> bool:
+        return bool(self.image.name) and self.ocr_image != self.image.name
+
+    def update_ocr(self) -> None:
+        """Recognize text in the image and store the recognized lines."""
+        image_name = self.image.name
+        self.ocr_lines = recognize_image(self.image.path, self.translation.language)
+        self.ocr_image = image_name
+        # Skip signals and do not overwrite result for a newly uploaded image
+        Screenshot.objects.filter(pk=self.pk, image=image_name).update(
+            ocr_image=self.ocr_image, ocr_lines=self.ocr_lines
+        )
+
     @property
     def filter_name(self) -> str:
         return f"screenshot:{Flags.format_value(self.name)}"
@@ -197,6 +208,17 @@ def update_alerts_on_screenshot_save(sender, instance: Screenshot, **kwargs) ->
     )
 
 
+@receiver(post_save, sender=Screenshot)
+@disable_for_loaddata
+def schedule_screenshot_ocr(sender, instance: Screenshot, **kwargs) -> None:
+    if instance.needs_ocr:
+        from weblate.screenshots.tasks import (  # ruff: ignore[import-outside-top-level]
+            ocr_screenshot,
+        )
+
+        ocr_screenshot.delay_on_commit(instance.pk)
+
+
 @receiver(post_delete, sender=Screenshot)
 def update_alerts_on_screenshot_delete(sender, instance: Screenshot, **kwargs) -> None:
     update_alerts(
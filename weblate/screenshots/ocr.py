@@ -0,0 +1,438 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Text recognition in screenshots."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager, suppress
+from time import sleep
+from typing import TYPE_CHECKING, TypedDict
+
+import httpx2
+from PIL import Image
+from rapidfuzz import fuzz, process
+
+from weblate.logger import LOGGER
+from weblate.utils.data import data_dir
+from weblate.utils.lock import WeblateLock
+from weblate.utils.requests import fetch_url
+from weblate.utils.tracing import start_span
+from weblate.utils.validators import PIL_FORMATS
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+    from tesserocr import PyTessBaseAPI
+
+    from weblate.lang.models import Language
+    from weblate.trans.models import Translation
+
+TESSERACT_LANGUAGES = {
+    "af": "afr",  # Afrikaans
+    "am": "amh",  # Amharic
+    "ar": "ara",  # Arabic
+    "as": "asm",  # Assamese
+    "az": "aze",  # Azerbaijani
+    "az@Cyrl": "aze_cyrl",  # Azerbaijani - Cyrillic
+    "be": "bel",  # Belarusian
+    "bn": "ben",  # Bengali
+    "bo": "bod",  # Tibetan
+    "bs": "bos",  # Bosnian
+    "bg": "bul",  # Bulgarian
+    "ca": "cat",  # Catalan; Valencian
+    "ceb": "ceb",  # Cebuano
+    "cs": "ces",  # Czech
+    "zh_Hans": "chi_sim",  # Chinese - Simplified
+    "zh_Hant": "chi_tra",  # Chinese - Traditional
+    "chr": "chr",  # Cherokee
+    "cy": "cym",  # Welsh
+    "da": "dan",  # Danish
+    "de": "deu",  # German
+    "dz": "dzo",  # Dzongkha
+    "el": "ell",  # Greek, Modern (1453-)
+    "en": "eng",  # English
+    "enm": "enm",  # English, Middle (1100-1500)
+    "eo": "epo",  # Esperanto
+    "et": "est",  # Estonian
+    "eu": "eus",  # Basque
+    "fa": "fas",  # Persian
+    "fi": "fin",  # Finnish
+    "fr": "fra",  # French
+    "frk": "frk",  # German Fraktur
+    "frm": "frm",  # French, Middle (ca. 1400-1600)
+    "ga": "gle",  # Irish
+    "gl": "glg",  # Galician
+    "grc": "grc",  # Greek, Ancient (-1453)
+    "gu": "guj",  # Gujarati
+    "ht": "hat",  # Haitian; Haitian Creole
+    "he": "heb",  # Hebrew
+    "hi": "hin",  # Hindi
+    "hr": "hrv",  # Croatian
+    "hu": "hun",  # Hungarian
+    "iu": "iku",  # Inuktitut
+    "id": "ind",  # Indonesian
+    "is": "isl",  # Icelandic
+    "it": "ita",  # Italian
+    #    "": "ita_old",  # Italian - Old
+    "jv": "jav",  # Javanese
+    "ja": "jpn",  # Japanese
+    "kn": "kan",  # Kannada
+    "ka": "kat",  # Georgian
+    #    "": "kat_old",  # Georgian - Old
+    "kk": "kaz",  # Kazakh
+    "km": "khm",  # Central Khmer
+    "ky": "kir",  # Kirghiz; Kyrgyz
+    "ko": "kor",  # Korean
+    "ku": "kur",  # Kurdish
+    "lo": "lao",  # Lao
+    "la": "lat",  # Latin
+    "lv": "lav",  # Latvian
+    "lt": "lit",  # Lithuanian
+    "ml": "mal",  # Malayalam
+    "mr": "mar",  # Marathi
+    "mk": "mkd",  # Macedonian
+    "mt": "mlt",  # Maltese
+    "ms": "msa",  # Malay
+    "my": "mya",  # Burmese
+    "ne": "nep",  # Nepali
+    "nl": "nld",  # Dutch; Flemish
+    "nb_NO": "nor",  # Norwegian
+    #    "": "ori",  # Oriya
+    "pa": "pan",  # Panjabi; Punjabi
+    "pl": "pol",  # Polish
+    "pt": "por",  # Portuguese
+    "ps": "pus",  # Pushto; Pashto
+    "ro": "ron",  # Romanian; Moldavian; Moldovan
+    "ru": "rus",  # Russian
+    "sa": "san",  # Sanskrit
+    "si": "sin",  # Sinhala; Sinhalese
+    "sk": "slk",  # Slovak
+    "sl": "slv",  # Slovenian
+    "es": "spa",  # Spanish; Castilian
+    #    "": "spa_old",  # Spanish; Castilian - Old
+    "sq": "sqi",  # Albanian
+    "sr": "srp",  # Serbian
+    "sr_Latn": "srp_latn",  # Serbian - Latin
+    "sw": "swa",  # Swahili
+    "sv": "swe",  # Swedish
+    "syr": "syr",  # Syriac
+    "ta": "tam",  # Tamil
+    "te": "tel",  # Telugu # codespell:ignore te
+    "tg": "tgk",  # Tajik
+    "tl": "tgl",  # Tagalog
+    "th": "tha",  # Thai # codespell:ignore tha
+    "ti": "tir",  # Tigrinya
+    "tr": "tur",  # Turkish
+    "ug": "uig",  # Uighur; Uyghur
+    "uk": "ukr",  # Ukrainian
+    "ur": "urd",  # Urdu
+    "uz_Latn": "uzb",  # Uzbek
+    "uz": "uzb_cyrl",  # Uzbek - Cyrillic
+    "vi": "vie",  # Vietnamese # codespell:ignore vie
+    "yi": "yid",  # Yiddish
+}
+
+TESSERACT_URL = "https://raw.githubusercontent.com/tesseract-ocr/tessdata_fast/main/{}"
+TESSERACT_DOWNLOAD_ATTEMPTS = 3
+TESSERACT_DOWNLOAD_TIMEOUT = 30
+# Number of idle Tesseract engines kept per language in each process
+TESSERACT_POOL_SIZE = 2
+# Source resolutions used for recognition, small text is found only at higher ones
+OCR_RESOLUTIONS = (72, 300)
+# Number of source string indexes kept in each process
+OCR_INDEX_CACHE_SIZE = 8
+
+TESSERACT_POOL: dict[tuple[str, str], list[PyTessBaseAPI]] = defaultdict(list)
+TESSERACT_POOL_LOCK = threading.Lock()
+OCR_INDEX_CACHE: OrderedDict[tuple[int, str, int], SourceStringIndex] = OrderedDict()
+OCR_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def is_retryable_tesseract_download_error(error: httpx2.HTTPError) -> bool:
+    if isinstance(
+        error,
+        (
+            httpx2.NetworkError,
+            httpx2.ProxyError,
+            httpx2.RemoteProtocolError,
+            httpx2.TimeoutException,
+        ),
+    ):
+        return True
+    if not isinstance(error, httpx2.HTTPStatusError):
+        return False
+    return error.response.status_code == 429 or error.response.status_code >= 500
+
+
+def download_tesseract_data(url: str, full_name: str) -> None:
+    temporary_name: str | None = None
+    try:
+        for attempt in range(1, TESSERACT_DOWNLOAD_ATTEMPTS + 1):
+            try:
+                with start_span(op="ocr.download", name=url):
+                    response = fetch_url(
+                        "GET",
+                        url,
+                        follow_redirects=True,
+                        timeout=TESSERACT_DOWNLOAD_TIMEOUT,
+                    )
+            except httpx2.HTTPError as error:
+                if (
+                    attempt == TESSERACT_DOWNLOAD_ATTEMPTS
+                    or not is_retryable_tesseract_download_error(error)
+                ):
+                    raise
+                LOGGER.warning(
+                    "Tesseract data download failed, retrying (%d/%d): %s",
+                    attempt,
+                    TESSERACT_DOWNLOAD_ATTEMPTS,
+                    error,
+                )
+                sleep(2 ** (attempt - 1))
+                continue
+
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(full_name),
+                prefix=f".{os.path.basename(full_name)}.",
+                delete=False,
+            ) as handle:
+                temporary_name = handle.name
+                handle.write(response.content)
+            os.replace(temporary_name, full_name)
+            temporary_name = None
+            return
+    finally:
+        if temporary_name is not None:
+            with suppress(FileNotFoundError):
+                os.unlink(temporary_name)
+
+
+def ensure_tesseract_language(lang: str) -> None:
+    """
+    Ensure that tesseract trained data is present for a language.
+
+    It also always includes eng (English) and osd (Orientation and script detection).
+    """
+    tessdata = data_dir("cache", "tesseract")
+
+    # Operate with a lock held to avoid concurrent downloads
+    with (
+        WeblateLock(
+            scope="screenshots:tesseract:download",
+            key=0,
+            slug="screenshots:tesseract:download",
+            timeout=600,
+        ),
+        start_span(op="ocr.models"),
+    ):
+        os.makedirs(tessdata, exist_ok=True)
+
+        for code in (lang, "eng", "osd"):
+            filename = f"{code}.traineddata"
+            full_name = os.path.join(tessdata, filename)
+            if os.path.exists(full_name):
+                continue
+
+            url = TESSERACT_URL.format(filename)
+
+            LOGGER.debug("downloading tesseract data %s", url)
+
+            download_tesseract_data(url, full_name)
+
+
+class OCRLine(TypedDict):
+    text: str
+    # Left, top, right and bottom edges in pixels
+    bbox: list[int]
+    resolution: int
+
+
+def ocr_get_lines(
+    api, *, image: Image.Image, filename: str, resolution: int = 72
+) -> Iterator[OCRLine]:
+    from tesserocr import RIL, iterate_level  # ruff: ignore[import-outside-top-level]
+
+    try:
+        api.SetImage(image)
+    except RuntimeError:
+        pass
+    else:
+        api.SetSourceResolution(resolution)
+
+        with start_span(op="ocr.recognize", name=filename):
+            api.Recognize()
+
+        with start_span(op="ocr.iterate", name=filename):
+            iterator = api.GetIterator()
+            level = RIL.TEXTLINE
+            for r in iterate_level(iterator, level):
+                with start_span(op="ocr.text", name=filename):
+                    try:
+                        text = r.GetUTF8Text(level)
+                    except RuntimeError:
+                        continue
+                    bbox = r.BoundingBox(level)
+                    yield {
+                        "text": text.strip(),
+                        "bbox": list(bbox) if bbox else [],
+                        "resolution": resolution,
+                    }
+    finally:
+        api.Clear()
+
+
+def ocr_get_strings(
+    api, *, image: Image.Image, filename: str, resolution: int = 72
+) -> Iterator[str]:
+    for line in ocr_get_lines(
+        api, image=image, filename=filename, resolution=resolution
+    ):
+        yield line["text"]
+
+
+def recognize_image(filename: str, language: Language) -> list[OCRLine]:
+    """
+    Recognize text lines in an image.
+
+    Unreadable images yield no lines, failures to get the Tesseract engine are
+    propagated.
+    """
+    try:
+        with Image.open(filename, formats=PIL_FORMATS) as image:
+            image.load()
+    except OSError as error:
+        LOGGER.warning("Skipping OCR for unreadable screenshot %s: %s", filename, error)
+        return []
+
+    try:
+        with get_tesseract(language) as api:
+            return [
+                line
+                for resolution in OCR_RESOLUTIONS
+                for line in ocr_get_lines(
+                    api, image=image, filename=filename, resolution=resolution
+                )
+            ]
+    finally:
+        image.close()
+
+
+def get_ocr_texts(lines: Iterable[OCRLine]) -> Iterator[str]:
+    """Extract text parts to match from recognized lines."""
+    for line in lines:
+        text = line["text"]
+        yield text
+        yield from text.split("|")
+        yield from text.split()
+
+
+class SourceStringIndex:
+    """
+    Source strings indexed for fuzzy matching of recognized text.
+
+    The similarity can only reach the cutoff for strings of a similar length,
+    so only these are compared.
+    """
+
+    cutoff = 90
+
+    def __init__(self, sources: dict[str, int]) -> None:
+        self.sources = sources
+        self.strings = sorted(sources, key=len)
+        self.lengths = [len(string) for string in self.strings]
+
+    def get_candidates(self, text: str) -> list[str]:
+        # Strings with length ratio outside of cutoff / (200 - cutoff) can not
+        # reach the cutoff, integer arithmetic avoids rounding issues
+        length = len(text)
+        shortest = -(-length * self.cutoff // (200 - self.cutoff))
+        longest = length * (200 - self.cutoff) // self.cutoff
+        return self.strings[
+            bisect_left(self.lengths, shortest) : bisect_right(self.lengths, longest)
+        ]
+
+    def match(self, texts: Iterable[str]) -> set[int]:
+        """Return IDs of units closely matching any of the texts."""
+        result: set[int] = set()
+        for text in set(texts):
+            matches = process.extract(
+                text,
+                self.get_candidates(text),
+                scorer=fuzz.ratio,
+                score_cutoff=self.cutoff,
+                limit=3,
+            )
+            result.update(self.sources[match] for match, _score, _position in matches)
+        return result
+
+
+def get_source_index(translation: Translation) -> SourceStringIndex:
+    units = translation.unit_set.all()
+    key = (translation.pk, translation.revision, units.count())
+    with OCR_INDEX_CACHE_LOCK:
+        if key in OCR_INDEX_CACHE:
+            OCR_INDEX_CACHE.move_to_end(key)
+            return OCR_INDEX_CACHE[key]
+    index = SourceStringIndex(dict(units.values_list("source", "pk")))
+    with OCR_INDEX_CACHE_LOCK:
+        OCR_INDEX_CACHE[key] = index
+        while len(OCR_INDEX_CACHE) > OCR_INDEX_CACHE_SIZE:
+            OCR_INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def get_tesseract_language(language: Language) -> str:
+    try:
+        return TESSERACT_LANGUAGES[language.code]
+    except KeyError:
+        return TESSERACT_LANGUAGES.get(language.base_code, "eng")
+
+
+@contextmanager
+def get_tesseract(language: Language) -> Generator[PyTessBaseAPI]:
+    """
+    Get Tesseract engine for a language.
+
+    Initializing the engine loads the trained data, so the engines are reused
+    from a per-process pool.
+    """
+    from tesserocr import (  # ruff: ignore[import-outside-top-level]
+        OEM,
+        PSM,
+        PyTessBaseAPI,
+    )
+
+    tess_language = get_tesseract_language(language)
+    path = f"{data_dir('cache', 'tesseract')}/"
+    key = (path, tess_language)
+
+    with TESSERACT_POOL_LOCK:
+        api = TESSERACT_POOL[key].pop() if TESSERACT_POOL[key] else None
+    if api is None:
+        ensure_tesseract_language(tess_language)
+        api = PyTessBaseAPI(
+            path=path,
+            psm=PSM.SPARSE_TEXT_OSD,
+            oem=OEM.LSTM_ONLY,
+            lang=tess_language,
+        )
+
+    try:
+        yield api
+    except BaseException:
+        # The engine might be in an inconsistent state
+        api.End()
+        raise
+    api.Clear()
+    with TESSERACT_POOL_LOCK:
+        if len(TESSERACT_POOL[key]) < TESSERACT_POOL_SIZE:
+            TESSERACT_POOL[key].append(api)
+            return
+    api.End()
@@ -5,9 +5,11 @@
 import os.path
 from typing import TYPE_CHECKING, cast
 
+import httpx2
 from celery.schedules import crontab
 from django.core.files.storage import DefaultStorage
 
+from weblate.logger import LOGGER
 from weblate.screenshots.models import Screenshot
 from weblate.utils.celery import app
 
@@ -29,6 +31,24 @@ def cleanup_screenshot_files() -> None:
             storage.delete(fullname)
 
 
+@app.task(trail=False)
+def ocr_screenshot(pk: int, force: bool = False) -> None:
+    """Recognize text in a screenshot."""
+    try:
+        screenshot = Screenshot.objects.select_related("translation__language").get(
+            pk=pk
+        )
+    except Screenshot.DoesNotExist:
+        return
+    if not force and not screenshot.needs_ocr:
+        return
+    try:
+        screenshot.update_ocr()
+    except httpx2.HTTPError as error:
+        # The screenshot stays pending and is recognized on the next search
+        LOGGER.warning("Could not download Tesseract data: %s", error)
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
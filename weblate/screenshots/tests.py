@@ -5,6 +5,7 @@
 import os.path
 import tempfile
 from difflib import get_close_matches
+from io import StringIO
 from itertools import chain
 from pathlib import Path
 from shutil import copyfile, rmtree
@@ -16,6 +17,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.db import connection
 from django.test import SimpleTestCase
 from django.test.utils import CaptureQueriesContext, override_settings
@@ -28,9 +30,10 @@ from rest_framework.test import APITestCase
 from weblate.auth.models import Group
 from weblate.lang.models import Language
 from weblate.screenshots.models import Screenshot
-from weblate.screenshots.views import (
+from weblate.screenshots.ocr import (
     TESSERACT_DOWNLOAD_ATTEMPTS,
     TESSERACT_DOWNLOAD_TIMEOUT,
+    SourceStringIndex,
     download_tesseract_data,
     ensure_tesseract_language,
     get_tesseract,
@@ -51,6 +54,24 @@ PUBLIC_GETADDRINFO = [(0, 0, 0, "", (PUBLIC_TEST_ADDRESS, 443))]
 PRIVATE_GETADDRINFO = [(0, 0, 0, "", (PRIVATE_TEST_ADDRESS, 443))]
 
 
+class SourceStringIndexTest(SimpleTestCase):
+    def test_match(self) -> None:
+        index = SourceStringIndex(
+            {"Hello, world!": 1, "Hello, world": 2, "Goodbye": 3, "H": 4}
+        )
+        self.assertEqual(index.match(["Hello, world!\n"]), {1, 2})
+        self.assertEqual(index.match(["Goodbye\n", "Unknown"]), {3})
+        self.assertEqual(index.match([]), set())
+
+    def test_candidates(self) -> None:
+        index = SourceStringIndex({"x" * length: length for length in range(1, 30)})
+        # Lengths 9 and 11 are exactly at the cutoff
+        self.assertEqual(
+            [len(string) for string in index.get_candidates("y" * 10)],
+            [9, 10, 11, 12],
+        )
+
+
 class ScreenshotImageValidationTest(SimpleTestCase):
     def test_rejects_invalid_extension(self) -> None:
         image = SimpleUploadedFile(
@@ -85,8 +106,8 @@ class TesseractDataTest(SimpleTestCase):
 
             with (
                 override_settings(CACHE_DIR=cache_dir),
-                patch("weblate.screenshots.views.WeblateLock"),
-                patch("weblate.screenshots.views.fetch_url") as fetch_url,
+                patch("weblate.screenshots.ocr.WeblateLock"),
+                patch("weblate.screenshots.ocr.fetch_url") as fetch_url,
             ):
                 ensure_tesseract_language("eng")
 
@@ -97,9 +118,9 @@ class TesseractDataTest(SimpleTestCase):
             tessdata = Path(cache_dir) / "tesseract"
             with (
                 override_settings(CACHE_DIR=cache_dir),
-                patch("weblate.screenshots.views.WeblateLock"),
-                patch("weblate.screenshots.views.os.makedirs") as makedirs,
-                patch("weblate.screenshots.views.download_tesseract_data"),
+                patch("weblate.screenshots.ocr.WeblateLock"),
+                patch("weblate.screenshots.ocr.os.makedirs") as makedirs,
+                patch("weblate.screenshots.ocr.download_tesseract_data"),
             ):
                 ensure_tesseract_language("eng")
 
@@ -112,7 +133,7 @@ class TesseractDataTest(SimpleTestCase):
             target = Path(cache_dir) / "eng.traineddata"
             with (
                 patch(
-                    "weblate.screenshots.views.fetch_url",
+                    "weblate.screenshots.ocr.fetch_url",
                     side_effect=[
                         httpx2.ReadError("connection reset", request=request),
                         httpx2.RemoteProtocolError(
@@ -122,7 +143,7 @@ class TesseractDataTest(SimpleTestCase):
                         response,
                     ],
                 ) as fetch_url,
-                patch("weblate.screenshots.views.sleep") as sleep,
+                patch("weblate.screenshots.ocr.sleep") as sleep,
             ):
                 download_tesseract_data("https://example.com/eng", str(target))
 
@@ -143,7 +164,7 @@ class TesseractDataTest(SimpleTestCase):
             target = Path(cache_dir) / "eng.traineddata"
             with (
                 patch(
-                    "weblate.screenshots.views.fetch_url",
+                    "weblate.screenshots.ocr.fetch_url",
                     side_effect=self.get_http_error(404),
                 ) as fetch_url,
                 self.assertRaises(httpx2.HTTPStatusError),
@@ -159,10 +180,10 @@ class TesseractDataTest(SimpleTestCase):
             target = Path(cache_dir) / "eng.traineddata"
             with (
                 patch(
-                    "weblate.screenshots.views.fetch_url",
+                    "weblate.screenshots.ocr.fetch_url",
                     side_effect=httpx2.TimeoutException("timed out"),
                 ) as fetch_url,
-                patch("weblate.screenshots.views.sleep"),
+                patch("weblate.screenshots.ocr.sleep"),
                 self.assertRaises(httpx2.TimeoutException),
             ):
                 download_tesseract_data("https://example.com/eng", str(target))
@@ -176,9 +197,9 @@ class TesseractDataTest(SimpleTestCase):
         with tempfile.TemporaryDirectory() as cache_dir:
             target = Path(cache_dir) / "eng.traineddata"
             with (
-                patch("weblate.screenshots.views.fetch_url", return_value=response),
+                patch("weblate.screenshots.ocr.fetch_url", return_value=response),
                 patch(
-                    "weblate.screenshots.views.os.replace",
+                    "weblate.screenshots.ocr.os.replace",
                     side_effect=OSError("No space left on device"),
                 ),
                 self.assertRaises(OSError),
@@ -933,6 +954,14 @@ class ViewTest(FixtureTestCase):
             matches, f"Could not find string in tesseract results: {result}"
         )
 
+    def test_tesseract_pool(self) -> None:
+        language = Language.objects.get(code="en")
+        with get_tesseract(language) as api:
+            pass
+        with get_tesseract(language) as second, get_tesseract(language) as third:
+            self.assertIs(second, api)
+            self.assertIsNot(third, api)
+
     def test_ocr(self) -> None:
         self.make_manager()
         self.do_upload()
@@ -954,6 +983,40 @@ class ViewTest(FixtureTestCase):
             "OCR recognition not working, no recognized strings found",
         )
 
+    def test_ocr_on_upload(self) -> None:
+        self.make_manager()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.do_upload()
+        screenshot = Screenshot.objects.all()[0]
+        self.assertFalse(screenshot.needs_ocr)
+        self.assertIn("Hello, world!", [line["text"] for line in screenshot.ocr_lines])
+        self.assertEqual(len(screenshot.ocr_lines[0]["bbox"]), 4)
+
+        # Stored text is used for the search
+        with patch("weblate.screenshots.ocr.get_tesseract") as mocked_tesseract:
+            response = self.client.post(
+                reverse("screenshot-js-ocr", kwargs={"pk": screenshot.pk})
+            )
+        mocked_tesseract.assert_not_called()
+        self.assertGreater(response.json()["count"], 0)
+
+    def test_ocr_command(self) -> None:
+        self.make_manager()
+        self.do_upload()
+        screenshot = Screenshot.objects.all()[0]
+        self.assertTrue(screenshot.needs_ocr)
+
+        output = StringIO()
+        call_command("ocr_screenshots", "--all", stdout=output)
+        self.assertIn("for 1 screenshots", output.getvalue())
+        screenshot.refresh_from_db()
+        self.assertFalse(screenshot.needs_ocr)
+        self.assertTrue(screenshot.ocr_lines)
+
+        output = StringIO()
+        call_command("ocr_screenshots", "--all", stdout=output)
+        self.assertIn("for 0 screenshots", output.getvalue())
+
     def test_ocr_truncated_image(self) -> None:
         self.make_manager()
         self.do_upload()
@@ -971,8 +1034,8 @@ class ViewTest(FixtureTestCase):
         )
 
         with (
-            patch("weblate.screenshots.views.Image.open", return_value=image),
-            patch("weblate.screenshots.views.get_tesseract") as mocked_tesseract,
+            patch("weblate.screenshots.ocr.Image.open", return_value=image),
+            patch("weblate.screenshots.ocr.get_tesseract") as mocked_tesseract,
             self.assertLogs("weblate", level="WARNING") as logs,
         ):
             response = self.client.post(
@@ -1005,9 +1068,9 @@ class ViewTest(FixtureTestCase):
         image.__exit__.side_effect = close_and_propagate
 
         with (
-            patch("weblate.screenshots.views.Image.open", return_value=image),
+            patch("weblate.screenshots.ocr.Image.open", return_value=image),
             patch(
-                "weblate.screenshots.views.get_tesseract",
+                "weblate.screenshots.ocr.get_tesseract",
                 side_effect=OSError("No space left on device"),
             ),
             self.assertRaises(OSError),
@@ -1023,7 +1086,7 @@ class ViewTest(FixtureTestCase):
 
         with (
             patch(
-                "weblate.screenshots.views.get_tesseract",
+                "weblate.screenshots.ocr.get_tesseract",
                 side_effect=httpx2.TimeoutException("timed out"),
             ),
             self.assertLogs("weblate", level="WARNING") as logs,
@@ -77,7 +77,7 @@ from weblate.trans.models import (
 )
 from weblate.utils.data import data_path
 from weblate.utils.files import remove_tree
-from weblate.utils.hash import checksum_to_hash, hash_to_checksum
+from weblate.utils.hash import checksum_to_hash
 from weblate.utils.validators import validate_filename
 from weblate.utils.version import VERSION
 from weblate.utils.zip import (
@@ -92,7 +92,7 @@ from weblate.utils.zip import (
 from weblate.vcs.models import VCS_REGISTRY
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from zipfile import ZipInfo
 
     from django.core.files.storage import Storage
@@ -702,6 +702,28 @@ class ProjectBackup:
         with backupzip.open(target, "w") as handle:
             handle.write(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
 
+    def backup_json_stream(
+        self,
+        backupzip: ZipFile,
+        data: dict,
+        target: str,
+        key: str,
+        items: Iterable[BackupValue],
+    ) -> None:
+        """Write JSON object with one list written incrementally as it is generated."""
+        # The size is not known upfront, so the member can grow beyond zip64 limit
+        with backupzip.open(target, "w", force_zip64=True) as handle:
+            head = json.dumps(data, ensure_ascii=False, indent=2)
+            # Reopen the object to append the generated list
+            handle.write(f"{head[:-2]},\n  {json.dumps(key)}: [".encode())
+            separator = "\n    "
+            for item in items:
+                handle.write(
+                    f"{separator}{json.dumps(item, ensure_ascii=False)}".encode()
+                )
+                separator = ",\n    "
+            handle.write(b"\n  ]\n}")
+
     def generate_filename(self, project: Project) -> None:
         # Create directory
         backup_dir = data_path(PROJECTBACKUP_PREFIX) / f"{project.pk}"
@@ -733,6 +755,96 @@ class ProjectBackup:
             Path(self.filename).relative_to(data_path(PROJECTBACKUP_PREFIX)).as_posix()
         )
 
+    def backup_units(
+        self, component: Component, component_data: dict[str, BackupValue]
+    ) -> Iterator[dict[str, BackupValue]]:
+        """
+        Generate backup of component units.
+
+        The related objects are prefetched for each chunk of units and the
+        chunks are validated separately, so the memory usage does not grow
+        with the component size.
+        """
+        unit_schema = self.component_schema["properties"]["units"]["items"]
+        unit_properties = unit_schema["properties"]
+        suggestion_schema = unit_properties["suggestions"]["items"]
+        units = (
+            Unit.objects.filter(translation__component=component)
+            .order_by("pk")
+            .prefetch_related(
+                Prefetch(
+                    "comment_set", queryset=Comment.objects.select_related("user")
+                ),
+                Prefetch(
+                    "suggestion_set",
+                    queryset=Suggestion.objects.select_related("user").prefetch_related(
+                        Prefetch(
+                            "vote_set", queryset=Vote.objects.select_related("user")
+                        )
+                    ),
+                ),
+                "check_set",
+                "labels",
+            )
+        )
+        extras: dict[str, Callable[[Any], object]] = {
+            "id_hash": lambda obj: obj.checksum,
+            "comments": lambda obj: [
+                self.backup_object(
+                    comment, unit_properties["comments"]["items"]["required"]
+                )
+                for comment in obj.comment_set.all()
+            ],
+            "suggestions": lambda obj: [
+                self.backup_object(
+                    suggestion,
+                    suggestion_schema["required"],
+                    extras={
+                        "votes": lambda obj: [
+                            self.backup_object(
+                                vote,
+                                suggestion_schema["properties"]["votes"]["items"][
+                                    "required"
+                                ],
+                            )
+                            for vote in obj.vote_set.all()
+                        ],
+                    },
+                )
+                for suggestion in obj.suggestion_set.all()
+            ],
+            "checks": lambda obj: [
+                self.backup_object(
+                    check, unit_properties["checks"]["items"]["required"]
+                )
+                for check in obj.check_set.all()
+            ],
+            "labels": lambda obj: [label.name for label in obj.labels.all()],
+        }
+        chunk: list[dict[str, BackupValue]] = []
+        for unit in units.iterator(chunk_size=self.IMPORT_BATCH_SIZE):
+            chunk.append(self.backup_object(unit, unit_schema["required"], extras))
+            if len(chunk) >= self.IMPORT_BATCH_SIZE:
+                self.validate_units_chunk(component_data, chunk)
+                yield from chunk
+                chunk = []
+        self.validate_units_chunk(component_data, chunk)
+        yield from chunk
+
+    @staticmethod
+    def validate_units_chunk(
+        component_data: dict[str, BackupValue], chunk: list[dict[str, BackupValue]]
+    ) -> None:
+        validate_schema(
+            {
+                "component": component_data,
+                "translations": [],
+                "units": chunk,
+                "screenshots": [],
+            },
+            "weblate-component.schema.json",
+        )
+
     def backup_component(self, backupzip: ZipFile, component: Component) -> None:
         component_fields = self.extend_fields(
             self.component_schema["properties"]["component"]["required"],
@@ -752,67 +864,6 @@ class ProjectBackup:
                 )
                 for translation in component.translation_set.iterator()
             ],
-            "units": [
-                self.backup_object(
-                    unit,
-                    self.component_schema["properties"]["units"]["items"]["required"],
-                    extras={
-                        "id_hash": lambda obj: obj.checksum,
-                        "comments": lambda obj: [
-                            self.backup_object(
-                                comment,
-                                self.component_schema["properties"]["units"]["items"][
-                                    "properties"
-                                ]["comments"]["items"]["required"],
-                            )
-                            for comment in obj.comment_set.prefetch_related("user")
-                        ],
-                        "suggestions": lambda obj: [
-                            self.backup_object(
-                                suggestion,
-                                self.component_schema["properties"]["units"]["items"][
-                                    "properties"
-                                ]["suggestions"]["items"]["required"],
-                                extras={
-                                    "votes": lambda obj: [
-                                        self.backup_object(
-                                            vote,
-                                            self.component_schema["properties"][
-                                                "units"
-                                            ]["items"]["properties"]["suggestions"][
-                                                "items"
-                                            ]["properties"]["votes"]["items"][
-                                                "required"
-                                            ],
-                                        )
-                                        for vote in Vote.objects.filter(
-                                            suggestion=obj
-                                        ).select_related("user")
-                                    ],
-                                },
-                            )
-                            for suggestion in obj.suggestion_set.prefetch_related(
-                                "user"
-                            )
-                        ],
-                        "checks": lambda obj: [
-                            self.backup_object(
-                                check,
-                                self.component_schema["properties"]["units"]["items"][
-                                    "properties"
-                                ]["checks"]["items"]["required"],
-                            )
-                            for check in obj.check_set.all()
-                        ],
-                        "labels": lambda obj: list(
-                            obj.labels.values_list("name", flat=True)
-                        ),
-                    },
-                )
-                for unit in Unit.objects.filter(
-                    translation__component=component
-                ).iterator()
-            ],
             "pending_unit_changes": [
                 self.backup_object(
                     pending_unit_change,
@@ -849,8 +900,7 @@ class ProjectBackup:
                     ],
                     extras={
                         "units": lambda obj: [
-                            hash_to_checksum(id_hash)
-                            for id_hash in obj.units.values_list("id_hash", flat=True)
+                            unit.checksum for unit in obj.units.all()
                         ],
                     },
                 )
@@ -863,11 +913,14 @@ class ProjectBackup:
                 os.path.join("screenshots", os.path.basename(image_name)),
             )
 
-        validate_schema(data, "weblate-component.schema.json")
-        self.backup_json(
+        # Units are validated in chunks while writing
+        validate_schema({**data, "units": []}, "weblate-component.schema.json")
+        self.backup_json_stream(
             backupzip,
             data,
             f"{self.COMPONENTS_PREFIX}{self.full_slug_without_project(component)}.json",
+            "units",
+            self.backup_units(component, data["component"]),
         )
 
         # Store VCS repo in case it is present
@@ -1584,6 +1637,8 @@ class ProjectBackup:
             restored = 0
             components = self.list_components(zipfile)
             total = len(components)
+            if progress_callback is not None:
+                progress_callback(restored, total)
             for component in components:
                 processed = self.load_component(
                     zipfile,
@@ -1878,51 +1933,50 @@ class ProjectBackup:
             )
 
     def restore_unit_metadata(self, units: list[Unit]) -> None:
+        """Restore labels, comments, checks, and suggestions for a batch of units."""
+        labels = []
+        comments = []
+        checks = []
+        suggestions = []
+        suggestion_votes = []
         for unit in units:
-            # Labels
-            unit.labels.through.objects.bulk_create(
-                unit.labels.through(unit=unit, label=self.labels_map[label])
-                for label in unit.import_data["labels"]
+            import_data = unit.import_data
+            labels.extend(
+                Unit.labels.through(unit=unit, label=self.labels_map[label])
+                for label in import_data["labels"]
             )
-
-            # Comments
-            if unit.import_data["comments"]:
-                Comment.objects.bulk_create(
-                    Comment(unit=unit, **self.restore_with_user(comment))
-                    for comment in unit.import_data["comments"]
-                )
-
-            # Checks
-            if unit.import_data["checks"]:
-                Check.objects.bulk_create(
-                    Check(unit=unit, **check) for check in unit.import_data["checks"]
-                )
-
-            # Suggestions
-            if unit.import_data["suggestions"]:
-                suggestions = Suggestion.objects.bulk_create(
+            comments.extend(
+                Comment(unit=unit, **self.restore_with_user(comment))
+                for comment in import_data["comments"]
+            )
+            checks.extend(Check(unit=unit, **check) for check in import_data["checks"])
+            for suggestion in import_data["suggestions"]:
+                suggestions.append(
                     Suggestion(
                         unit=unit, **self.restore_with_user(suggestion, remove="votes")
                     )
-                    for suggestion in unit.import_data["suggestions"]
                 )
-                suggestion_data = {
-                    item["target"]: item for item in unit.import_data["suggestions"]
-                }
-                for suggestion in suggestions:
-                    if suggestion_data[suggestion.target]["votes"]:
-                        # Ignore conflicts here as more users can be mapped to anonymous
-                        # in restore_user().
-                        Vote.objects.bulk_create(
-                            [
-                                Vote(
-                                    suggestion=suggestion,
-                                    **self.restore_with_user(vote),
-                                )
-                                for vote in suggestion_data[suggestion.target]["votes"]
-                            ],
-                            ignore_conflicts=True,
-                        )
+                suggestion_votes.append(suggestion["votes"])
+
+        Unit.labels.through.objects.bulk_create(
+            labels, batch_size=self.IMPORT_BATCH_SIZE
+        )
+        Comment.objects.bulk_create(comments, batch_size=self.IMPORT_BATCH_SIZE)
+        Check.objects.bulk_create(checks, batch_size=self.IMPORT_BATCH_SIZE)
+        suggestions = Suggestion.objects.bulk_create(
+            suggestions, batch_size=self.IMPORT_BATCH_SIZE
+        )
+        # Ignore conflicts here as more users can be mapped to anonymous
+        # in restore_user().
+        Vote.objects.bulk_create(
+            [
+                Vote(suggestion=suggestion, **self.restore_with_user(vote))
+                for suggestion, votes in zip(suggestions, suggestion_votes, strict=True)
+                for vote in votes
+            ],
+            batch_size=self.IMPORT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
 
     def clear_unit_import_data(self, units: list[Unit]) -> None:
         for unit in units:
@@ -2323,12 +2377,15 @@ class ProjectBackup:
         workspace: Workspace | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> Project:
+        """
+        Restore project from the backup.
+
+        The archive is validated for the target project first, there is no need
+        to call :meth:`validate` upfront.
+        """
         if not self.filename:
             msg = "Need a filename string."
             raise ValueError(msg)
-        if not self.validated:
-            msg = "Project backup has to be validated before restore."
-            raise ValueError(msg)
 
         self.skipped_components.clear()
         self.created_media.clear()
@@ -2350,6 +2407,7 @@ class ProjectBackup:
                 target_project_slug=project_slug,
                 validate_roles=True,
             )
+            self.validated = True
             project_path_created = False
             try:
                 project_path.mkdir(parents=True, exist_ok=False)
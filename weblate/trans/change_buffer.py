@@ -0,0 +1,94 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from weblate.memory.tasks import MemoryUpdatePayload
+    from weblate.trans.models import Change
+
+CHANGE_BUFFER_BATCH_SIZE = 500
+
+CURRENT_CHANGE_BUFFER: ContextVar[ChangeBuffer | None] = ContextVar(
+    "current_change_buffer", default=None
+)
+
+
+class ChangeBuffer:
+    """
+    Collects changes created during a bulk operation.
+
+    The changes are inserted at once when leaving the buffer, so the
+    notifications and add-on events are dispatched once for all of them.
+    Translation memory updates are scheduled in batches as well.
+    """
+
+    def __init__(self) -> None:
+        self.changes: list[Change] = []
+        self.memory_updates: list[MemoryUpdatePayload] = []
+        self.contributors: set[tuple[int, int]] = set()
+
+    def add_change(self, change: Change) -> None:
+        self.changes.append(change)
+
+    def add_changes(self, changes: Iterable[Change]) -> None:
+        self.changes.extend(changes)
+
+    def add_memory_update(self, payload: MemoryUpdatePayload) -> None:
+        self.memory_updates.append(payload)
+
+    def add_contributor(self, translation_id: int, user_id: int) -> bool:
+        """Track contributor, returns whether it was not seen in this buffer."""
+        key = (translation_id, user_id)
+        if key in self.contributors:
+            return False
+        self.contributors.add(key)
+        return True
+
+    def flush(self) -> None:
+        # ruff: ignore[import-outside-top-level]
+        from weblate.memory.tasks import schedule_memory_updates
+
+        # ruff: ignore[import-outside-top-level]
+        from weblate.trans.models import Change
+
+        changes, self.changes = self.changes, []
+        if changes:
+            Change.objects.bulk_create(changes, batch_size=CHANGE_BUFFER_BATCH_SIZE)
+
+        memory_updates, self.memory_updates = self.memory_updates, []
+        if memory_updates:
+            schedule_memory_updates(memory_updates)
+
+
+def get_current_change_buffer() -> ChangeBuffer | None:
+    return CURRENT_CHANGE_BUFFER.get()
+
+
+@contextmanager
+def change_buffer() -> Generator[ChangeBuffer, None, None]:
+    """
+    Buffer changes until the end of the block.
+
+    Nested blocks reuse the outer buffer, which is flushed once it is left.
+    Nothing is stored when the block raises an exception as the surrounding
+    transaction is expected to be rolled back.
+    """
+    current = CURRENT_CHANGE_BUFFER.get()
+    if current is not None:
+        yield current
+        return
+    buffer = ChangeBuffer()
+    token = CURRENT_CHANGE_BUFFER.set(buffer)
+    try:
+        yield buffer
+    finally:
+        CURRENT_CHANGE_BUFFER.reset(token)
+    buffer.flush()
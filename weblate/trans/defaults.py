@@ -15,7 +15,9 @@ DEFAULT_PAGE_LIMIT = 100
 DEFAULT_NEARBY_MESSAGES = 15
 DEFAULT_SIMILAR_MESSAGES = 5
 DEFAULT_COMMIT_PENDING_HOURS = 24
+DEFAULT_COMMIT_PENDING_WORKERS = 4
 DEFAULT_AUTO_UPDATE = False
+DEFAULT_AUTO_UPDATE_HOST_CONCURRENCY = 4
 
 DEFAULT_AUTOFIX_LIST: tuple[str, ...] = (
     "weblate.trans.autofixes.whitespace.SameBookendingWhitespace",
@@ -141,6 +143,10 @@ DEFAULT_FONTS_CDN_URL = None
 DEFAULT_PROJECT_BACKUP_KEEP_DAYS = 30
 DEFAULT_PROJECT_BACKUP_KEEP_COUNT = 3
 DEFAULT_REPORT_EXPIRY = 90
+DEFAULT_CHANGE_PARTITION_MONTHS_AHEAD = 3
+DEFAULT_CHANGE_ARCHIVE_MONTHS = 0
+DEFAULT_CHANGE_ARCHIVE_SCHEMA = "weblate_archive"
+DEFAULT_CHANGE_ARCHIVE_TABLESPACE = ""
 DEFAULT_PROJECT_BACKUP_IMPORT_MAX_MEMBERS = 100_000
 DEFAULT_PROJECT_BACKUP_IMPORT_MAX_TOTAL_UNCOMPRESSED_SIZE = 512 * 1024 * 1024
 DEFAULT_PROJECT_BACKUP_IMPORT_MAX_COMPRESSED_ENTRY_SIZE = 250 * 1024 * 1024
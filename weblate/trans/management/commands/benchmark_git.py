@@ -0,0 +1,55 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from weblate.utils.management.base import WeblateComponentCommand
+from weblate.vcs.git import GitRepository
+from weblate.vcs.gitbatch import GitBatchObjectReader, GitObjectReader
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(WeblateComponentCommand):
+    help = "compares performance of Git object readers"
+    needs_repo = True
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Number of times to read each file",
+        )
+
+    def handle(self, *args, **options) -> None:
+        for component in self.get_components(*args, **options):
+            repository = component.repository
+            if not isinstance(repository, GitRepository):
+                self.stderr.write(f"{component}: not a Git repository, skipping")
+                continue
+            filenames = list(
+                component.translation_set.exclude(filename="").values_list(
+                    "filename", flat=True
+                )
+            )
+            for reader_class in (GitObjectReader, GitBatchObjectReader):
+                repository.object_reader = repository.get_object_reader(reader_class)
+                started = time.monotonic()
+                for _iteration in range(options["iterations"]):
+                    revision = repository.get_last_revision()
+                    for filename in filenames:
+                        repository.get_file(filename, revision)
+                elapsed = time.monotonic() - started
+                repository.object_reader.close()
+                self.stdout.write(
+                    f"{component}: {reader_class.__name__} read {len(filenames)} "
+                    f"files {options['iterations']} times in {elapsed:.2f} seconds"
+                )
+            del repository.object_reader
@@ -24,6 +24,7 @@ class ImportUser:
 
     needs_component_restrictions_filter = False
     needs_project_filter = False
+    allowed_component_ids = None
     component_permissions: tuple[int, ...] = ()
 
     def has_perm(self, perm, obj=None) -> bool:
@@ -38,9 +38,6 @@ class Command(BaseCommand):
     ) -> None:
         user = User.objects.get(username=username)
         restore = ProjectBackup(filename)
-
-        restore.validate()
-
         restore.restore(project_name=project_name, project_slug=project_slug, user=user)
         for component in restore.skipped_components:
             self.stderr.write(
@@ -0,0 +1,52 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from weblate.trans.partitions import (
+    archive_change_partitions,
+    ensure_change_partitions,
+    is_change_partitioned,
+    partition_change_table,
+)
+from weblate.utils.management.base import BaseCommand
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    help = "manages monthly partitions of the history table"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the history table to a partitioned table",
+        )
+        parser.add_argument(
+            "--archive-months",
+            type=int,
+            default=None,
+            help="Archive partitions older than this number of months",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["convert"]:
+            if is_change_partitioned():
+                self.stdout.write("The history table is already partitioned")
+            else:
+                copied = partition_change_table()
+                self.stdout.write(f"Converted the history table, copied {copied} rows")
+        elif not is_change_partitioned():
+            msg = "The history table is not partitioned, use --convert first"
+            raise CommandError(msg)
+        for name in ensure_change_partitions():
+            self.stdout.write(f"Created partition {name}")
+        for name in archive_change_partitions(options["archive_months"]):
+            self.stdout.write(f"Archived partition {name}")
@@ -46,9 +46,15 @@ class WeblateConf(AppConf):
     # Enable lazy commits
     COMMIT_PENDING_HOURS = defaults.DEFAULT_COMMIT_PENDING_HOURS
 
+    # Number of threads writing translation files on commit
+    COMMIT_PENDING_WORKERS = defaults.DEFAULT_COMMIT_PENDING_WORKERS
+
     # Automatically update vcs repositories daily
     AUTO_UPDATE = defaults.DEFAULT_AUTO_UPDATE
 
+    # Number of parallel remote updates per repository host
+    AUTO_UPDATE_HOST_CONCURRENCY = defaults.DEFAULT_AUTO_UPDATE_HOST_CONCURRENCY
+
     # List of automatic fixups
     AUTOFIX_LIST = defaults.DEFAULT_AUTOFIX_LIST
 
@@ -160,6 +166,16 @@ class WeblateConf(AppConf):
     PROJECT_BACKUP_KEEP_COUNT = defaults.DEFAULT_PROJECT_BACKUP_KEEP_COUNT
     REPORT_EXPIRY = defaults.DEFAULT_REPORT_EXPIRY
 
+    # Number of upcoming months to create history partitions for
+    CHANGE_PARTITION_MONTHS_AHEAD = defaults.DEFAULT_CHANGE_PARTITION_MONTHS_AHEAD
+
+    # Archive history partitions older than this number of months, 0 to disable
+    CHANGE_ARCHIVE_MONTHS = defaults.DEFAULT_CHANGE_ARCHIVE_MONTHS
+
+    # Schema and tablespace storing archived history partitions
+    CHANGE_ARCHIVE_SCHEMA = defaults.DEFAULT_CHANGE_ARCHIVE_SCHEMA
+    CHANGE_ARCHIVE_TABLESPACE = defaults.DEFAULT_CHANGE_ARCHIVE_TABLESPACE
+
     EXTRA_HTML_HEAD = defaults.DEFAULT_EXTRA_HTML_HEAD
 
     IP_ADDRESSES: ClassVar[list] = list(defaults.DEFAULT_IP_ADDRESSES)
@@ -256,16 +256,23 @@ class ChangeQuerySet(models.QuerySet["Change", "Change"]):
         Return recent changes to show on object pages.
 
         Fetch the identifiers first to keep the ordered and limited query
-        narrow. Related objects are loaded only for the selected changes.
+        narrow. Related objects are loaded only for the selected changes,
+        limiting the timestamp allows PostgreSQL to skip partitions.
         """
         with start_span(op="change.recent"):
-            change_ids = list(self.order().values_list("pk", flat=True)[:count])
-            if not change_ids:
+            selected = list(self.order().values_list("pk", "timestamp")[:count])
+            if not selected:
                 return []
+            change_ids = [change_id for change_id, _timestamp in selected]
 
             selected_changes = cast(
                 "ChangeQuerySet",
-                self.filter(pk__in=change_ids).prefetch_for_render().order(),
+                self.filter(
+                    pk__in=change_ids,
+                    timestamp__range=(selected[-1][1], selected[0][1]),
+                )
+                .prefetch_for_render()
+                .order(),
             )
             changes: dict[int, Change] = {
                 change.pk: change for change in selected_changes
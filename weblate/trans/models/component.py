@@ -8,10 +8,11 @@ import os
 import re
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext, suppress
 from dataclasses import dataclass
 from glob import glob
-from itertools import chain
+from itertools import batched, chain
 from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, TypeVar, cast, overload
 from urllib.parse import quote as urlquote
 from urllib.parse import urlparse
@@ -66,6 +67,7 @@ from weblate.trans.defines import (
     REPO_LENGTH,
 )
 from weblate.trans.exceptions import (
+    FailedCommitError,
     FileParseError,
     InvalidTemplateError,
     is_expected_parse_error,
@@ -96,7 +98,7 @@ from weblate.trans.models.alert import Alert
 from weblate.trans.models.audit import log_setting_changes, should_track_field
 from weblate.trans.models.change import Change
 from weblate.trans.models.pending import PendingUnitChange
-from weblate.trans.models.translation import Translation
+from weblate.trans.models.translation import DeferredCommit, Translation
 from weblate.trans.models.unit import Unit
 from weblate.trans.models.variant import Variant
 from weblate.trans.signals import (
@@ -252,6 +254,8 @@ REPOWEB_BRANCH = "{{branch}}"
 REPOWEB_FILENAME = "{{filename}}"
 REPOWEB_LINE = "{{line}}"
 BACKGROUND_TASK_TTL = 6 * 3600
+# Number of translations committed in a single transaction
+COMMIT_PENDING_CHUNK_SIZE = 50
 
 
 def perform_on_link(func):
@@ -298,6 +302,26 @@ class CommitTaskPayload(TypedDict):
     previous_head: str | None
 
 
+def merge_commit_payloads(
+    previous: CommitTaskPayload | None, payload: CommitTaskPayload
+) -> CommitTaskPayload:
+    """
+    Coalesce commit requests for a repository into a single one.
+
+    The latest request defines reason and user, the scan is forced if any of
+    the requests needs it and the oldest known head is kept so that the
+    post-update processing covers all of the changes.
+    """
+    if not isinstance(previous, dict):
+        return payload
+    return {
+        "reason": payload["reason"],
+        "user_id": payload["user_id"],
+        "force_scan": previous["force_scan"] or payload["force_scan"],
+        "previous_head": previous["previous_head"] or payload["previous_head"],
+    }
+
+
 def prefetch_tasks(components):
     """Prefetch update tasks."""
     lookup = {component.update_key: component for component in components}
@@ -1892,6 +1916,20 @@ class Component(  # ruff: ignore[too-many-public-methods]
     def commit_task_reschedule_key(self) -> str:
         return f"component-commit-reschedule-{self.effective_repo_component.pk}"
 
+    @cached_property
+    def commit_task_lock(self) -> WeblateLock:
+        # Serializes updates of the commit task and coalesced requests in the
+        # cache, it is held only for these cache operations
+        repo_component = self.effective_repo_component
+        return WeblateLock(
+            scope="component:commit-task",
+            key=repo_component.pk,
+            slug=repo_component.slug,
+            timeout=5,
+            expiry_timeout=60,
+            origin=repo_component.full_slug,
+        )
+
     def delete_background_task(self) -> None:
         delete_task_metadata(self.background_task_id)
         cache.delete(self.update_key)
@@ -1929,10 +1967,11 @@ class Component(  # ruff: ignore[too-many-public-methods]
         return True
 
     def finish_commit_task(self) -> CommitTaskPayload | None:
-        if not self.delete_commit_task(clear_reschedule=False, require_match=True):
-            return None
-        payload = cache.get(self.commit_task_reschedule_key)
-        cache.delete(self.commit_task_reschedule_key)
+        with self.commit_task_lock:
+            if not self.delete_commit_task(clear_reschedule=False, require_match=True):
+                return None
+            payload = cache.get(self.commit_task_reschedule_key)
+            cache.delete(self.commit_task_reschedule_key)
         if isinstance(payload, dict):
             return cast("CommitTaskPayload", payload)
         return None
@@ -1969,15 +2008,21 @@ class Component(  # ruff: ignore[too-many-public-methods]
 
             task_id = uuid()
             if deduplicate:
-                task_added = cache.add(
-                    self.commit_task_key, task_id, BACKGROUND_TASK_TTL
-                )
-                if not task_added:
-                    cache.set(
-                        self.commit_task_reschedule_key,
-                        payload,
-                        BACKGROUND_TASK_TTL,
+                # The payload is merged with a read and write, the lock keeps
+                # concurrent requests and the finishing task from losing it
+                with self.commit_task_lock:
+                    task_added = cache.add(
+                        self.commit_task_key, task_id, BACKGROUND_TASK_TTL
                     )
+                    if not task_added:
+                        cache.set(
+                            self.commit_task_reschedule_key,
+                            merge_commit_payloads(
+                                cache.get(self.commit_task_reschedule_key), payload
+                            ),
+                            BACKGROUND_TASK_TTL,
+                        )
+                if not task_added:
                     self.log_info("skipped commit scheduling: commit already scheduled")
                     return
             else:
@@ -2690,8 +2735,30 @@ class Component(  # ruff: ignore[too-many-public-methods]
             {"repo": gettext("Could not fetch the repository: %s") % error_text}
         )
 
+    def is_remote_unchanged(self, previous_revision: str | None) -> bool:
+        """Check whether the remote branch still points to the fetched revision."""
+        if not previous_revision:
+            return False
+        try:
+            return self.repository.probe_remote_revision() == previous_revision
+        except RepositoryError:
+            # Let the fetch report the error
+            return False
+
     @perform_on_link
-    def update_remote_repository(self) -> tuple[str | None, RepositoryError | None]:
+    def update_remote_repository(
+        self, probe: bool = False
+    ) -> tuple[str | None, RepositoryError | None]:
+        if probe:
+            try:
+                previous_revision = self.repository.last_remote_revision
+            except RepositoryError:
+                previous_revision = None
+            if self.is_remote_unchanged(previous_revision):
+                self.log_info(
+                    "remote unchanged at %s, skipped fetch", previous_revision
+                )
+                return previous_revision, None
         with self.repository.lock:
             start = time.monotonic()
             try:
@@ -2720,9 +2787,9 @@ class Component(  # ruff: ignore[too-many-public-methods]
     ) -> bool:
         """Pull from remote repository."""
         user = user or self.acting_user
-        # Update
+        # Update, validation needs a full fetch
         self.log_info("updating repository")
-        previous_revision, error = self.update_remote_repository()
+        previous_revision, error = self.update_remote_repository(probe=not validate)
         if error is not None:
             if (
                 retry
@@ -3724,6 +3791,14 @@ class Component(  # ruff: ignore[too-many-public-methods]
             child.linked_component = self
         return children
 
+    def get_repository_file_masks(self) -> set[str]:
+        """List file masks of all components sharing the repository."""
+        fields = ("filemask", "template", "new_base", "intermediate")
+        rows = [tuple(getattr(self, field) for field in fields)]
+        if not self.is_repo_link and self.pk:
+            rows.extend(self.component_set.values_list(*fields))
+        return {mask for row in rows for mask in row if mask}
+
     def get_linked_children_for_template(self):
         return [
             {
@@ -3781,45 +3856,26 @@ class Component(  # ruff: ignore[too-many-public-methods]
         if not translations:
             return True
 
-        # Commit pending changes
+        # Commit pending changes, every chunk is committed in a single
+        # transaction so that interrupted commit resumes from the last chunk
         with self.track_local_head_change():
-            for translation in translations:
-                self.repository.lock.reacquire()
-                translation = self.reuse_component_for_translation(
-                    translation, reuse_source=True
-                )
-                component = translation.component
-                if component.pk in skipped:
-                    # We already failed at this component
-                    continue
-                if component.pk not in components:
-                    # Validate template is valid
+            for chunk in batched(translations, COMMIT_PENDING_CHUNK_SIZE):
+                with transaction.atomic():
+                    changed, error = self.commit_pending_chunk(
+                        chunk, reason, user, components, skipped
+                    )
+                for translation in changed:
+                    was_changed = True
+                    component = translation.component
                     if component.has_template():
-                        try:
-                            component.template_store  # ruff: ignore[useless-expression]
-                        except FileParseError as error:
-                            if not is_expected_parse_error(error):
-                                report_error(
-                                    "Could not parse template file on commit",
-                                    project=self.project,
-                                )
-                            component.log_error(
-                                "skipping commit due to error: %s", error
-                            )
-                            component.update_import_alerts(delete=False)
-                            skipped.add(component.pk)
-                            continue
+                        translation_pks[component.pk].append(translation.pk)
+                        if translation.is_source:
+                            source_updated_components.append(component)
 
-                    components[component.pk] = component
-                with self.start_tracing_span("commit_pending"):
-                    translation_changed = translation._commit_pending(  # ruff: ignore[private-member-access]
-                        reason, user
-                    )
-                was_changed |= translation_changed
-                if translation_changed and component.has_template():
-                    translation_pks[component.pk].append(translation.pk)
-                    if translation.is_source:
-                        source_updated_components.append(component)
+                # Report failure only after the transaction is committed, the
+                # pending changes of committed translations are removed then
+                if error is not None:
+                    raise error
 
             # Update hash of other translations, otherwise they would be seen as having change
             for component in source_updated_components:
@@ -3840,6 +3896,152 @@ class Component(  # ruff: ignore[too-many-public-methods]
 
         return True
 
+    def commit_pending_chunk(
+        self,
+        chunk: Iterable[Translation],
+        reason: str,
+        user: User,
+        components: dict[int, Component],
+        skipped: set[int],
+    ) -> tuple[list[Translation], FailedCommitError | None]:
+        """
+        Commit pending changes of translations.
+
+        Returns changed translations and the failure which stopped the commit.
+        """
+        deferred_commits: list[DeferredCommit] = []
+        changed: list[Translation] = []
+        error: FailedCommitError | None = None
+        for translation in chunk:
+            self.repository.lock.reacquire()
+            translation = self.reuse_component_for_translation(
+                translation, reuse_source=True
+            )
+            if not self.validate_commit_component(
+                translation.component, components, skipped
+            ):
+                continue
+            try:
+                with self.start_tracing_span("commit_pending"):
+                    result = translation._commit_pending(  # ruff: ignore[private-member-access]
+                        reason, user, defer=True
+                    )
+            except FailedCommitError as failure:
+                error = failure
+                break
+            if isinstance(result, DeferredCommit):
+                deferred_commits.append(result)
+            elif result:
+                changed.append(translation)
+
+        committed, deferred_error = self.complete_deferred_commits(
+            deferred_commits, user
+        )
+        changed.extend(committed)
+        return changed, error or deferred_error
+
+    def validate_commit_component(
+        self, component: Component, components: dict[int, Component], skipped: set[int]
+    ) -> bool:
+        """Check whether translations of the component can be committed."""
+        if component.pk in skipped:
+            # We already failed at this component
+            return False
+        if component.pk in components:
+            return True
+        # Validate template is valid
+        if component.has_template():
+            try:
+                component.template_store  # ruff: ignore[useless-expression]
+            except FileParseError as error:
+                if not is_expected_parse_error(error):
+                    report_error(
+                        "Could not parse template file on commit",
+                        project=self.project,
+                    )
+                component.log_error("skipping commit due to error: %s", error)
+                component.update_import_alerts(delete=False)
+                skipped.add(component.pk)
+                return False
+        components[component.pk] = component
+        return True
+
+    def complete_deferred_commits(
+        self, deferred_commits: list[DeferredCommit], user: User | None
+    ) -> tuple[list[Translation], FailedCommitError | None]:
+        """
+        Write and commit deferred commits.
+
+        Returns changed translations and the first failure, the remaining
+        translations are committed even if some of them failed.
+        """
+        savepoints = []
+        for deferred in deferred_commits:
+            self.repository.lock.reacquire()
+            # Database changes are discarded when the file can not be written
+            savepoints.append(transaction.savepoint())
+            deferred.apply()
+
+        self.save_deferred_commits(deferred_commits)
+
+        changed: list[Translation] = []
+        for index, deferred in enumerate(deferred_commits):
+            if deferred.error is not None:
+                # The savepoints are nested, the rollback discards changes of
+                # the following translations as well
+                transaction.savepoint_rollback(savepoints[index])
+                changed.extend(
+                    self.retry_deferred_commits(deferred_commits[index + 1 :], user)
+                )
+                return changed, deferred.error
+            self.repository.lock.reacquire()
+            translation = deferred.translation
+            if translation.complete_deferred_commit(deferred, user):
+                changed.append(translation)
+        return changed, None
+
+    def retry_deferred_commits(
+        self, deferred_commits: list[DeferredCommit], user: User | None
+    ) -> list[Translation]:
+        """
+        Commit translations following a failed deferred commit one by one.
+
+        Files written by the successful deferred commits already contain the
+        changes, so these are only applied to the database again.
+        """
+        changed: list[Translation] = []
+        for deferred in deferred_commits:
+            if deferred.error is not None:
+                continue
+            self.repository.lock.reacquire()
+            translation = deferred.translation
+            translation.drop_store_cache()
+            try:
+                with transaction.atomic():
+                    # ruff: ignore[private-member-access]
+                    if translation._commit_pending_with_filename(deferred.reason, user):
+                        changed.append(translation)
+            except FailedCommitError as error:
+                translation.log_error("skipping commit due to error: %s", error)
+        return changed
+
+    @staticmethod
+    def save_deferred_commits(deferred_commits: list[DeferredCommit]) -> None:
+        """
+        Write translation files of deferred commits.
+
+        Serializing the files is the expensive part of the commit and does not
+        touch the database, so it is done in parallel threads.
+        """
+        workers = min(settings.COMMIT_PENDING_WORKERS, len(deferred_commits))
+        if workers <= 1:
+            for deferred in deferred_commits:
+                deferred.save()
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the iterator to propagate unexpected exceptions
+            list(executor.map(DeferredCommit.save, deferred_commits))
+
     def commit_files(
         self,
         *,
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.contrib.postgres import indexes as postgres_indexes
 from django.db import models, transaction
-from django.db.models import Q, Sum, Value
+from django.db.models import Sum, Value
 from django.db.models.functions import Coalesce
 from django.utils.translation import gettext
 
@@ -133,17 +133,10 @@ class SuggestionQuerySet(models.QuerySet["Suggestion", "Suggestion"]):
         return self.order_by("-timestamp")
 
     def filter_access(self, user: User):
-        result = self
-        if user.needs_project_filter:
-            result = result.filter(
-                user.get_project_access_query("unit__translation__component__project")
-            )
-        if user.needs_component_restrictions_filter:
-            result = result.filter(
-                Q(unit__translation__component__restricted=False)
-                | Q(unit__translation__component_id__in=user.component_permissions)
-            )
-        return result
+        component_ids = user.allowed_component_ids
+        if component_ids is None:
+            return self
+        return self.filter(unit__translation__component_id__in=component_ids)
 
     def load_votes(self):
         return self.annotate(
@@ -203,23 +196,27 @@ class Suggestion(models.Model, UserDisplayMixin):
             messages.error(request, gettext("Could not accept suggestion!"))
             return
 
+        self.apply(request.user, state)
+
+        # Delete the suggestion
+        self.delete()
+
+    def apply(
+        self, user: User, state=STATE_TRANSLATED, *, select_for_update: bool = True
+    ) -> None:
+        """Store suggestion as a translation, permissions are not checked here."""
         # Skip if there is no change
         if self.unit.target != self.target or self.unit.state < STATE_TRANSLATED:
-            if self.user and not self.user.is_anonymous:
-                author = self.user
-            else:
-                author = request.user
+            author = self.user if self.user and not self.user.is_anonymous else user
             self.unit.translate(
-                request.user,
+                user,
                 split_plural(self.target),
                 state,
                 author=author,
                 change_action=ActionEvents.ACCEPT,
+                select_for_update=select_for_update,
             )
 
-        # Delete the suggestion
-        self.delete()
-
     def delete_log(
         self,
         user: User,
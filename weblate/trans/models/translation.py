@@ -8,6 +8,7 @@ import codecs
 import os
 import tempfile
 from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import UTC
 from itertools import batched, chain
 from pathlib import Path
@@ -32,6 +33,7 @@ from weblate.formats.base import TranslationFormat, UnitNotFoundError
 from weblate.formats.helpers import CONTROLCHARS, NamedBytesIO
 from weblate.lang.models import Language, Plural
 from weblate.trans.actions import ActionEvents
+from weblate.trans.change_buffer import change_buffer, get_current_change_buffer
 from weblate.trans.checklists import TranslationChecklistMixin
 from weblate.trans.defines import FILENAME_LENGTH
 from weblate.trans.exceptions import (
@@ -125,6 +127,38 @@ class ActiveChangeGroup(TypedDict):
     units: set[int]
 
 
+@dataclass
+class DeferredCommit:
+    """Pending changes applied to a store which was not yet written."""
+
+    translation: Translation
+    reason: str
+    store: TranslationFormat
+    pending_changes: list[PendingUnitChange]
+    author: User
+    changes: list[PendingUnitChange]
+    changes_status: dict[int, bool] = field(default_factory=dict)
+    error: FailedCommitError | None = None
+
+    def apply(self) -> None:
+        """Apply pending changes to the store and units."""
+        self.changes_status = self.translation.update_units(
+            self.changes,
+            self.store,
+            self.author.get_author_name(),
+            save_store=False,
+        )
+
+    def save(self) -> None:
+        """Write the store, this can be run outside the main thread."""
+        if not any(self.changes_status.values()):
+            return
+        try:
+            self.translation.save_pending_store(self.store)
+        except FailedCommitError as error:
+            self.error = error
+
+
 def normalize_translation_check_flags(check_flags: str, *, needs_readonly: bool) -> str:
     """Normalize auto-managed translation flags while preserving user flags."""
     flags = Flags(check_flags)
@@ -286,15 +320,10 @@ class TranslationQuerySet(models.QuerySet["Translation", "Translation"]):
         return self.prefetch_related("language__plural_set")
 
     def filter_access(self, user: User):
-        result = self
-        if user.needs_project_filter:
-            result = result.filter(user.get_project_access_query("component__project"))
-        if user.needs_component_restrictions_filter:
-            result = result.filter(
-                Q(component__restricted=False)
-                | Q(component_id__in=user.component_permissions)
-            )
-        return result
+        component_ids = user.allowed_component_ids
+        if component_ids is None:
+            return self
+        return self.filter(component_id__in=component_ids)
 
     def order(self):
         return self.order_by(
@@ -840,8 +869,12 @@ class Translation(
         return True
 
     def store_update_changes(self) -> None:
-        # Save change
-        Change.objects.bulk_create(self.update_changes, batch_size=500)
+        # Save change, unless these are buffered for the whole operation
+        buffer = get_current_change_buffer()
+        if buffer is None:
+            Change.objects.bulk_create(self.update_changes, batch_size=500)
+        else:
+            buffer.add_changes(self.update_changes)
         self.update_changes.clear()
         # Save pending unit changes
         PendingUnitChange.objects.bulk_create(self.pending_unit_changes, batch_size=500)
@@ -1084,7 +1117,9 @@ class Translation(
         return self.component.commit_pending(reason, user, skip_push=skip_push)
 
     @transaction.atomic
-    def _commit_pending(self, reason: str, user: User | None) -> bool:
+    def _commit_pending(
+        self, reason: str, user: User | None, *, defer: bool = False
+    ) -> DeferredCommit | bool:
         """
         Commit pending translation.
 
@@ -1094,9 +1129,14 @@ class Translation(
         - the source translation needs to be committed first
         - signals and alerts are updated by the caller
         - repository push is handled by the caller
+
+        With defer, writing and committing the file might be postponed, see
+        :meth:`defer_pending_commit`.
         """
         if not self.filename:
             return self._commit_pending_without_filename()
+        if defer and not self.is_source:
+            return self.defer_pending_commit(reason, user)
         return self._commit_pending_with_filename(reason, user)
 
     def _commit_pending_without_filename(self) -> bool:
@@ -1132,6 +1172,95 @@ class Translation(
 
     def _commit_pending_with_filename(self, reason: str, user: User | None) -> bool:
         """Commit pending changes when translation file exists."""
+        prepared = self.prepare_pending_commit(reason)
+        if prepared is None:
+            return False
+        store, pending_changes = prepared
+        return self._commit_pending_groups(
+            user, store, pending_changes, self._group_changes_by_author(pending_changes)
+        )
+
+    def _commit_pending_groups(
+        self,
+        user: User | None,
+        store: TranslationFormat,
+        pending_changes: list[PendingUnitChange],
+        commit_groups: list[tuple[User, list[PendingUnitChange]]],
+    ) -> bool:
+        """Write and commit pending changes, one commit per author group."""
+        all_changes_status = {}
+        for author, changes in commit_groups:
+            author_name = author.get_author_name()
+            timestamp = max(change.timestamp for change in changes)
+
+            # Flush the grouped pending changes for this author
+            changes_status = self.update_units(changes, store, author_name)
+            all_changes_status.update(changes_status)
+
+            # Commit changes if there was anything written out
+            if any(changes_status.values()):
+                self.git_commit(
+                    user, author_name, timestamp, skip_push=True, signals=False
+                )
+
+        return self.finish_pending_commit(pending_changes, all_changes_status)
+
+    def defer_pending_commit(
+        self, reason: str, user: User | None
+    ) -> DeferredCommit | bool:
+        """
+        Prepare pending changes to be committed later.
+
+        This is possible only when all changes go into a single commit, the
+        returned object is applied, written and committed by the component.
+        Otherwise, the changes are committed right away and the result of the
+        commit is returned.
+
+        The caller has to hold a transaction until the deferred commit is
+        completed.
+        """
+        prepared = self.prepare_pending_commit(reason)
+        if prepared is None:
+            return False
+        store, pending_changes = prepared
+
+        commit_groups = self._group_changes_by_author(pending_changes)
+        if len(commit_groups) > 1:
+            # The intermediate states have to be written for every commit
+            return self._commit_pending_groups(
+                user, store, pending_changes, commit_groups
+            )
+
+        author, changes = commit_groups[0]
+        return DeferredCommit(
+            translation=self,
+            reason=reason,
+            store=store,
+            pending_changes=pending_changes,
+            author=author,
+            changes=changes,
+        )
+
+    def complete_deferred_commit(
+        self, deferred: DeferredCommit, user: User | None
+    ) -> bool:
+        """Commit translation file written for a deferred commit."""
+        if any(deferred.changes_status.values()):
+            self.git_commit(
+                user,
+                deferred.author.get_author_name(),
+                max(change.timestamp for change in deferred.pending_changes),
+                skip_push=True,
+                signals=False,
+            )
+        return self.finish_pending_commit(
+            deferred.pending_changes, deferred.changes_status
+        )
+
+    def prepare_pending_commit(
+        self, reason: str
+    ) -> tuple[TranslationFormat, list[PendingUnitChange]] | None:
+        """Load translation file and pending changes to be committed."""
         try:
             store = self.store
         except FileParseError as error:
@@ -1140,7 +1269,7 @@ class Translation(
                     "Could not parse file on commit", project=self.component.project
                 )
             self.log_error("skipping commit due to error: %s", error)
-            return False
+            return None
 
         try:
             store.ensure_index()
@@ -1149,7 +1278,7 @@ class Translation(
                 "Could not parse file on commit", project=self.component.project
             )
             self.log_error("skipping commit due to error: %s", error)
-            return False
+            return None
 
         pending_changes = list(
             PendingUnitChange.objects.for_translation(self, apply_filters=True)
@@ -1159,35 +1288,19 @@ class Translation(
         )
 
         if not pending_changes:
-            return False
+            return None
 
         self.log_info(
             "committing %d pending changes (%s)", len(pending_changes), reason
         )
+        return store, pending_changes
 
-        all_changes_status = {}
-        units_to_clear_disk_state = set()  # Track units for disk_state clearing
-
-        commit_groups = self._group_changes_by_author(pending_changes)
-        for author, changes in commit_groups:
-            author_name = author.get_author_name()
-            timestamp = max(change.timestamp for change in changes)
-
-            # Flush the grouped pending changes for this author
-            changes_status = self.update_units(changes, store, author_name)
-            all_changes_status.update(changes_status)
-
-            # Track successful units
-            for change in changes:
-                if changes_status.get(change.pk):
-                    units_to_clear_disk_state.add(change.unit_id)
-
-            # Commit changes if there was anything written out
-            if any(changes_status.values()):
-                self.git_commit(
-                    user, author_name, timestamp, skip_push=True, signals=False
-                )
-
+    def finish_pending_commit(
+        self,
+        pending_changes: list[PendingUnitChange],
+        all_changes_status: dict[int, bool],
+    ) -> bool:
+        """Remove committed pending changes and update translation state."""
         # Short-circuit when no changes were processed
         if not any(all_changes_status.values()):
             return False
@@ -1203,8 +1316,10 @@ class Translation(
         # changes to a unit have been applied successfully and delete all pending
         # changes for the unit until that timestamp.
         success_times: dict[int, datetime] = {}
+        units_to_clear_disk_state = set()
         for change in pending_changes:
             if all_changes_status.get(change.pk):
+                units_to_clear_disk_state.add(change.unit_id)
                 prev = success_times.get(change.unit_id)
                 if prev is None or change.timestamp > prev:
                     success_times[change.unit_id] = change.timestamp
@@ -1470,6 +1585,8 @@ class Translation(
         pending_changes: list[PendingUnitChange],
         store: TranslationFormat,
         author_name: str,
+        *,
+        save_store: bool = True,
     ) -> dict[int, bool]:
         """Update backend file and unit."""
         changes_status = {}
@@ -1605,6 +1722,13 @@ class Translation(
         store.update_header(self.component.file_format_params, **headers)
 
         # save translation changes
+        if save_store:
+            self.save_pending_store(store)
+
+        return changes_status
+
+    def save_pending_store(self, store: TranslationFormat) -> None:
+        """Write translation file with applied pending changes."""
         try:
             store.save()
         except Exception as error:
@@ -1612,8 +1736,6 @@ class Translation(
                 self.component.get_parse_error_message(error)
             ) from error
 
-        return changes_status
-
     @cached_property
     def workflow_settings(self):
         return self.component.project.project_languages[self.language].workflow_settings
@@ -2204,38 +2326,45 @@ class Translation(
         )
         result: UploadResult
 
-        if method == "replace":
-            result = self.handle_replace(request, author, fileobj)
-
-        elif method == "source":
-            result = self.handle_source(request, author, fileobj)
-        else:
-            store = self.load_uploaded_file(request, fileobj, method)
+        # Insert changes at once and dispatch their side effects together
+        with change_buffer() as buffer:
+            if method == "replace":
+                result = self.handle_replace(request, author, fileobj)
 
-            if method in {"translate", "fuzzy", "approve"}:
-                # Merge on units level
-                result = self.merge_translations(
-                    request, author, store, conflicts, method, fuzzy
-                )
-            elif method == "add":
-                with component.lock:
-                    result = self.handle_add_upload(request, author, store, fuzzy=fuzzy)
+            elif method == "source":
+                result = self.handle_source(request, author, fileobj)
             else:
-                # Add as suggestions
-                result = self.merge_suggestions(request, author, store, fuzzy)
+                store = self.load_uploaded_file(request, fileobj, method)
 
-        self.change_set.create(
-            action=ActionEvents.FILE_UPLOAD,
-            user=request.user,
-            author=author,
-            details={
-                "method": method,
-                "not_found": result[0],
-                "skipped": result[1],
-                "accepted": result[2],
-                "total": result[3],
-            },
-        )
+                if method in {"translate", "fuzzy", "approve"}:
+                    # Merge on units level
+                    result = self.merge_translations(
+                        request, author, store, conflicts, method, fuzzy
+                    )
+                elif method == "add":
+                    with component.lock:
+                        result = self.handle_add_upload(
+                            request, author, store, fuzzy=fuzzy
+                        )
+                else:
+                    # Add as suggestions
+                    result = self.merge_suggestions(request, author, store, fuzzy)
+
+            buffer.add_change(
+                Change(
+                    translation=self,
+                    action=ActionEvents.FILE_UPLOAD,
+                    user=request.user,
+                    author=author,
+                    details={
+                        "method": method,
+                        "not_found": result[0],
+                        "skipped": result[1],
+                        "accepted": result[2],
+                        "total": result[3],
+                    },
+                )
+            )
 
         return result
 
@@ -37,6 +37,7 @@ from weblate.memory.tasks import (
 from weblate.memory.utils import is_valid_memory_entry
 from weblate.trans.actions import ActionEvents
 from weblate.trans.autofixes import fix_target
+from weblate.trans.change_buffer import get_current_change_buffer
 from weblate.trans.file_format_params import DOSLineEndings
 from weblate.trans.mixins import LoggerMixin
 from weblate.trans.models.category import Category
@@ -136,18 +137,21 @@ def fill_in_source_translation(units: Iterable[Unit]) -> None:
         unit.translation.component.source_translation = unit.source_unit.translation
 
 
-def _get_permission_scope_query(user: User, permission: str) -> Q:
-    """Build a unit filter from cached project and component permission scopes."""
-    language_lookup = "translation__language_id__in"
-    component_lookup = "translation__component_id"
-    project_lookup = "translation__component__project_id"
-    unrestricted = Q(translation__component__restricted=False)
+def _get_permission_scope_query(
+    user: User, permission: str, prefix: str = "translation__"
+) -> Q:
+    """Build a filter from cached project and component permission scopes."""
+    language_lookup = f"{prefix}language_id__in"
+    component_lookup = f"{prefix}component_id"
+    project_lookup = f"{prefix}component__project_id"
+    unrestricted = Q(**{f"{prefix}component__restricted": False})
+    access_lookup = f"{prefix}component__project__access_control"
     project_scopes = {
         -SELECTION_ALL: unrestricted,
         -SELECTION_ALL_PUBLIC: unrestricted
-        & Q(translation__component__project__access_control=Project.ACCESS_PUBLIC),
+        & Q(**{access_lookup: Project.ACCESS_PUBLIC}),
         -SELECTION_ALL_PROTECTED: unrestricted
-        & Q(translation__component__project__access_control=Project.ACCESS_PROTECTED),
+        & Q(**{access_lookup: Project.ACCESS_PROTECTED}),
     }
     result = Q(pk__in=())
 
@@ -551,17 +555,10 @@ class UnitQuerySet(models.QuerySet["Unit", "Unit"]):
         return self.order_by("-priority", "position")
 
     def filter_access(self, user: User):
-        result = self
-        if user.needs_project_filter:
-            result = result.filter(
-                user.get_project_access_query("translation__component__project")
-            )
-        if user.needs_component_restrictions_filter:
-            result = result.filter(
-                Q(translation__component__restricted=False)
-                | Q(translation__component_id__in=user.component_permissions)
-            )
-        return result
+        component_ids = user.allowed_component_ids
+        if component_ids is None:
+            return self
+        return self.filter(translation__component_id__in=component_ids)
 
     def filter_editable_scope(self, user: User) -> UnitQuerySet:
         """Keep units in scopes where the user can potentially edit."""
@@ -570,20 +567,27 @@ class UnitQuerySet(models.QuerySet["Unit", "Unit"]):
         if user.is_superuser:
             return self
 
-        result = self.filter(
+        # ruff: ignore[import-outside-top-level]
+        from weblate.trans.models.translation import Translation
+
+        # Resolve the scope on translations first, units are then filtered by
+        # a single indexed column
+        translations = Translation.objects.filter(
             (
-                Q(translation__component__is_glossary=False)
-                & _get_permission_scope_query(user, "unit.edit")
+                Q(component__is_glossary=False)
+                & _get_permission_scope_query(user, "unit.edit", prefix="")
             )
             | (
-                Q(translation__component__is_glossary=True)
-                & _get_permission_scope_query(user, "glossary.edit")
+                Q(component__is_glossary=True)
+                & _get_permission_scope_query(user, "glossary.edit", prefix="")
             ),
-            translation__component__locked=False,
-        ).exclude(state=STATE_READONLY)
+            component__locked=False,
+        )
         if not user.is_bot and not user.profile.has_2fa:
-            result = result.filter(translation__component__project__enforced_2fa=False)
-        return result
+            translations = translations.filter(component__project__enforced_2fa=False)
+        return self.filter(
+            translation_id__in=translations.values("id").order_by()
+        ).exclude(state=STATE_READONLY)
 
     def get_ordered(self, ids):
         """Return list of units ordered by ID."""
@@ -2053,20 +2057,26 @@ class Unit(models.Model, LoggerMixin):
         change_details: dict[str, Any] | None = None,
     ) -> Change:
         """Create Change entry for saving unit."""
+        buffer = get_current_change_buffer()
         # Notify about new contributor
         if (
             check_new
             and not self.is_batch_update
             and user is not None
             and not user.is_bot
+            and (buffer is None or buffer.add_contributor(self.translation.id, user.id))
             and not self.translation.change_set.filter(user=user).exists()
         ):
-            self.change_set.create(
+            contributor_change = Change(
                 unit=self,
                 action=ActionEvents.NEW_CONTRIBUTOR,
                 user=user,
                 author=author,
             )
+            if buffer is None:
+                contributor_change.save(force_insert=True)
+            else:
+                buffer.add_change(contributor_change)
 
         # Action type to store
         if change_action is not None:
@@ -2103,7 +2113,10 @@ class Unit(models.Model, LoggerMixin):
             details=details,
         )
         if save:
-            change.save(force_insert=True)
+            if buffer is None:
+                change.save(force_insert=True)
+            else:
+                buffer.add_change(change)
         return change
 
     @cached_property
@@ -2858,6 +2871,8 @@ class Unit(models.Model, LoggerMixin):
                 return
             if user is None and component.batch_memory:
                 component.add_batched_memory_update(payload)
+            elif (buffer := get_current_change_buffer()) is not None:
+                buffer.add_memory_update(payload)
             else:
                 schedule_memory_update(payload)
 
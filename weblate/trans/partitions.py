@@ -0,0 +1,295 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Monthly range partitioning of the history table.
+
+The history table can be converted to a PostgreSQL table partitioned by
+``timestamp``. Every month is stored in a separate partition, so queries
+limited by time only scan the matching partitions and indexes and vacuum
+operate on bounded tables. Old partitions can be detached from the table and
+moved to a separate schema which serves as cold storage.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from weblate.logger import LOGGER
+
+if TYPE_CHECKING:
+    from django.db.backends.utils import CursorWrapper
+
+CHANGE_TABLE = "trans_change"
+CHANGE_UNPARTITIONED_TABLE = "trans_change_unpartitioned"
+CHANGE_DEFAULT_PARTITION = "trans_change_default"
+CHANGE_SEQUENCE = "trans_change_partitioned_id_seq"
+CHANGE_PARTITION_RE = re.compile(r"trans_change_p(\d{4})_(\d{2})\Z")
+
+
+def get_month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    month = value.year * 12 + value.month - 1 + months
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def quote(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+@dataclass(frozen=True)
+class ChangePartition:
+    name: str
+    start: date
+    end: date
+
+    @classmethod
+    def for_month(cls, value: date) -> ChangePartition:
+        start = get_month_start(value)
+        return cls(
+            name=f"trans_change_p{start.year:04d}_{start.month:02d}",
+            start=start,
+            end=add_months(start, 1),
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> ChangePartition | None:
+        match = CHANGE_PARTITION_RE.match(name)
+        if match is None:
+            return None
+        return cls.for_month(date(int(match[1]), int(match[2]), 1))
+
+    def get_range(self) -> tuple[datetime, datetime]:
+        return (
+            datetime.combine(self.start, datetime.min.time(), tzinfo=UTC),
+            datetime.combine(self.end, datetime.min.time(), tzinfo=UTC),
+        )
+
+    def get_bounds_sql(self) -> str:
+        # The values are generated from dates, so they are safe to inline,
+        # DDL statements do not accept parameters
+        start, end = self.get_range()
+        return f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+
+
+def is_change_partitioned() -> bool:
+    """Return whether the history table is partitioned."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [CHANGE_TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def get_change_partitions() -> list[ChangePartition]:
+    """Return monthly partitions attached to the history table."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT partition.relname
+              FROM pg_inherits
+              JOIN pg_class partition ON partition.oid = pg_inherits.inhrelid
+             WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [CHANGE_TABLE],
+        )
+        partitions = [ChangePartition.from_name(row[0]) for row in cursor.fetchall()]
+    return sorted(
+        (partition for partition in partitions if partition is not None),
+        key=lambda partition: partition.start,
+    )
+
+
+def create_change_partition(cursor: CursorWrapper, partition: ChangePartition) -> None:
+    table = quote(CHANGE_TABLE)
+    name = quote(partition.name)
+    start, end = partition.get_range()
+    cursor.execute(
+        f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    # Move matching rows stored in the default partition, these would
+    # otherwise prevent attaching the partition
+    cursor.execute(
+        # ruff: ignore[hardcoded-sql-expression]
+        f"""
+        WITH moved AS (
+            DELETE FROM {quote(CHANGE_DEFAULT_PARTITION)}
+             WHERE "timestamp" >= %s AND "timestamp" < %s
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+        """,
+        [start, end],
+    )
+    cursor.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {partition.get_bounds_sql()}"
+    )
+
+
+def ensure_change_partitions(months_ahead: int | None = None) -> list[str]:
+    """Create partitions for the current and upcoming months."""
+    if months_ahead is None:
+        months_ahead = settings.CHANGE_PARTITION_MONTHS_AHEAD
+    if not is_change_partitioned():
+        return []
+    existing = {partition.name for partition in get_change_partitions()}
+    current = get_month_start(timezone.now().date())
+    created: list[str] = []
+    for offset in range(months_ahead + 1):
+        partition = ChangePartition.for_month(add_months(current, offset))
+        if partition.name in existing:
+            continue
+        with transaction.atomic(), connection.cursor() as cursor:
+            create_change_partition(cursor, partition)
+        LOGGER.info("created history partition %s", partition.name)
+        created.append(partition.name)
+    return created
+
+
+def partition_change_table(months_ahead: int | None = None) -> int:
+    """
+    Convert the history table to a table partitioned by month.
+
+    Writes to the history table are blocked while the rows are copied to the
+    partitions. Returns the number of copied rows.
+    """
+    if months_ahead is None:
+        months_ahead = settings.CHANGE_PARTITION_MONTHS_AHEAD
+    table = quote(CHANGE_TABLE)
+    unpartitioned = quote(CHANGE_UNPARTITIONED_TABLE)
+    sequence = quote(CHANGE_SEQUENCE)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+        cursor.execute(
+            """
+            SELECT pg_get_indexdef(indexrelid)
+              FROM pg_index
+             WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+            """,
+            [CHANGE_TABLE],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+              FROM pg_constraint
+             WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [CHANGE_TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        # ruff: ignore[hardcoded-sql-expression]
+        cursor.execute(f'SELECT MIN("timestamp"), MAX(id) FROM {table}')
+        first_timestamp, last_id = cursor.fetchone()
+
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {unpartitioned}")
+        cursor.execute(
+            f"""
+            CREATE TABLE {table} (
+                LIKE {unpartitioned} INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+            ) PARTITION BY RANGE ("timestamp")
+            """
+        )
+        # Identity columns are not supported on partitioned tables in older
+        # PostgreSQL versions, use a sequence owned by the new table instead
+        cursor.execute(f"CREATE SEQUENCE {sequence} START WITH {(last_id or 0) + 1}")
+        cursor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{CHANGE_SEQUENCE}')"
+        )
+        cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+        cursor.execute(
+            f"CREATE TABLE {quote(CHANGE_DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT"
+        )
+
+        current = get_month_start(timezone.now().date())
+        month = current
+        if first_timestamp is not None:
+            month = min(month, get_month_start(first_timestamp.date()))
+        while month <= add_months(current, months_ahead):
+            create_change_partition(cursor, ChangePartition.for_month(month))
+            month = add_months(month, 1)
+
+        # ruff: ignore[hardcoded-sql-expression]
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {unpartitioned}")
+        copied = cursor.rowcount
+        cursor.execute(f"DROP TABLE {unpartitioned}")
+
+        # Indexes are created after copying the rows as that is faster
+        cursor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "timestamp")')
+        for index in indexes:
+            cursor.execute(index)
+        for constraint, definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {quote(constraint)} {definition}"
+            )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {table}")
+    return copied
+
+
+def archive_change_partition(partition: ChangePartition) -> None:
+    """Detach a partition and move it to the archive schema."""
+    schema = quote(settings.CHANGE_ARCHIVE_SCHEMA)
+    name = quote(partition.name)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        cursor.execute(f"ALTER TABLE {quote(CHANGE_TABLE)} DETACH PARTITION {name}")
+        # Archived rows must not block removal of the referenced objects
+        cursor.execute(
+            """
+            SELECT conname
+              FROM pg_constraint
+             WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [partition.name],
+        )
+        for (constraint,) in cursor.fetchall():
+            cursor.execute(f"ALTER TABLE {name} DROP CONSTRAINT {quote(constraint)}")
+        # Indexes serve the history views only, keep just the primary key
+        cursor.execute(
+            """
+            SELECT indexrelid::regclass::text
+              FROM pg_index
+             WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+            """,
+            [partition.name],
+        )
+        for (index,) in cursor.fetchall():
+            cursor.execute(f"DROP INDEX {index}")
+        cursor.execute(f"ALTER TABLE {name} SET SCHEMA {schema}")
+        if settings.CHANGE_ARCHIVE_TABLESPACE:
+            cursor.execute(
+                f"ALTER TABLE {schema}.{name} SET TABLESPACE {quote(settings.CHANGE_ARCHIVE_TABLESPACE)}"
+            )
+
+
+def archive_change_partitions(months: int | None = None) -> list[str]:
+    """Archive partitions older than the configured number of months."""
+    if months is None:
+        months = settings.CHANGE_ARCHIVE_MONTHS
+    if not months or not is_change_partitioned():
+        return []
+    current = get_month_start(timezone.now().date())
+    cutoff = add_months(current, -months)
+    archived: list[str] = []
+    for partition in get_change_partitions():
+        if partition.end > cutoff:
+            continue
+        archive_change_partition(partition)
+        LOGGER.info("archived history partition %s", partition.name)
+        archived.append(partition.name)
+    return archived
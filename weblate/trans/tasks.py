@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import time
+from collections import defaultdict
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -34,6 +35,7 @@ from weblate.lang.models import Language
 from weblate.logger import LOGGER
 from weblate.trans.actions import ActionEvents
 from weblate.trans.autotranslate import BatchAutoTranslate
+from weblate.trans.change_buffer import change_buffer
 from weblate.trans.component_copy import copy_component_addons
 from weblate.trans.exceptions import FileParseError
 from weblate.trans.inherited_settings import apply_create_inheritance_defaults
@@ -50,6 +52,10 @@ from weblate.trans.models import (
     Translation,
     Unit,
 )
+from weblate.trans.partitions import (
+    archive_change_partitions,
+    ensure_change_partitions,
+)
 from weblate.trans.removal import RemovalBatch, removal_batch_context
 from weblate.utils.celery import app
 from weblate.utils.data import data_dir
@@ -59,6 +65,7 @@ from weblate.utils.lock import WeblateLockTimeoutError
 from weblate.utils.state import STATE_APPROVED, STATE_TRANSLATED
 from weblate.utils.stats import ProjectLanguage, prefetch_stats
 from weblate.vcs.base import RepositoryError
+from weblate.vcs.ssh import extract_url_host_port
 
 COMPONENT_MEMORY_CLEANUP_BATCH_SIZE = 1000
 
@@ -381,41 +388,74 @@ def bulk_accept_user_suggestions(
     approve: bool = False,
     return_url: str = "",
 ) -> dict[str, dict[str, str] | int | str]:
-    """Accept all suggestions from a specific user for a translation."""
-    translation = Translation.objects.get(pk=translation_id)
+    """
+    Accept all suggestions from a specific user for a translation.
+
+    Permissions are evaluated once for the translation and the units are
+    updated in batch mode, so checks, stats, history and translation memory
+    are processed once at the end.
+    """
+    translation = Translation.objects.select_related("component").get(pk=translation_id)
+    component = translation.component
     target_user = User.objects.get(pk=target_user_id)
     user = User.objects.get(pk=user_id)
+    state = STATE_APPROVED if approve else STATE_TRANSLATED
 
-    request = AuthenticatedHttpRequest()
-    request.user = user
+    can_accept = bool(user.has_perm("suggestion.accept", translation))
+    can_review = not approve or bool(user.has_perm("unit.review", translation))
 
     suggestions = Suggestion.objects.filter(
         unit__translation=translation, user=target_user
     ).select_related("unit")
     total = suggestions.count()
-    accepted = 0
+    accepted_ids: list[int] = []
+    units: dict[int, Unit] = {}
     failed = 0
     processed = 0
 
     report_bulk_accept_user_suggestions_progress(processed, total)
 
-    for suggestion in suggestions.iterator(chunk_size=100):
-        processed += 1
+    with transaction.atomic(), change_buffer():
+        # Lock all affected strings upfront
+        list(
+            Unit.objects.filter(pk__in=suggestions.values("unit_id"))
+            .select_for_update()
+            .values_list("pk", flat=True)
+        )
+        component.start_batched_checks()
 
-        if (
-            not user.has_perm("suggestion.accept", suggestion.unit)
-            or (approve and not user.has_perm("unit.review", suggestion.unit))
-            or list(suggestion.get_checks())
-        ):
-            failed += 1
-        else:
-            suggestion.accept(
-                request,
-                state=STATE_APPROVED if approve else STATE_TRANSLATED,
+        for suggestion in suggestions.iterator(chunk_size=100):
+            processed += 1
+            # Share the string between its suggestions to keep the state current
+            unit = suggestion.unit = units.setdefault(
+                suggestion.unit_id, suggestion.unit
             )
-            accepted += 1
+            # Ensure deferred changes accumulate on this Translation instance
+            unit.translation = translation
 
-        report_bulk_accept_user_suggestions_progress(processed, total)
+            if (
+                not can_accept
+                or not can_review
+                or unit.readonly
+                # Approved strings need additional permission
+                or (unit.approved and not user.has_perm("suggestion.accept", unit))
+                or list(suggestion.get_checks())
+            ):
+                failed += 1
+            else:
+                unit.is_batch_update = True
+                suggestion.apply(user, state, select_for_update=False)
+                accepted_ids.append(suggestion.pk)
+
+            report_bulk_accept_user_suggestions_progress(processed, total)
+
+        if accepted_ids:
+            Suggestion.objects.filter(pk__in=accepted_ids).delete()
+            translation.store_update_changes()
+            component.run_batched_checks()
+            translation.invalidate_cache()
+
+    accepted = len(accepted_ids)
 
     with override(user.profile.language if user else "en"):
         message_level = get_bulk_accept_user_suggestions_message_level(
@@ -523,9 +563,61 @@ def update_remotes() -> None:
         Component.objects.with_repo()
         .annotate(hourmod=F("id") % 24)
         .filter(hourmod=now.hour)
+        .values_list("pk", "repo", "branch")
+    )
+    for batch in get_remote_update_batches(components):
+        update_remote_components.delay(batch)
+
+
+def get_remote_update_batches(
+    components: Iterable[tuple[int, str, str]],
+) -> list[list[int]]:
+    """
+    Split components into independent remote update batches.
+
+    Every repository host gets at most AUTO_UPDATE_HOST_CONCURRENCY batches.
+    Components sharing a repository and branch stay in a single batch, so
+    they never fetch from the same remote concurrently.
+    """
+    hosts: dict[str | None, dict[tuple[str, str], list[int]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for pk, repo, branch in components:
+        host, _port = extract_url_host_port(repo)
+        hosts[host][repo, branch].append(pk)
+
+    concurrency = max(1, settings.AUTO_UPDATE_HOST_CONCURRENCY)
+    batches: list[list[int]] = []
+    for repositories in hosts.values():
+        host_batches: list[list[int]] = [
+            [] for _i in range(min(concurrency, len(repositories)))
+        ]
+        for index, component_ids in enumerate(repositories.values()):
+            host_batches[index % len(host_batches)].extend(component_ids)
+        batches.extend(host_batches)
+    return batches
+
+
+@app.task(trail=False)
+def update_remote_components(component_ids: list[int]) -> None:
+    """Update remote branches of components in a single batch."""
+    components = Component.objects.filter(pk__in=component_ids).prefetch()
+    unchanged = 0
+    for component in components.iterator(chunk_size=100):
+        previous_revision = component.remote_revision
+        try:
+            perform_update("Component", -1, auto=True, obj=component)
+        except WeblateLockTimeoutError:
+            # Do not block the rest of the batch, retry with backoff
+            perform_update.delay("Component", component.pk, auto=True)
+        else:
+            if component.remote_revision == previous_revision:
+                unchanged += 1
+    LOGGER.info(
+        "updated remotes of %d components, %d were unchanged",
+        len(component_ids),
+        unchanged,
     )
-    for component in components.prefetch().iterator(chunk_size=100):
-        perform_update("Component", -1, auto=True, obj=component)
 
 
 @app.task(trail=False)
@@ -1387,6 +1479,13 @@ def cleanup_reports() -> None:
     Report.objects.filter(created__lt=cutoff).delete()
 
 
+@app.task(trail=False)
+def maintain_change_partitions() -> None:
+    """Create upcoming history partitions and archive the old ones."""
+    ensure_change_partitions()
+    archive_change_partitions()
+
+
 def report_restore_component_progress(completed: int, total: int) -> None:
     if total:
         report_task_progress(30 + (60 * completed // total))
@@ -1419,8 +1518,7 @@ def restore_project_backup(
         workspace = Workspace.objects.get(pk=workspace_id)
     restore = ProjectBackup(filename)
     report_task_progress(10)
-    restore.validate()
-    report_task_progress(30)
+    # The archive is validated as part of the restore
     project = restore.restore(
         project_name=project_name,
         project_slug=project_slug,
@@ -1534,3 +1632,8 @@ def setup_periodic_tasks(sender, **kwargs) -> None:
     sender.add_periodic_task(
         crontab(hour=0, minute=50), cleanup_reports.s(), name="reports-cleanup"
     )
+    sender.add_periodic_task(
+        crontab(hour=1, minute=20),
+        maintain_change_partitions.s(),
+        name="maintain-change-partitions",
+    )
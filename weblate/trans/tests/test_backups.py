@@ -20,7 +20,9 @@ from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
+from django.db import connection
 from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from weblate.addons.webhooks import WebhookAddon
@@ -660,6 +662,62 @@ class BackupsTest(ViewTestCase):
             [1, restored.component_set.count() + 1],
         )
 
+    def test_restore_bulk_inserts_unit_metadata(self) -> None:
+        for unit in self.component.source_translation.unit_set.all():
+            unit.comment_set.create(comment="Test comment", user=self.user)
+            suggestion = unit.suggestion_set.create(target="Test", user=self.user)
+            Vote.objects.create(suggestion=suggestion, user=self.user, value=1)
+        backup = ProjectBackup()
+        backup.backup_project(self.project)
+
+        # Validation is done as part of the restore
+        restore = ProjectBackup(backup.filename)
+        with CaptureQueriesContext(connection) as context:
+            restored = restore.restore(
+                project_name="Restored", project_slug="restored", user=self.user
+            )
+
+        for table in ("trans_comment", "trans_suggestion", "trans_vote"):
+            self.assertEqual(
+                sum(f'INSERT INTO "{table}"' in query["sql"] for query in context),
+                1,
+                table,
+            )
+        self.assertEqual(
+            Vote.objects.filter(
+                suggestion__unit__translation__component__project=restored
+            ).count(),
+            self.component.source_translation.unit_set.count(),
+        )
+
+    def test_backup_units_query_count(self) -> None:
+        backup = ProjectBackup()
+        component_data = backup.backup_object(
+            self.component,
+            backup.component_schema["properties"]["component"]["required"],
+        )
+
+        def backup_units() -> tuple[list, int]:
+            with CaptureQueriesContext(connection) as context:
+                units = list(backup.backup_units(self.component, component_data))
+            return units, len(context)
+
+        units, queries = backup_units()
+        source_units = self.component.source_translation.unit_set.all()
+        for unit in source_units:
+            unit.comment_set.create(comment="Test comment", user=self.user)
+            suggestion = unit.suggestion_set.create(target="Test", user=self.user)
+            Vote.objects.create(suggestion=suggestion, user=self.user, value=1)
+        updated_units, updated_queries = backup_units()
+
+        # Related objects are prefetched instead of queried for every unit
+        self.assertEqual(queries, updated_queries)
+        self.assertEqual(len(units), len(updated_units))
+        self.assertEqual(
+            sum(len(unit["suggestions"]) for unit in updated_units),
+            source_units.count(),
+        )
+
     def test_create_backup(self) -> None:
         # Create linked component
         self.create_link_existing()
@@ -10,7 +10,8 @@ from django.test import override_settings
 from django.urls import reverse
 
 from weblate.auth.models import User
-from weblate.trans.models import Suggestion
+from weblate.trans.actions import ActionEvents
+from weblate.trans.models import Change, Suggestion
 from weblate.trans.tasks import (
     bulk_accept_user_suggestions as bulk_accept_user_suggestions_task,
 )
@@ -614,3 +615,37 @@ class BulkAcceptSuggestionsTest(ViewTestCase):
             call.kwargs["meta"]["progress"] for call in task.update_state.call_args_list
         ]
         self.assertEqual(progress_values, [0, 50, 100])
+
+    def test_bulk_accept_task_batches_updates(self):
+        """Test that checks and history are processed once for all strings."""
+        suggester = User.objects.create_user(username="batch-user", password="test")
+        other_unit = self.translation.unit_set.get(
+            source__startswith="Thank you for using Weblate"
+        )
+        Suggestion.objects.create(unit=self.unit, target="Nazdar!\n", user=suggester)
+        Suggestion.objects.create(
+            unit=other_unit, target="Díky za používání Weblate.", user=suggester
+        )
+
+        with patch(
+            "weblate.trans.models.Component.run_batched_checks"
+        ) as mocked_checks:
+            result = bulk_accept_user_suggestions_task(
+                translation_id=self.translation.id,
+                target_user_id=suggester.id,
+                user_id=self.user.id,
+            )
+
+        self.assertEqual(result["accepted"], 2)
+        mocked_checks.assert_called_once()
+        self.assertEqual(
+            Change.objects.filter(
+                action=ActionEvents.ACCEPT, unit__in=[self.unit, other_unit]
+            ).count(),
+            2,
+        )
+        self.unit.refresh_from_db()
+        other_unit.refresh_from_db()
+        self.assertEqual(self.unit.target, "Nazdar!\n")
+        self.assertEqual(other_unit.target, "Díky za používání Weblate.")
+        self.assertFalse(Suggestion.objects.filter(user=suggester).exists())
@@ -38,6 +38,7 @@ from weblate.trans.models import (
     Translation,
     Unit,
 )
+from weblate.trans.models.component import merge_commit_payloads
 from weblate.trans.tests.test_models import RepoTestCase
 from weblate.trans.tests.test_views import (
     ComponentTestCase,
@@ -2236,6 +2237,61 @@ class ComponentErrorTest(RepoTestCase):
         self.component.delete_commit_task()
         self.assertIsNone(cache.get(self.component.commit_task_reschedule_key))
 
+    def test_queue_commit_pending_coalesces_requests(self) -> None:
+        cache.delete(self.component.commit_task_key)
+        cache.delete(self.component.commit_task_reschedule_key)
+
+        with (
+            override_settings(CELERY_TASK_ALWAYS_EAGER=False),
+            patch("weblate.trans.models.component.uuid", return_value="commit-task-id"),
+            patch("weblate.trans.tasks.perform_commit.apply_async") as apply_async,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.component.queue_commit_pending("commit")
+            self.component.queue_commit_pending(
+                "upload", force_scan=True, previous_head="abc"
+            )
+            self.component.queue_commit_pending("commit", previous_head="def")
+
+        apply_async.assert_called_once()
+        self.assertEqual(
+            cache.get(self.component.commit_task_reschedule_key),
+            {
+                "reason": "commit",
+                "user_id": None,
+                "force_scan": True,
+                "previous_head": "abc",
+            },
+        )
+        self.component.delete_commit_task()
+
+    def test_queue_commit_pending_merges_under_lock(self) -> None:
+        cache.delete(self.component.commit_task_key)
+        cache.delete(self.component.commit_task_reschedule_key)
+        lock = self.component.commit_task_lock
+        locked: list[bool] = []
+
+        def merge(previous, payload):
+            locked.append(lock.is_locked)
+            return merge_commit_payloads(previous, payload)
+
+        with (
+            override_settings(CELERY_TASK_ALWAYS_EAGER=False),
+            patch("weblate.trans.models.component.uuid", return_value="commit-task-id"),
+            patch("weblate.trans.tasks.perform_commit.apply_async"),
+            patch(
+                "weblate.trans.models.component.merge_commit_payloads",
+                side_effect=merge,
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.component.queue_commit_pending("commit")
+            self.component.queue_commit_pending("upload", previous_head="abc")
+
+        self.assertEqual(locked, [True])
+        self.assertFalse(lock.is_locked)
+        self.component.delete_commit_task()
+
     def test_queue_commit_pending_does_not_reopen_finished_task(self) -> None:
         cache.delete(self.component.commit_task_key)
         cache.delete(self.component.commit_task_reschedule_key)
@@ -414,6 +414,33 @@ class ImportTest(ImportBaseTest):
         self.assertEqual(translation.stats.translated, 1)
 
 
+class ImportChangeBufferTest(ImportBaseTest):
+    def test_import_buffers_changes(self) -> None:
+        with (
+            patch("weblate.trans.models.change.change_bulk_create") as bulk_signal,
+            patch("weblate.memory.tasks.update_memory.delay_on_commit") as memory,
+            patch(
+                "weblate.memory.tasks.update_memory_bulk.delay_on_commit"
+            ) as memory_bulk,
+        ):
+            self.do_import()
+
+        # All changes are created and dispatched at once
+        bulk_signal.send.assert_called_once()
+        actions = {
+            change.action for change in bulk_signal.send.call_args.kwargs["instances"]
+        }
+        self.assertIn(ActionEvents.UPLOAD, actions)
+        self.assertIn(ActionEvents.FILE_UPLOAD, actions)
+        self.assertTrue(
+            Change.objects.filter(
+                action=ActionEvents.FILE_UPLOAD, translation=self.get_translation()
+            ).exists()
+        )
+        memory.assert_not_called()
+        memory_bulk.assert_called_once()
+
+
 class ImportErrorTest(ImportBaseTest):
     """Testing import of broken files."""
 
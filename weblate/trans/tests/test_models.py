@@ -870,6 +870,112 @@ class TranslationTest(RepoTestCase):
         self.assertEqual(component.repository.count_outgoing(), count)
         self.assertEqual(translation.count_pending_units, 0)
 
+    @override_settings(COMMIT_PENDING_WORKERS=2)
+    def test_commit_parallel(self) -> None:
+        component = self.create_component()
+        user = create_test_user()
+        start_rev = component.repository.last_revision
+        translations = list(
+            component.translation_set.exclude(language_id=component.source_language_id)
+        )
+        self.assertGreater(len(translations), 1)
+        for translation in translations:
+            unit = translation.unit_set.get(source="Hello, world!\n")
+            unit.translate(
+                user, f"Hello {translation.language_code}\n", STATE_TRANSLATED
+            )
+
+        with patch.object(
+            Component, "save_deferred_commits", wraps=Component.save_deferred_commits
+        ) as save_deferred_commits:
+            component.commit_pending("test", None)
+
+        save_deferred_commits.assert_called_once()
+        self.assertEqual(
+            len(save_deferred_commits.call_args.args[0]), len(translations)
+        )
+        self.assertNotEqual(start_rev, component.repository.last_revision)
+        self.assertEqual(component.repository.count_outgoing(), len(translations))
+        for translation in translations:
+            self.assertEqual(translation.count_pending_units, 0)
+            self.assertIn(
+                f"Hello {translation.language_code}",
+                get_optional_path(translation.get_filename()).read_text(),
+            )
+
+    @override_settings(COMMIT_PENDING_WORKERS=2)
+    def test_commit_parallel_failure(self) -> None:
+        component = self.create_component()
+        user = create_test_user()
+        translations = list(
+            component.translation_set.exclude(language_id=component.source_language_id)
+        )
+        self.assertGreater(len(translations), 1)
+        for translation in translations:
+            unit = translation.unit_set.get(source="Hello, world!\n")
+            unit.translate(
+                user, f"Hello {translation.language_code}\n", STATE_TRANSLATED
+            )
+        failing = translations[0]
+        save_pending_store = Translation.save_pending_store
+
+        def fail_pending_store(translation, store) -> None:
+            if translation.pk == failing.pk:
+                msg = "Commit failed"
+                raise FailedCommitError(msg)
+            save_pending_store(translation, store)
+
+        with (
+            patch.object(
+                Translation,
+                "save_pending_store",
+                autospec=True,
+                side_effect=fail_pending_store,
+            ),
+            self.assertRaises(FailedCommitError),
+        ):
+            component.commit_pending("test", None)
+
+        # Changes committed to the repository are not pending anymore
+        self.assertEqual(component.repository.count_outgoing(), len(translations) - 1)
+        for translation in translations[1:]:
+            self.assertEqual(translation.count_pending_units, 0)
+        self.assertEqual(failing.count_pending_units, 1)
+
+    @override_settings(COMMIT_PENDING_WORKERS=2)
+    def test_commit_parallel_failure_rollback(self) -> None:
+        component = self.create_component()
+        user = create_test_user()
+        translations = list(
+            component.translation_set.exclude(language_id=component.source_language_id)
+        )
+        units = []
+        for translation in translations:
+            unit = translation.unit_set.get(source="Hello, world!\n")
+            unit.translate(
+                user, f"Hello {translation.language_code}\n", STATE_TRANSLATED
+            )
+            units.append(Unit.objects.get(pk=unit.pk))
+
+        with (
+            patch.object(
+                Translation,
+                "save_pending_store",
+                side_effect=FailedCommitError("Commit failed"),
+            ),
+            self.assertRaises(FailedCommitError),
+        ):
+            component.commit_pending("test", None)
+
+        # Nothing was written, so the units are kept untouched
+        for unit in units:
+            updated = Unit.objects.get(pk=unit.pk)
+            self.assertEqual(updated.details, unit.details)
+            self.assertEqual(updated.target, unit.target)
+            self.assertEqual(updated.state, unit.state)
+            self.assertEqual(updated.translation.count_pending_units, 1)
+        self.assertEqual(component.repository.count_outgoing(), 0)
+
     def test_group_changes_by_author(self) -> None:
         component = self.create_component()
         translation = component.translation_set.get(language_code="cs")
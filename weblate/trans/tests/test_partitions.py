@@ -0,0 +1,68 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for history table partitioning."""
+
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from weblate.trans.actions import ActionEvents
+from weblate.trans.models import Change
+from weblate.trans.partitions import (
+    ChangePartition,
+    add_months,
+    archive_change_partitions,
+    ensure_change_partitions,
+    get_change_partitions,
+    is_change_partitioned,
+)
+
+
+class ChangePartitionHelpersTest(SimpleTestCase):
+    def test_add_months(self) -> None:
+        self.assertEqual(add_months(date(2026, 11, 15), 2), date(2027, 1, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+
+    def test_partition(self) -> None:
+        partition = ChangePartition.for_month(date(2026, 12, 24))
+        self.assertEqual(partition.name, "trans_change_p2026_12")
+        self.assertEqual(partition.end, date(2027, 1, 1))
+        self.assertEqual(ChangePartition.from_name(partition.name), partition)
+        self.assertIsNone(ChangePartition.from_name("trans_change_default"))
+
+
+class ChangePartitionTest(TestCase):
+    def test_not_partitioned(self) -> None:
+        self.assertFalse(is_change_partitioned())
+        self.assertEqual(ensure_change_partitions(), [])
+        self.assertEqual(archive_change_partitions(12), [])
+        with self.assertRaises(CommandError):
+            call_command("partition_changes", stdout=StringIO())
+
+    def test_partition_and_archive(self) -> None:
+        timestamp = timezone.now() - timedelta(days=500)
+        old = Change.objects.create(action=ActionEvents.CHANGE)
+        Change.objects.filter(pk=old.pk).update(timestamp=timestamp)
+
+        output = StringIO()
+        call_command("partition_changes", "--convert", stdout=output)
+        self.assertIn("Converted the history table", output.getvalue())
+        self.assertTrue(is_change_partitioned())
+        old_partition = ChangePartition.for_month(timestamp.date())
+        self.assertIn(old_partition, get_change_partitions())
+        self.assertEqual(ensure_change_partitions(), [])
+
+        recent = Change.objects.create(action=ActionEvents.CHANGE)
+        self.assertGreater(recent.pk, old.pk)
+        self.assertEqual(Change.objects.get(pk=old.pk).timestamp, timestamp)
+
+        self.assertIn(old_partition.name, archive_change_partitions(12))
+        self.assertNotIn(old_partition, get_change_partitions())
+        self.assertFalse(Change.objects.filter(pk=old.pk).exists())
+        self.assertTrue(Change.objects.filter(pk=recent.pk).exists())
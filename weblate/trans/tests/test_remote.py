@@ -393,6 +393,30 @@ class MultiRepoTest(ViewTestCase):
         self.assertIsNone(error)
         self.assertEqual(sampled_locks, [True])
 
+    def test_update_remote_repository_probe_skips_fetch(self) -> None:
+        """Test unchanged remote is not fetched."""
+        repository = self.component2.repository
+        revision = repository.last_remote_revision
+        with patch.object(repository, "update_remote") as update_remote:
+            previous_revision, error = self.component2.update_remote_repository(
+                probe=True
+            )
+        self.assertEqual(previous_revision, revision)
+        self.assertIsNone(error)
+        update_remote.assert_not_called()
+
+    def test_update_remote_repository_probe_fetches_changes(self) -> None:
+        """Test changed remote is fetched after probing."""
+        repository = self.component2.repository
+        with (
+            patch.object(
+                repository, "probe_remote_revision", return_value="new-remote"
+            ),
+            patch.object(repository, "update_remote") as update_remote,
+        ):
+            self.component2.update_remote_repository(probe=True)
+        update_remote.assert_called_once()
+
     def test_update_remote_repository_reports_fetch_error_context(self) -> None:
         """Test fetch errors are reported with active exception context."""
         repository = self.component2.repository
@@ -11,6 +11,7 @@ from django.utils import timezone
 
 from weblate.auth.models import User
 from weblate.memory.models import Memory
+from weblate.metrics.models import ContributionRollup
 from weblate.trans.forms import (
     MIN_COST_ESTIMATE_TM_THRESHOLD,
     CountsReportsForm,
@@ -331,6 +332,20 @@ class ReportsTest(BaseReportsTest):
         self.assertEqual(data[0]["words_new"], 2)
         self.assertEqual(data[0]["words_edit"], 4)
 
+    def test_counts_all_uses_rollup(self) -> None:
+        self.edit_unit("Hello, world!\n", "Nazdar svete!\n")
+        self.edit_unit("Hello, world!\n", "Nazdar svete 2!\n")
+        expected = self.generate_count_data(CountsReportsForm.COUNTING_MODE_ALL)
+
+        ContributionRollup.objects.rollup_day(timezone.localdate())
+        # The rolled up day is no longer read from the changes
+        Change.objects.content().delete()
+
+        self.assertEqual(
+            self.generate_count_data(CountsReportsForm.COUNTING_MODE_ALL), expected
+        )
+        self.assertEqual(self.generate_count_data(), [])
+
     def test_counts_unique_repeated_approvals(self) -> None:
         user = User.objects.create(
             username="approvalbase",
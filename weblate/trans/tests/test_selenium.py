@@ -58,7 +58,7 @@ from weblate.machinery.dummy import DummyTranslation
 from weblate.metrics.models import Metric
 from weblate.metrics.wrapper import MetricsWrapper
 from weblate.screenshots.models import Screenshot
-from weblate.screenshots.views import ensure_tesseract_language
+from weblate.screenshots.ocr import ensure_tesseract_language
 from weblate.trans.actions import ActionEvents
 from weblate.trans.models import (
     Announcement,
@@ -31,6 +31,7 @@ from weblate.trans.tasks import (
     commit_pending,
     component_alerts,
     daily_update_checks,
+    get_remote_update_batches,
     perform_commit,
     project_removal,
     update_checks,
@@ -212,6 +213,20 @@ class TasksTest(ComponentTestCase):
     def test_update_remotes(self) -> None:
         update_remotes()
 
+    @override_settings(AUTO_UPDATE_HOST_CONCURRENCY=2)
+    def test_remote_update_batches(self) -> None:
+        batches = get_remote_update_batches(
+            [
+                (1, "https://github.com/WeblateOrg/weblate.git", "main"),
+                (2, "https://github.com/WeblateOrg/weblate.git", "main"),
+                (3, "git@github.com:WeblateOrg/website.git", "main"),
+                (4, "https://github.com/WeblateOrg/hosted.git", "main"),
+                (5, "https://gitlab.com/WeblateOrg/weblate.git", "main"),
+                (6, "https://github.com/WeblateOrg/weblate.git", "other"),
+            ]
+        )
+        self.assertEqual(batches, [[1, 2, 4], [3, 6], [5]])
+
     def test_commit_pending(self) -> None:
         self.component.commit_pending_age = 1
         self.component.save()
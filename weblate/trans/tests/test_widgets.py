@@ -35,6 +35,7 @@ from weblate.trans.widgets import (
     NormalWidget,
     OpenGraphWidget,
     PNGBadgeWidget,
+    SVGBadgeWidget,
 )
 from weblate.utils.state import STATE_TRANSLATED
 from weblate.utils.xml import parse_xml
@@ -346,6 +347,38 @@ class WidgetsTest(FixtureTestCase):
             )
         )
 
+    def test_widget_cache(self) -> None:
+        url = reverse(
+            "widget-image",
+            kwargs={
+                "path": self.get_translation().get_url_path(),
+                "widget": "svg",
+                "color": "badge",
+                "extension": "svg",
+            },
+        )
+        response = self.client.get(url)
+        self.assert_svg(response)
+        etag = response["ETag"]
+
+        # Served from the cache
+        with patch.object(SVGBadgeWidget, "render") as mocked_render:
+            cached = self.client.get(url)
+        mocked_render.assert_not_called()
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached["ETag"], etag)
+
+        # Conditional request
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        # Stats update changes the key
+        with self.captureOnCommitCallbacks(execute=True):
+            self.change_unit("Nazdar svete!\n")
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
 
 class WidgetsMeta(type):
     def __new__(mcs, name: str, bases: tuple[type], attrs: dict[str, Any]):
@@ -7,14 +7,16 @@ from __future__ import annotations
 from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from operator import itemgetter
-from typing import TYPE_CHECKING, Any
+from functools import reduce
+from operator import itemgetter, or_
+from typing import TYPE_CHECKING, Any, cast
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db.models import Q
 from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils.html import format_html, format_html_join
@@ -24,7 +26,12 @@ from django.views.decorators.http import require_POST
 
 from weblate.lang.models import Language
 from weblate.memory.machine import WeblateMemory
-from weblate.trans.actions import ActionEvents
+from weblate.metrics.models import (
+    CONTRIBUTION_FIELDS,
+    ContributionRollup,
+    get_change_contribution,
+    get_contribution_bucket,
+)
 from weblate.trans.autotranslate import fetch_machinery_matches
 from weblate.trans.forms import (
     CostEstimateReportsForm,
@@ -42,8 +49,9 @@ from weblate.trans.models import (
     Translation,
     Unit,
 )
+from weblate.trans.models.change import dt_as_day_range
 from weblate.trans.translator_analysis import analyze_translator_work
-from weblate.trans.util import count_words, redirect_param
+from weblate.trans.util import redirect_param
 from weblate.utils.celery import store_task_metadata
 from weblate.utils.state import FUZZY_STATES, STATE_READONLY
 from weblate.utils.views import parse_path, show_form_errors
@@ -689,6 +697,53 @@ def increment_count(result: dict[str, str | int], key: str, increment: int) -> N
     result[key] = value + increment
 
 
+def get_count_entry(
+    result: dict[str, dict[str, str | int]],
+    name: str,
+    email: str,
+    date_joined: datetime,
+) -> dict[str, str | int]:
+    if email not in result:
+        result[email] = {
+            "name": name,
+            "email": email,
+            "date_joined": date_joined.isoformat(),
+            **COUNT_DEFAULTS,
+        }
+    return result[email]
+
+
+def add_counts(current: dict[str, str | int], suffix: str, values) -> None:
+    for key in CONTRIBUTION_FIELDS:
+        increment_count(current, key, values[key])
+        increment_count(current, f"{key}_{suffix}", values[key])
+
+
+def add_rollup_counts(
+    result: dict[str, dict[str, str | int]],
+    days: list,
+    user: User | None,
+    language_code: str,
+    category: Category | None,
+    **kwargs,
+) -> None:
+    """Add counts from the daily contribution rollups."""
+    if category is not None:
+        kwargs["component_id__in"] = category.get_component_ids_with_links()
+    if language_code:
+        kwargs["language__code"] = language_code
+    if user:
+        kwargs["author"] = user
+    for totals in ContributionRollup.objects.get_totals(days, **kwargs):
+        current = get_count_entry(
+            result,
+            totals["author__full_name"],
+            totals["author__email"] or "",
+            totals["author__date_joined"],
+        )
+        add_counts(current, totals["bucket"], totals)
+
+
 def generate_counts(
     user: User | None,
     start_date,
@@ -701,10 +756,6 @@ def generate_counts(
 ):
     """Generate credits data for given component."""
     result: dict[str, dict[str, str | int]] = {}
-    action_map: dict[int, str] = {
-        ActionEvents.NEW: "new",
-        ActionEvents.APPROVE: "approve",
-    }
 
     base = Change.objects.content().filter(unit__isnull=False)
     base = base.filter(author=user) if user else base.filter(author__isnull=False)
@@ -718,55 +769,35 @@ def generate_counts(
     changes = base.filter(timestamp__range=(start_date, end_date), **kwargs)
     if category is not None:
         changes = changes.for_category(category)
-    if counting_mode == CountsReportsForm.COUNTING_MODE_UNIQUE:
+
+    if counting_mode == CountsReportsForm.COUNTING_MODE_ALL:
+        # Use daily rollups for days completely within the range, these
+        # can not be used for unique counting as that spans the whole range
+        days = ContributionRollup.objects.get_covered_days(start_date, end_date)
+        if days:
+            add_rollup_counts(result, days, user, language_code, category, **kwargs)
+            changes = changes.exclude(
+                reduce(or_, (Q(timestamp__range=dt_as_day_range(day)) for day in days))
+            )
+    else:
         changes = changes.order_by("-timestamp", "-pk")
+
     changes = changes.prefetch_related("author", "language", "unit")
     seen_changes = set()
     for change in changes:
-        author = change.author
-        unit = change.unit
-        if author is None or unit is None:
-            msg = "Content changes require both an author and a unit"
-            raise RuntimeError(msg)
-        email = author.email or ""
-
-        if email not in result:
-            current: dict[str, str | int] = {
-                "name": author.full_name,
-                "email": email,
-                "date_joined": author.date_joined.isoformat(),
-                **COUNT_DEFAULTS,
-            }
-            result[email] = current
-        else:
-            current = result[email]
-
-        suffix = action_map.get(change.action, "edit")
+        suffix = get_contribution_bucket(change.action)
         if counting_mode == CountsReportsForm.COUNTING_MODE_UNIQUE:
             deduplicated_key = (change.author_id, change.unit_id, suffix)
             if deduplicated_key in seen_changes:
                 continue
             seen_changes.add(deduplicated_key)
 
-        src_chars = len(unit.source)
-        src_words = unit.num_words
-        tgt_chars = len(change.target)
-        tgt_words = count_words(change.target, change.language)
-        edits = change.get_distance()
-
-        increment_count(current, "chars", src_chars)
-        increment_count(current, "words", src_words)
-        increment_count(current, "t_chars", tgt_chars)
-        increment_count(current, "t_words", tgt_words)
-        increment_count(current, "edits", edits)
-        increment_count(current, "count", 1)
-
-        increment_count(current, f"t_chars_{suffix}", tgt_chars)
-        increment_count(current, f"t_words_{suffix}", tgt_words)
-        increment_count(current, f"chars_{suffix}", src_chars)
-        increment_count(current, f"words_{suffix}", src_words)
-        increment_count(current, f"edits_{suffix}", edits)
-        increment_count(current, f"count_{suffix}", 1)
+        values = get_change_contribution(change)
+        author = cast("User", change.author)
+        current = get_count_entry(
+            result, author.full_name, author.email or "", author.date_joined
+        )
+        add_counts(current, suffix, values)
 
     result_list = list(result.values())
     sort_by_key = "count" if sort_by == "count" else "date_joined"
@@ -7,11 +7,14 @@ import json
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.decorators import login_not_required
+from django.core.cache import cache
 from django.core.serializers.json import DjangoJSONEncoder
 from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.utils.html import format_html
+from django.utils.http import quote_etag
 from django.utils.translation import gettext
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -21,7 +24,7 @@ from weblate.lang.models import Language
 from weblate.trans.forms import EngageForm
 from weblate.trans.models import Component, Project, Translation
 from weblate.trans.util import render
-from weblate.trans.widgets import WIDGETS, OpenGraphWidget
+from weblate.trans.widgets import WIDGET_CACHE_TIMEOUT, WIDGETS, OpenGraphWidget
 from weblate.utils.site import get_site_url
 from weblate.utils.stats import ProjectLanguage
 from weblate.utils.views import parse_path, show_form_errors, try_set_language
@@ -198,9 +201,21 @@ def render_widget(
         }
         return redirect("widget-image", permanent=True, **kwargs)
 
-    # Render widget
-    response = HttpResponse(content_type=widget_obj.content_type)
-    widget_obj.render(request, response)
+    # Serve rendered widget from the cache, the key changes with the stats
+    cache_key = widget_obj.get_cache_key(request)
+    etag = quote_etag(cache_key)
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        return response
+    content = cache.get(cache_key)
+    if content is None:
+        # Render widget
+        response = HttpResponse(content_type=widget_obj.content_type)
+        widget_obj.render(request, response)
+        cache.set(cache_key, response.content, WIDGET_CACHE_TIMEOUT)
+    else:
+        response = HttpResponse(content, content_type=widget_obj.content_type)
+    response["ETag"] = etag
     return response
 
 
@@ -41,6 +41,7 @@ from weblate.trans.models import Component, Project
 from weblate.trans.util import sort_unicode, translation_percent
 from weblate.utils import messages
 from weblate.utils.formatting import number_format
+from weblate.utils.hash import calculate_checksum
 from weblate.utils.icons import find_static_file
 from weblate.utils.site import get_site_url
 from weblate.utils.stats import (
@@ -77,6 +78,9 @@ WIDGET_FONT_ASCENT = 1.02
 WIDGET_FONT_DESCENT = 0.4
 PNG_BADGE_FONT_SIZE = 11
 PNG_BADGE_BASELINE = 14
+# Bump when the widgets rendering changes to ignore previously cached content
+WIDGET_CACHE_VERSION = "1"
+WIDGET_CACHE_TIMEOUT = 86400
 
 
 def get_widget_text_metrics(font_properties: FontProperties) -> tuple[int, int]:
@@ -152,6 +156,31 @@ class Widget:
             return self.colors[0]
         return color
 
+    def get_cache_key(self, request: HttpRequest) -> str:
+        """
+        Return cache key of the rendered widget.
+
+        The key includes the stats timestamp, so it changes whenever the
+        stats are updated.
+        """
+        return "widget-{}".format(
+            calculate_checksum(
+                WIDGET_CACHE_VERSION,
+                self.name,
+                self.color,
+                self.stats.cache_key,
+                str(self.obj or ""),
+                str(self.stats.stats_timestamp),
+                str(self.percent),
+                str(self.non_glossary_stats["all"]),
+                get_language() or "",
+                *(
+                    request.GET.get(parameter["name"], "")
+                    for parameter in self.extra_parameters
+                ),
+            )
+        )
+
     def get_percent_text(self):
         return pgettext("Translated percents", "%(percent)s%%") % {
             "percent": int(self.percent)
@@ -707,6 +707,33 @@ async def _async_send_with_redirects(
         auth = None
 
 
+def _client_request(
+    client: httpx2.Client,
+    method: str,
+    url: str,
+    *,
+    follow_redirects: bool = True,
+    **kwargs,
+) -> httpx2.Response:
+    request, request_auth = _build_client_request(client, method, url, kwargs=kwargs)
+    response = (
+        _send_with_redirects(client, request, auth=request_auth)
+        if follow_redirects
+        else client.send(
+            request,
+            stream=True,
+            auth=request_auth,
+            follow_redirects=False,
+        )
+    )
+    try:
+        response.read()
+    except BaseException:
+        response.close()
+        raise
+    return response
+
+
 def _request(
     method: str,
     url: str,
@@ -716,25 +743,9 @@ def _request(
     **kwargs,
 ) -> httpx2.Response:
     with create_http_client(validators=validators) as client:
-        request, request_auth = _build_client_request(
-            client, method, url, kwargs=kwargs
+        return _client_request(
+            client, method, url, follow_redirects=follow_redirects, **kwargs
         )
-        response = (
-            _send_with_redirects(client, request, auth=request_auth)
-            if follow_redirects
-            else client.send(
-                request,
-                stream=True,
-                auth=request_auth,
-                follow_redirects=False,
-            )
-        )
-        try:
-            response.read()
-        except BaseException:
-            response.close()
-            raise
-        return response
 
 
 async def _async_request(
@@ -822,6 +833,42 @@ def fetch_validated_url(
     return response
 
 
+def create_validated_http_client(
+    *,
+    allow_private_targets: bool = False,
+    private_allowlist: list[str] | tuple[str, ...] = (),
+) -> httpx2.Client:
+    """
+    Create a client validating requests same as fetch_validated_url.
+
+    The client keeps connections alive, so it can be used to send several
+    requests to the same host.
+    """
+    return create_http_client(
+        validators=RuntimeRedirectValidators(
+            allow_private_targets=allow_private_targets,
+            private_allowlist=private_allowlist,
+        )
+    )
+
+
+def fetch_client_url(
+    client: httpx2.Client,
+    method: str,
+    url: str,
+    *,
+    raise_for_status: bool = True,
+    follow_redirects: bool = True,
+    **kwargs,
+) -> httpx2.Response:
+    response = _client_request(
+        client, method, url, follow_redirects=follow_redirects, **kwargs
+    )
+    if raise_for_status:
+        response.raise_for_status()
+    return response
+
+
 async def async_fetch_validated_url(
     method: str,
     url: str,
@@ -1283,6 +1283,14 @@ class Repository:
         """Update remote repository."""
         raise NotImplementedError
 
+    def probe_remote_revision(self) -> str | None:
+        """
+        Return current revision of the remote branch without fetching it.
+
+        None is returned when the backend can not cheaply query the remote.
+        """
+        return None
+
     def status(self) -> str:
         """Return status of the repository."""
         return self.execute(self._cmd_status, remote_op="none", needs_lock=False)
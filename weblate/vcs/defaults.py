@@ -21,6 +21,7 @@ DEFAULT_VCS_BACKENDS: tuple[str, ...] = (
 )
 
 DEFAULT_VCS_CLONE_DEPTH = 1
+DEFAULT_VCS_GIT_OBJECT_READER = "weblate.vcs.gitbatch.GitBatchObjectReader"
 DEFAULT_VCS_API_DELAY = 10
 DEFAULT_VCS_API_TIMEOUT = 10
 DEFAULT_VCS_ALLOW_SCHEMES: frozenset[str] = frozenset({"https", "ssh"})
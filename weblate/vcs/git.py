@@ -20,7 +20,7 @@ from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from ipaddress import ip_address
 from json import dumps
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from time import sleep, time
 from typing import (
     TYPE_CHECKING,
@@ -40,6 +40,7 @@ import httpx2
 from django.conf import settings
 from django.core.cache import cache
 from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext, gettext_lazy
 from git.config import GitConfigParser
 from idna import IDNAError
@@ -82,6 +83,7 @@ from weblate.vcs.gpg import get_gpg_sign_key
 from weblate.vcs.params import (
     CreateMergeRequest,
     GitForcePush,
+    GitSparseCheckout,
     MergeRequestAutomerge,
     MergeRequestMergeMethod,
 )
@@ -100,6 +102,7 @@ if TYPE_CHECKING:
         RawCommitInfo,
         RepositoryErrorCode,
     )
+    from weblate.vcs.gitbatch import GitObjectReader
 
 LOCK_ERROR = re.compile(r"Unable to create '([^']*\.git/[^']*\.lock)': File exists")
 # Assume lock is stale after one hour
@@ -135,6 +138,7 @@ mutation($pullRequestId: ID!, $mergeMethod: PullRequestMergeMethod!) {
 # Returned when the pull request has no pending requirements, so there is
 # nothing for auto-merge to wait for.
 AUTOMERGE_CLEAN_STATUS_ERROR = "Pull request is in clean status"
+GLOB_MAGIC_RE = re.compile(r"[*?[]")
 
 
 @dataclass
@@ -153,6 +157,39 @@ class GitProbeRedirectValidators(RedirectValidators):
         return self.target.addresses
 
 
+def get_sparse_directory(mask: str) -> str | None:
+    """
+    Return directory which has to be checked out for a file mask.
+
+    Empty string is returned for files in the top level directory, these are
+    always present in the cone mode sparse checkout. None indicates that the
+    mask can match files in any directory.
+    """
+    parts: list[str] = []
+    for part in PurePosixPath(mask).parts[:-1]:
+        if part in {"/", ".."}:
+            return None
+        if GLOB_MAGIC_RE.search(part):
+            if not parts:
+                return None
+            break
+        parts.append(part)
+    return "/".join(parts)
+
+
+def get_sparse_parent_directories(directories: list[str]) -> list[str]:
+    """
+    Return parents of sparse checkout directories.
+
+    Files directly inside these are checked out in the cone mode as well.
+    """
+    result: set[str] = set()
+    for directory in directories:
+        parts = directory.split("/")
+        result.update("/".join(parts[:depth]) for depth in range(1, len(parts)))
+    return sorted(result)
+
+
 def _normalize_redirect_hostname(hostname: str) -> str:
     """Normalize hostnames for redirect-origin comparisons."""
     normalized = hostname.rstrip(".")
@@ -438,6 +475,12 @@ class GitRepository(Repository):
         "--",
     ]
     _cmd_list_changed_files: ClassVar[list[str]] = ["diff", "--name-status"]
+    _cmd_list_missing: ClassVar[list[str]] = [
+        "rev-list",
+        "--objects",
+        "--no-walk",
+        "--missing=print",
+    ]
     _cmd_push: ClassVar[list[str]] = ["push"]
     _cmd_status: ClassVar[list[str]] = ["--no-optional-locks", "status"]
 
@@ -531,6 +574,9 @@ class GitRepository(Repository):
             {
                 "GIT_LFS_SKIP_PUSH": "1",
                 "GIT_LFS_SKIP_SMUDGE": "1",
+                # Missing objects in partial clones have to be fetched
+                # explicitly so that the remote connection is pinned
+                "GIT_NO_LAZY_FETCH": "1",
             }
         )
         return super()._getenv(git_environment, cwd=cwd)
@@ -927,6 +973,7 @@ class GitRepository(Repository):
         ).strip()
 
     def checkout_with_temp_cleanup(self, branch: str) -> None:
+        self.prefetch_sparse_checkout(branch)
         current_branch = self.get_current_branch()
         command = ["checkout"]
         if current_branch in TEMPORARY_BRANCHES and current_branch != branch:
@@ -1091,11 +1138,19 @@ class GitRepository(Repository):
     ) -> None:
         """Clone repository."""
         branch = self.validate_branch_name(branch)
+        sparse_directories = (
+            self.get_sparse_checkout_dirs() if target == self.path else None
+        )
         args, environment = self.prepare_remote_command(
             [
                 *self._get_auth_args(source),
                 "clone",
                 *self.get_depth(),
+                *(
+                    ()
+                    if sparse_directories is None
+                    else ("--filter=blob:none", "--no-checkout")
+                ),
                 "--branch",
                 branch,
                 "--",
@@ -1116,6 +1171,135 @@ class GitRepository(Repository):
                     environment,
                 )
             raise
+        if sparse_directories is not None:
+            self.configure_sparse_checkout(sparse_directories)
+            self.execute(["checkout"], remote_op="none")
+
+    def get_sparse_checkout_dirs(self) -> list[str] | None:
+        """
+        List directories needed by components using this repository.
+
+        Returns None when sparse checkout is not turned on or the file masks
+        do not allow limiting the checkout.
+        """
+        if (
+            self.component is None
+            or not GitSparseCheckout.supports_vcs(self.get_identifier())
+            or not self.get_vcs_param(GitSparseCheckout)
+        ):
+            return None
+        result: set[str] = set()
+        for mask in self.component.get_repository_file_masks():
+            directory = get_sparse_directory(mask)
+            if directory is None:
+                return None
+            if directory:
+                result.add(directory)
+        return sorted(result)
+
+    def is_sparse_checkout(self) -> bool:
+        return self.get_git_file_path("info/sparse-checkout").exists()
+
+    def get_sparse_checkout_list(self) -> list[str]:
+        return sorted(
+            self.execute(
+                ["sparse-checkout", "list"],
+                remote_op="none",
+                needs_lock=False,
+                merge_err=False,
+            ).splitlines()
+        )
+
+    def configure_sparse_checkout(self, directories: list[str]) -> None:
+        """Limit the working tree to given directories."""
+        # The files have to be present before they are checked out
+        self.fetch_sparse_blobs(directories, "HEAD")
+        self.execute(
+            ["sparse-checkout", "set", "--cone", "--", *directories],
+            remote_op="none",
+        )
+
+    def prefetch_sparse_checkout(self, revision: str) -> None:
+        """Download file contents needed to check out a revision."""
+        if self.is_sparse_checkout():
+            self.fetch_sparse_blobs(self.get_sparse_checkout_list(), revision)
+
+    def disable_sparse_checkout(self) -> None:
+        """Restore the full checkout of a repository cloned without contents."""
+        self.fetch_sparse_blobs(None, "HEAD", *self.get_upstream_revisions())
+        self.execute(["sparse-checkout", "disable"], remote_op="none")
+        self.get_git_file_path("info/sparse-checkout").unlink(missing_ok=True)
+        # Further fetches download file contents as well
+        self.config_update(('remote "origin"', "partialclonefilter", None))
+
+    def fetch_sparse_blobs(
+        self, directories: list[str] | None, *revisions: str
+    ) -> None:
+        """
+        Download file contents needed for the sparse checkout.
+
+        Lazy fetching is disabled, so everything Weblate reads has to be
+        fetched upfront in a single request. Passing None as directories
+        fetches contents of all files.
+        """
+        missing: set[str] = set()
+        for revision in revisions:
+            if directories is None:
+                commands = [[*self._cmd_list_missing, revision]]
+            else:
+                # Top level files are always checked out in the cone mode
+                commands = [[*self._cmd_list_missing, "--filter=tree:2", revision]]
+            if directories:
+                if trees := self.get_tree_ids(revision, directories):
+                    commands.append([*self._cmd_list_missing, *trees])
+                # Files directly inside parent directories are checked out as well
+                if parents := self.get_tree_ids(
+                    revision, get_sparse_parent_directories(directories)
+                ):
+                    commands.append(
+                        [*self._cmd_list_missing, "--filter=tree:1", *parents]
+                    )
+            for command in commands:
+                missing.update(
+                    line[1:]
+                    for line in self.execute(
+                        command, remote_op="none", needs_lock=False, merge_err=False
+                    ).splitlines()
+                    if line.startswith("?")
+                )
+        if not missing:
+            return
+        self.execute(
+            [
+                *self.get_auth_args(),
+                "-c",
+                "fetch.negotiationAlgorithm=noop",
+                "fetch",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--recurse-submodules=no",
+                "--filter=blob:none",
+                "--stdin",
+                "origin",
+            ],
+            remote_op="pull",
+            environment=self.get_auth_environment(),
+            stdin="".join(f"{object_id}\n" for object_id in sorted(missing)),
+        )
+
+    def get_tree_ids(self, revision: str, paths: list[str]) -> list[str]:
+        """Return object IDs of directories in given revision."""
+        # Listing nested paths at once would list subdirectories instead
+        return [
+            object_id
+            for path in paths
+            for object_id in self.execute(
+                ["ls-tree", "-d", "--format=%(objectname)", revision, "--", path],
+                remote_op="none",
+                needs_lock=False,
+                merge_err=False,
+            ).split()
+        ]
 
     def get_config(self, path):
         """Read entry from configuration."""
@@ -1295,6 +1479,28 @@ class GitRepository(Repository):
         if self.has_branch(name):
             self.execute(["branch", "-D", name], remote_op="none")
 
+    def get_object_reader(
+        self, reader_class: type[GitObjectReader] | None = None
+    ) -> GitObjectReader:
+        if reader_class is None:
+            reader_class = import_string(settings.VCS_GIT_OBJECT_READER)
+        return reader_class(
+            self.path,
+            command=self._cmd,
+            environment={} if self.local else self._getenv(cwd=self.path),
+        )
+
+    @cached_property
+    def object_reader(self) -> GitObjectReader:
+        """Reader used for object and reference queries."""
+        return self.get_object_reader()
+
+    def get_last_revision(self):
+        self.ensure_lock_session_recovered()
+        if revision := self.object_reader.get_last_revision():
+            return revision
+        return super().get_last_revision()
+
     def needs_commit(self, filenames: list[str] | None = None) -> bool:
         """Check whether repository needs commit."""
         cmd = ["--no-optional-locks", "status", "--porcelain"]
@@ -1495,6 +1701,7 @@ class GitRepository(Repository):
         branch = self.validate_branch_name(branch)
         # Add branch
         if not self.has_branch(branch):
+            self.prefetch_sparse_checkout(f"origin/{branch}")
             self.execute(
                 ["checkout", "-b", branch, f"origin/{branch}"],
                 remote_op="none",
@@ -1507,6 +1714,17 @@ class GitRepository(Repository):
         self.checkout_with_temp_cleanup(branch)
         self.branch = branch
 
+        # Follow changes in the file masks
+        directories = self.get_sparse_checkout_dirs()
+        if directories is None:
+            if self.is_sparse_checkout():
+                self.disable_sparse_checkout()
+        elif (
+            not self.is_sparse_checkout()
+            or directories != self.get_sparse_checkout_list()
+        ):
+            self.configure_sparse_checkout(directories)
+
     def describe(self) -> str:
         """Verbosely describes current revision."""
         return self.execute(
@@ -1575,6 +1793,10 @@ class GitRepository(Repository):
 
     def get_file(self, path, revision) -> str:
         """Return content of file at given revision."""
+        self.ensure_lock_session_recovered()
+        content = self.object_reader.get_file(path, revision)
+        if content is not None:
+            return content
         return self.execute(
             ["show", f"{revision}:{path}"],
             remote_op="none",
@@ -1637,6 +1859,22 @@ class GitRepository(Repository):
     def get_local_branch_name(self) -> str:
         return self.branch
 
+    def probe_remote_revision(self) -> str | None:
+        """Return revision of the remote branch using ls-remote."""
+        ref = f"refs/heads/{self.validate_branch_name(self.branch)}"
+        output = self.execute(
+            [*self.get_auth_args(), "ls-remote", "origin", ref],
+            remote_op="pull",
+            needs_lock=False,
+            environment=self.get_auth_environment(),
+            merge_err=False,
+        )
+        for line in output.splitlines():
+            revision, _tab, name = line.partition("\t")
+            if name == ref:
+                return revision
+        return None
+
     def update_remote(self) -> None:
         """Update remote repository."""
         branch = self.validate_branch_name(self.branch)
@@ -1648,6 +1886,29 @@ class GitRepository(Repository):
             environment=self.get_auth_environment(),
         )
         self.clean_revision_cache()
+        if self.is_sparse_checkout():
+            self.fetch_sparse_revision_blobs()
+
+    def fetch_sparse_revision_blobs(self) -> None:
+        """Download file contents needed to merge or rebase upstream changes."""
+        self.fetch_sparse_blobs(
+            self.get_sparse_checkout_list(), *self.get_upstream_revisions()
+        )
+
+    def get_upstream_revisions(self) -> list[str]:
+        """List the upstream revision and its merge base with the local one."""
+        remote = self.get_remote_branch_name()
+        revisions = [remote]
+        with suppress(RepositoryCommandError):
+            revisions.append(
+                self.execute(
+                    ["merge-base", "HEAD", remote],
+                    remote_op="none",
+                    needs_lock=False,
+                    merge_err=False,
+                ).strip()
+            )
+        return revisions
 
     def get_push_command(self, *, force: bool | None = None) -> list[str]:
         """
@@ -1688,6 +1949,19 @@ class GitRepository(Repository):
             environment=self.get_auth_environment(),
         )
 
+    def list_changed_files(self, refspec: str) -> list:
+        if not self.is_sparse_checkout():
+            return super().list_changed_files(refspec)
+        # Rename detection would need contents outside of the checkout, the
+        # renamed file is listed as removed and added instead
+        lines = self.execute(
+            [*self._cmd_list_changed_files, "--no-renames", refspec],
+            remote_op="none",
+            needs_lock=False,
+            merge_err=False,
+        ).splitlines()
+        return list(self.parse_changed_files(lines))
+
     def parse_changed_files(self, lines: list[str]) -> Iterator[str]:
         """Parse output with changed files."""
         # Strip action prefix we do not use
@@ -1935,6 +2209,9 @@ class SubversionRepository(GitRepository):
         args, self._fetch_revision = self.get_remote_args(pull_url, self.path)
         self.execute(["svn", "init", *args], remote_op="none")
 
+    def probe_remote_revision(self) -> str | None:
+        return None
+
     def update_remote(self) -> None:
         """Update remote repository."""
         if self._fetch_revision:
@@ -3570,6 +3847,9 @@ class LocalRepository(GitRepository):
     def update_remote(self) -> None:
         return
 
+    def probe_remote_revision(self) -> str | None:
+        return None
+
     def push(self, branch, *, force: bool | None = None) -> None:
         return
 
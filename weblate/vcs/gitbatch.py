@@ -0,0 +1,279 @@
+# Copyright © Michal Čihař <michal@weblate.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Readers for Git objects and references."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess  # ruff: ignore[suspicious-subprocess-import]
+import threading
+import time
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, ClassVar, cast
+
+from weblate.vcs.base import RepositoryCommandError, RepositoryError
+
+OBJECT_ID_RE = re.compile(r"(?:[0-9a-f]{40}|[0-9a-f]{64})\Z")
+REF_NAME_RE = re.compile(r"(?:HEAD|refs/[^\0\n]+)\Z")
+MAX_SYMREF_DEPTH = 5
+# Limit of git cat-file processes kept running by a single worker process
+MAX_CAT_FILE_PROCESSES = 32
+
+
+@lru_cache
+def supports_batch_command(command: str) -> bool:
+    """Check whether git cat-file supports --batch-command (Git 2.36+)."""
+    try:
+        result = subprocess.run(
+            [command, "cat-file", "-h"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return False
+    return "--batch-command" in result.stdout
+
+
+class GitRefReader:
+    """
+    Resolve references by reading the files backend directly.
+
+    Returns None whenever the layout is not understood (reftable, worktrees,
+    broken references), callers are expected to fall back to git then.
+    """
+
+    def __init__(self, git_dir: Path) -> None:
+        self.git_dir = git_dir
+
+    def is_supported(self) -> bool:
+        return self.git_dir.is_dir() and not (self.git_dir / "reftable").exists()
+
+    def get_packed_refs(self) -> dict[str, str]:
+        result: dict[str, str] = {}
+        try:
+            content = (self.git_dir / "packed-refs").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return result
+        for line in content.splitlines():
+            if not line or line[0] in {"#", "^"}:
+                continue
+            object_id, _space, name = line.partition(" ")
+            result[name] = object_id
+        return result
+
+    def resolve(self, name: str = "HEAD", depth: int = 0) -> str | None:
+        if depth > MAX_SYMREF_DEPTH or not REF_NAME_RE.match(name):
+            return None
+        if ".." in name.split("/") or not self.is_supported():
+            return None
+        try:
+            content = (self.git_dir / name).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            content = self.get_packed_refs().get(name)
+        except OSError:
+            return None
+        if content is None:
+            return None
+        if content.startswith("ref: "):
+            return self.resolve(content[5:], depth + 1)
+        if OBJECT_ID_RE.match(content):
+            return content
+        return None
+
+
+class GitCatFile:
+    """
+    Long-lived ``git cat-file --batch-command`` process.
+
+    The process is started lazily and restarted after failures. Queries are
+    serialized as the process speaks a simple line-based protocol. The least
+    recently used processes are terminated when a worker would run more than
+    MAX_CAT_FILE_PROCESSES of them.
+    """
+
+    running: ClassVar[weakref.WeakSet[GitCatFile]] = weakref.WeakSet()
+    running_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, args: list[str], cwd: str, env: dict[str, str]) -> None:
+        self.args = args
+        self.cwd = cwd
+        self.env = env
+        self.process: subprocess.Popen | None = None
+        self.finalizer: weakref.finalize | None = None
+        self.last_used = 0.0
+        self.lock = threading.Lock()
+
+    def start(self) -> subprocess.Popen:
+        self.last_used = time.monotonic()
+        if self.process is None or self.process.poll() is not None:
+            self.stop()
+            self.process = subprocess.Popen(
+                self.args,
+                cwd=self.cwd,
+                env=self.env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            # Do not leave the process behind once the owner is gone
+            self.finalizer = weakref.finalize(self, terminate_process, self.process)
+            with self.running_lock:
+                self.running.add(self)
+                readers = sorted(
+                    (reader for reader in self.running if reader is not self),
+                    key=lambda reader: reader.last_used,
+                )
+            for reader in readers[: len(readers) + 1 - MAX_CAT_FILE_PROCESSES]:
+                reader.close(blocking=False)
+        return self.process
+
+    def stop(self) -> None:
+        """Terminate the process, the caller has to hold the lock."""
+        if self.finalizer is not None:
+            self.finalizer()
+            self.finalizer = None
+        self.process = None
+        with self.running_lock:
+            self.running.discard(self)
+
+    def close(self, *, blocking: bool = True) -> None:
+        # Readers being used are skipped when making room for other processes
+        if not self.lock.acquire(blocking=blocking):
+            return
+        try:
+            self.stop()
+        finally:
+            self.lock.release()
+
+    def forget(self) -> None:
+        """Drop process inherited from the parent without terminating it."""
+        self.lock = threading.Lock()
+        if self.finalizer is not None:
+            self.finalizer.detach()
+            self.finalizer = None
+        if self.process is not None:
+            for stream in (self.process.stdin, self.process.stdout):
+                if stream is not None:
+                    stream.close()
+            self.process = None
+
+    def read_object(self, name: str) -> tuple[str, bytes] | None:
+        """Return object type and content, None if it does not exist."""
+        if "\n" in name or not name.strip():
+            return None
+        with self.lock:
+            process = self.start()
+            try:
+                return self.communicate(process, name)
+            except (OSError, ValueError) as error:
+                self.stop()
+                raise RepositoryCommandError(1, str(error)) from error
+
+    @staticmethod
+    def communicate(process: subprocess.Popen, name: str) -> tuple[str, bytes] | None:
+        stdin = cast("BinaryIO", process.stdin)
+        stdout = cast("BinaryIO", process.stdout)
+        stdin.write(f"contents {name}\n".encode())
+        stdin.flush()
+        header = stdout.readline().decode()
+        if not header.endswith("\n"):
+            msg = "git cat-file terminated unexpectedly"
+            raise OSError(msg)
+        if header.endswith((" missing\n", " ambiguous\n")):
+            return None
+        _object_id, object_type, size = header.split()
+        return object_type, stdout.read(int(size) + 1)[:-1]
+
+
+def forget_cat_file_processes() -> None:
+    """Detach processes of the parent in a forked worker."""
+    GitCatFile.running_lock = threading.Lock()
+    for reader in list(GitCatFile.running):
+        reader.forget()
+    GitCatFile.running.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=forget_cat_file_processes)
+
+
+def terminate_process(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    for stream in (process.stdin, process.stdout):
+        if stream is not None:
+            stream.close()
+
+
+class GitObjectReader:
+    """
+    Reads Git objects by running git for every query.
+
+    Methods return None for queries which are not handled by the reader, the
+    repository runs git for them.
+    """
+
+    def __init__(self, path: str, *, command: str, environment: dict[str, str]) -> None:
+        self.path = path
+        self.command = command
+        self.environment = environment
+
+    def close(self) -> None:
+        return
+
+    def get_last_revision(self) -> str | None:
+        return None
+
+    def get_file(self, path: str, revision: str) -> str | None:
+        return None
+
+
+class GitBatchObjectReader(GitObjectReader):
+    """
+    Reads Git objects without forking git for every query.
+
+    References are resolved in Python and objects are read through a
+    persistent ``git cat-file`` process. Anything not handled here falls back
+    to running git, so errors are reported the same way.
+    """
+
+    def __init__(self, path: str, *, command: str, environment: dict[str, str]) -> None:
+        super().__init__(path, command=command, environment=environment)
+        self.refs = GitRefReader(Path(path, ".git"))
+        self.cat_file: GitCatFile | None = None
+        if supports_batch_command(command):
+            self.cat_file = GitCatFile(
+                [command, "cat-file", "--batch-command"], cwd=path, env=environment
+            )
+
+    def close(self) -> None:
+        if self.cat_file is not None:
+            self.cat_file.close()
+
+    def get_last_revision(self) -> str | None:
+        return self.refs.resolve("HEAD")
+
+    def get_file(self, path: str, revision: str) -> str | None:
+        if self.cat_file is None:
+            return None
+        try:
+            result = self.cat_file.read_object(f"{revision}:{path}")
+        except RepositoryError:
+            return None
+        if result is None or result[0] != "blob":
+            return None
+        # Match text mode output of subprocess
+        return result[1].decode().replace("\r\n", "\n").replace("\r", "\n")
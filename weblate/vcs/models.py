@@ -30,6 +30,7 @@ from .defaults import (
     DEFAULT_VCS_API_TIMEOUT,
     DEFAULT_VCS_BACKENDS,
     DEFAULT_VCS_CLONE_DEPTH,
+    DEFAULT_VCS_GIT_OBJECT_READER,
     DEFAULT_VCS_PRIVATE_ALLOWLIST,
     DEFAULT_VCS_RESTRICT_PRIVATE,
 )
@@ -153,6 +154,7 @@ import_module("weblate.vcs.github")
 class VCSConf(AppConf):
     VCS_BACKENDS = DEFAULT_VCS_BACKENDS
     VCS_CLONE_DEPTH = DEFAULT_VCS_CLONE_DEPTH
+    VCS_GIT_OBJECT_READER = DEFAULT_VCS_GIT_OBJECT_READER
     VCS_API_DELAY = DEFAULT_VCS_API_DELAY
     VCS_API_TIMEOUT = DEFAULT_VCS_API_TIMEOUT
     VCS_ALLOW_SCHEMES: ClassVar[set[str]] = set(DEFAULT_VCS_ALLOW_SCHEMES)
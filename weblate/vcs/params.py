@@ -34,6 +34,7 @@ if TYPE_CHECKING:
 
 class VCSParams(TypedDict, total=False):
     git_force_push: bool
+    git_sparse_checkout: bool
     create_merge_request: bool
     merge_request_automerge: bool
     merge_request_merge_method: Literal["merge", "squash", "rebase"]
@@ -41,6 +42,7 @@ class VCSParams(TypedDict, total=False):
 
 VCSParamKey = Literal[
     "git_force_push",
+    "git_sparse_checkout",
     "create_merge_request",
     "merge_request_automerge",
     "merge_request_merge_method",
@@ -108,6 +110,26 @@ class GitForcePush(BaseVCSParam):
     )
 
 
+@register_vcs_param
+class GitSparseCheckout(BaseVCSParam):
+    name = "git_sparse_checkout"
+    label = gettext_lazy("Sparse checkout")
+    field_class = forms.BooleanField
+    default = False
+    help_text = gettext_lazy(
+        "Clone without file contents and check out only directories with "
+        "translation files. Use this for huge repositories where only a small part "
+        "is translated."
+    )
+
+    @classproperty
+    def vcs_backends(self) -> Sequence[str]:  # type: ignore[override]
+        # ruff: ignore[import-outside-top-level]
+        from weblate.vcs.models import VCS_REGISTRY
+
+        return sorted({"git", "gerrit", *VCS_REGISTRY.unfiltered_merge_request_based})
+
+
 class BaseMergeRequestParam(BaseVCSParam):
     @classproperty
     def vcs_backends(self) -> Sequence[str]:  # type: ignore[override]
@@ -71,8 +71,17 @@ from weblate.vcs.git import (
     LocalRepository,
     PagureRepository,
     SubversionRepository,
+    get_sparse_directory,
+)
+from weblate.vcs.gitbatch import (
+    GitBatchObjectReader,
+    GitObjectReader,
+    GitRefReader,
+    supports_batch_command,
+    terminate_process,
 )
 from weblate.vcs.mercurial import HgRepository
+from weblate.vcs.params import GitSparseCheckout
 from weblate.vcs.ssh import SSH_WRAPPER, add_host_key
 
 if TYPE_CHECKING:
@@ -1365,6 +1374,55 @@ class GitBranchValidationTest(SimpleTestCase):
         self.assertIn("/matrix-auto.svg", body)
 
 
+class GitRefReaderTest(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.git_dir = Path(tempdir.name)
+        (self.git_dir / "refs" / "heads").mkdir(parents=True)
+        self.reader = GitRefReader(self.git_dir)
+
+    def test_loose(self) -> None:
+        (self.git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.git_dir / "refs" / "heads" / "main").write_text(f"{'a' * 40}\n")
+        self.assertEqual(self.reader.resolve(), "a" * 40)
+
+    def test_packed(self) -> None:
+        (self.git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (self.git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{'b' * 40} refs/heads/main\n"
+            f"{'c' * 40} refs/tags/v1\n"
+            f"^{'d' * 40}\n"
+        )
+        self.assertEqual(self.reader.resolve(), "b" * 40)
+        self.assertEqual(self.reader.resolve("refs/tags/v1"), "c" * 40)
+
+    def test_unresolvable(self) -> None:
+        (self.git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        self.assertIsNone(self.reader.resolve())
+        self.assertIsNone(self.reader.resolve("refs/../../HEAD"))
+        self.assertIsNone(self.reader.resolve("config"))
+        (self.git_dir / "reftable").mkdir()
+        (self.git_dir / "refs" / "heads" / "main").write_text(f"{'a' * 40}\n")
+        self.assertIsNone(self.reader.resolve())
+
+
+class GitSparseDirectoryTest(SimpleTestCase):
+    def test_directory(self) -> None:
+        self.assertEqual(get_sparse_directory("po/*.po"), "po")
+        self.assertEqual(get_sparse_directory("src/locale/*/app.po"), "src/locale")
+        self.assertEqual(get_sparse_directory("src/*/locale/*.po"), "src")
+        self.assertEqual(get_sparse_directory("messages.pot"), "")
+        self.assertEqual(get_sparse_directory("*.po"), "")
+
+    def test_anywhere(self) -> None:
+        self.assertIsNone(get_sparse_directory("*/app.po"))
+        self.assertIsNone(get_sparse_directory("**/locale/*.po"))
+        self.assertIsNone(get_sparse_directory("../po/*.po"))
+
+
 class RepositoryHostKeyErrorTest(SimpleTestCase):
     def test_changed_host_key_is_not_tofu_retry(self) -> None:
         errormessage = (
@@ -2840,6 +2898,150 @@ class VCSGitTest(TestCase, RepoTestMixin, TempDirMixin):
     def test_get_file(self) -> None:
         self.assertIn("msgid", self.repo.get_file("po/cs.po", self.repo.last_revision))
 
+    def test_object_readers(self) -> None:
+        if not isinstance(self.repo, GitRepository):
+            self.skipTest("Not supported")
+        expected_revision = self.repo.execute(
+            ["rev-parse", "HEAD"], remote_op="none", needs_lock=False
+        ).strip()
+        expected_content = self.repo.execute(
+            ["show", f"{expected_revision}:po/cs.po"],
+            remote_op="none",
+            needs_lock=False,
+        )
+
+        plain = self.repo.get_object_reader(GitObjectReader)
+        self.assertIsNone(plain.get_last_revision())
+        self.assertIsNone(plain.get_file("po/cs.po", expected_revision))
+
+        batch = self.repo.get_object_reader(GitBatchObjectReader)
+        self.addCleanup(batch.close)
+        self.assertEqual(batch.get_last_revision(), expected_revision)
+        # Repeated reads go through the same process
+        for _iteration in range(3):
+            self.assertEqual(
+                batch.get_file("po/cs.po", expected_revision), expected_content
+            )
+        self.assertIsNone(batch.get_file("nonexisting", expected_revision))
+        self.assertIsNone(batch.get_file("po", expected_revision))
+        with self.assertRaises(RepositoryError):
+            self.repo.get_file("nonexisting", expected_revision)
+
+    def test_object_reader_process_limit(self) -> None:
+        if not isinstance(self.repo, GitRepository):
+            self.skipTest("Not supported")
+        revision = self.repo.last_revision
+        # ruff: ignore[private-member-access]
+        self.assertTrue(supports_batch_command(self.repo._cmd))
+        readers = [self.repo.get_object_reader(GitBatchObjectReader) for _i in range(2)]
+        for reader in readers:
+            self.addCleanup(reader.close)
+        with patch("weblate.vcs.gitbatch.MAX_CAT_FILE_PROCESSES", 1):
+            for reader in readers:
+                self.assertIn("msgid", reader.get_file("po/cs.po", revision))
+        # The least recently used process was terminated
+        self.assertIsNone(readers[0].cat_file.process)
+        self.assertIsNotNone(readers[1].cat_file.process)
+
+    def test_object_reader_forget(self) -> None:
+        if not isinstance(self.repo, GitRepository):
+            self.skipTest("Not supported")
+        revision = self.repo.last_revision
+        reader = self.repo.get_object_reader(GitBatchObjectReader)
+        self.addCleanup(reader.close)
+        self.assertIn("msgid", reader.get_file("po/cs.po", revision))
+        process = reader.cat_file.process
+        self.addCleanup(terminate_process, process)
+
+        # Forked worker does not touch the process of the parent
+        reader.cat_file.forget()
+        self.assertIsNone(reader.cat_file.process)
+        self.assertIsNone(process.poll())
+        self.assertIn("msgid", reader.get_file("po/cs.po", revision))
+        self.assertIsNot(reader.cat_file.process, process)
+
+    def test_sparse_checkout(self) -> None:
+        if self._class is not GitRepository:
+            self.skipTest("Sparse checkout is covered for plain Git only")
+        self.assertTrue(GitSparseCheckout.supports_vcs(self._vcs))
+        component = self.get_fake_component()
+        component.filemask = "po/*.po"
+        component.vcs_params = {"git_sparse_checkout": True}
+        with tempfile.TemporaryDirectory() as tempdir:
+            repo = self._class.clone(
+                self.get_remote_repo_url(),
+                tempdir,
+                self._remote_branch,
+                component=component,
+            )
+            self.assertTrue(repo.is_sparse_checkout())
+            self.assertEqual(repo.get_sparse_checkout_list(), ["po"])
+            self.assertTrue(os.path.exists(os.path.join(tempdir, "po", "cs.po")))
+            self.assertTrue(os.path.exists(os.path.join(tempdir, "README.md")))
+            self.assertFalse(os.path.exists(os.path.join(tempdir, "json")))
+
+            # The checkout follows file masks
+            component.template = "json/cs.json"
+            with repo.lock:
+                repo.update_remote()
+                repo.configure_branch(self._remote_branch)
+            self.assertEqual(repo.get_sparse_checkout_list(), ["json", "po"])
+            self.assertTrue(os.path.exists(os.path.join(tempdir, "json", "cs.json")))
+
+            # Turning the parameter off restores the full checkout
+            component.vcs_params = {}
+            with repo.lock:
+                repo.configure_branch(self._remote_branch)
+            self.assertFalse(repo.is_sparse_checkout())
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(tempdir, "android", "values", "strings.xml")
+                )
+            )
+            self.assertEqual(repo.get_config("remote.origin.promisor"), "true")
+            with self.assertRaises(RepositoryError):
+                repo.get_config("remote.origin.partialclonefilter")
+
+    def test_sparse_checkout_nested(self) -> None:
+        if self._class is not GitRepository:
+            self.skipTest("Sparse checkout is covered for plain Git only")
+        filenames = ["src/README.md", "src/locale/cs/app.po", "src/app/main.py"]
+        with tempfile.TemporaryDirectory() as tempdir:
+            repo = self.clone_repo(tempdir)
+            with repo.lock:
+                repo.set_committer("Second Bar", "second@example.net")
+                for filename in filenames:
+                    path = Path(tempdir, filename)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text("NESTED TEST FILE\n", encoding="utf-8")
+                repo.commit(
+                    "Test commit", "Foo Bar <foo@bar.com>", timezone.now(), filenames
+                )
+                repo.push("")
+        # Serve file contents on demand only, as remote hosting does
+        # ruff: ignore[private-member-access]
+        GitRepository._popen(
+            ["config", "uploadpack.allowFilter", "true"], cwd=self.git_repo_path
+        )
+
+        component = self.get_fake_component()
+        component.filemask = "src/locale/*/app.po"
+        component.vcs_params = {"git_sparse_checkout": True}
+        with tempfile.TemporaryDirectory() as tempdir:
+            repo = self._class.clone(
+                self.get_remote_repo_url(),
+                tempdir,
+                self._remote_branch,
+                component=component,
+            )
+            self.assertEqual(repo.get_sparse_checkout_list(), ["src/locale"])
+            # Files of parent directories are part of the cone as well
+            self.assertTrue(os.path.exists(os.path.join(tempdir, "src", "README.md")))
+            self.assertTrue(
+                os.path.exists(os.path.join(tempdir, "src", "locale", "cs", "app.po"))
+            )
+            self.assertFalse(os.path.exists(os.path.join(tempdir, "src", "app")))
+
     def test_remote_branches(self) -> None:
         self.assertEqual(self._remote_branches, self.repo.list_remote_branches())
 
@@ -5429,6 +5631,9 @@ class VCSLocalTest(VCSGitTest):
     def test_get_file(self) -> NoReturn:
         self.skipTest("Not supported")
 
+    def test_object_readers(self) -> NoReturn:
+        self.skipTest("Not supported")
+
     def test_remove(self) -> NoReturn:
         self.skipTest("Not supported")
 